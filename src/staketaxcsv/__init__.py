@@ -24,6 +24,9 @@ Example usage:
     >>> # write all CSVs (koinly, cointracking, etc.)
     >>> staketaxcsv.csv_all("ATOM", address)
     ...
+    >>> # write CSVs for many wallets in parallel
+    >>> staketaxcsv.csv_batch([("ATOM", address, "koinly"), ("OSMO", address2, "all")], workers=8)
+    ...
     >>> # check address is valid
     >>> staketaxcsv.has_csv("ATOM", address)
     True
@@ -33,4 +36,4 @@ Example usage:
 
 """
 
-from .api import historical_balances, csv, csv_all, has_csv, formats, tickers, transaction
+from .api import historical_balances, csv, csv_all, csv_batch, has_csv, formats, tickers, transaction
@@ -2,28 +2,32 @@ import datetime
 import logging
 import math
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
-from requests import Session
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import Retry
 
 from staketaxcsv.algo.config_algo import localconfig
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.debug_util import debug_cache
-from staketaxcsv.settings_csv import ALGO_INDEXER_NODE, REPORTS_DIR
+from staketaxcsv.common.rate_limiter import TokenBucket
+from staketaxcsv.common.tx_store import read_through, write_through
+from staketaxcsv.settings_csv import ALGO_FETCH_SHARDS, ALGO_INDEXER_NODE, REPORTS_DIR, TICKER_ALGO
 
 # https://developer.algorand.org/docs/get-details/indexer/#paginated-results
 INDEXER_LIMIT = 2000
+ASSET_REQUESTS_PER_SECOND = 10
 
 
 # API documentation: https://editor.swagger.io/?url=https://openapi.algonode.cloud/indexer2.oas3.json
 class Indexer:
     session = None
+    asset_rate_limiter = TokenBucket(ASSET_REQUESTS_PER_SECOND)
 
     def __init__(self):
         if not Indexer.session:
-            Indexer.session = Session()
+            Indexer.session = http_transport.get_session()
             retries = Retry(total=5, backoff_factor=2, status_forcelist=[429, 500, 502, 503, 504])
-            Indexer.session.mount("https://", HTTPAdapter(max_retries=retries))
+            http_transport.mount_retries(ALGO_INDEXER_NODE, retries)
 
     def account_exists(self, address):
         endpoint = f"v2/accounts/{address}/transactions"
@@ -55,9 +59,29 @@ class Indexer:
         else:
             return None
 
+    def get_round_range(self, address: str) -> Optional[Tuple[int, int]]:
+        """
+        This function retrieves the range of rounds that may contain transactions for a given address.
+
+        Args:
+          address (str): The Algorand address.
+
+        Returns:
+          A tuple of (round the account was created at, current round) if successful, `None` otherwise.
+        """
+        endpoint = f"v2/accounts/{address}"
+        params = {"exclude": "all"}
+
+        data, status_code = self._query(ALGO_INDEXER_NODE, endpoint, params)
+
+        if status_code == 200:
+            return data["account"].get("created-at-round", 0), data["current-round"]
+        else:
+            return None
+
     def get_transaction(self, txid: str) -> Optional[dict]:
         """
-        This function retrieves a transaction with a given ID.
+        This function retrieves a transaction with a given ID (from the tx store, if previously fetched).
 
         Args:
           txid (str): The ID of the transaction ID that is being requested.
@@ -66,6 +90,9 @@ class Indexer:
           A dictionary containing information about a transaction if successful, `None` otherwise.
           See transaction schema at https://app.swaggerhub.com/apis/algonode/indexer/2.0#/Transaction
         """
+        return read_through(TICKER_ALGO, txid, self._get_transaction)
+
+    def _get_transaction(self, txid: str) -> Optional[dict]:
         endpoint = f"v2/transactions/{txid}"
 
         data, status_code = self._query(ALGO_INDEXER_NODE, endpoint)
@@ -80,7 +107,8 @@ class Indexer:
                          after_date: Optional[datetime.date] = None,
                          before_date: Optional[datetime.date] = None,
                          min_round: Optional[int] = None,
-                         next: Optional[str] = None) -> Tuple[list, Optional[str]]:
+                         next: Optional[str] = None,
+                         max_round: Optional[int] = None) -> Tuple[list, Optional[str]]:
         """
         This function retrieves transactions for a given address with optional filters and pagination.
 
@@ -94,6 +122,8 @@ class Indexer:
         retrieve the next page of results in a multi-page request. It is returned in the response of the
         previous request and can be passed as a parameter to this function to retrieve the next page of
         transactions.
+          max_round (Optional[int]): The maximum round number for transactions to be included in the
+        results. Transactions with a round number higher than this value will be excluded.
 
         Returns:
           a tuple containing a list of transactions and an optional string representing the next token for
@@ -107,6 +137,8 @@ class Indexer:
             params["before-time"] = before_date.isoformat()
         if min_round:
             params["min-round"] = min_round
+        if max_round:
+            params["max-round"] = max_round
         if next:
             params["next"] = next
 
@@ -125,13 +157,13 @@ class Indexer:
         obtained by making multiple queries to the indexer API, with a maximum number of transactions per
         query determined by the `localconfig.limit` parameter.
 
+        If ALGO_FETCH_SHARDS > 1, the account's round range is split into that many shards, which are
+        paged concurrently.
+
         Returns:
-            list: List of transaction objects that match the specified criteria,
+            list: List of transaction objects that match the specified criteria (newest first),
                 see schema at https://app.swaggerhub.com/apis/algonode/indexer/2.0#/Transaction
         """
-        next = None
-        out = []
-
         max_txs = localconfig.limit
         max_queries = math.ceil(max_txs / INDEXER_LIMIT)
         logging.info("max_txs: %s, max_queries: %s", max_txs, max_queries)
@@ -143,9 +175,34 @@ class Indexer:
         if localconfig.end_date:
             before_date = datetime.date.fromisoformat(localconfig.end_date) + datetime.timedelta(days=1)
 
+        shards = self._get_round_shards(address, localconfig.min_round, ALGO_FETCH_SHARDS)
+        if len(shards) > 1:
+            logging.info("Fetching transactions for address=%s over %s round shards ...", address, len(shards))
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                results = executor.map(
+                    lambda shard: self._get_transactions_range(
+                        address, after_date, before_date, shard[0], shard[1], max_queries),
+                    shards)
+                out = []
+                for transactions in results:
+                    out.extend(transactions)
+            # Each shard may hold up to max_queries pages; keep the newest, as a sequential fetch would
+            out = out[:max_queries * INDEXER_LIMIT]
+        else:
+            out = self._get_transactions_range(
+                address, after_date, before_date, localconfig.min_round, None, max_queries)
+
+        write_through(TICKER_ALGO, out, tx_hash_key="id")
+        return out
+
+    def _get_transactions_range(self, address, after_date, before_date, min_round, max_round, max_queries):
+        """ Returns transactions (newest first) between min_round and max_round, following next-token """
+        next = None
+        out = []
+
         for _ in range(max_queries):
             transactions, next = self.get_transactions(
-                address, after_date, before_date, localconfig.min_round, next)
+                address, after_date, before_date, min_round, next, max_round)
             out.extend(transactions)
 
             if not next:
@@ -153,6 +210,30 @@ class Indexer:
 
         return out
 
+    def _get_round_shards(self, address, min_round, num_shards):
+        """ Returns list of (min_round, max_round), newest first, splitting the account's round range """
+        if num_shards <= 1:
+            return []
+
+        round_range = self.get_round_range(address)
+        if round_range is None:
+            return []
+
+        first_round = max(round_range[0], min_round or 0, 1)
+        last_round = round_range[1]
+        if last_round < first_round:
+            return []
+
+        shard_size = math.ceil((last_round - first_round + 1) / num_shards)
+        shards = []
+        for start in range(first_round, last_round + 1, shard_size):
+            shards.append((start, min(start + shard_size - 1, last_round)))
+        shards.reverse()
+
+        # Leave newest shard open-ended, to include rounds confirmed after the range was queried
+        shards[0] = (shards[0][0], None)
+        return shards
+
     def get_transactions_by_group(self, group_id: str) -> list[dict]:
         """
         This function retrieves a list of transactions associated with a specific group ID.
@@ -221,7 +302,7 @@ class Indexer:
 
         # Temporarily slow down asset requests until we either cache them
         # or https://github.com/algorand/go-algorand/issues/5250 is resolved.
-        time.sleep(0.1)
+        Indexer.asset_rate_limiter.acquire()
 
         data, status_code = self._query(ALGO_INDEXER_NODE, endpoint, params)
 
@@ -1,7 +1,15 @@
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+from staketaxcsv import settings_csv
+from staketaxcsv.algo import constants as co
 from staketaxcsv.algo.api.indexer import Indexer
 from staketaxcsv.algo.constants import ASSET_ID_ALGO
 from staketaxcsv.algo.util import b64_decode_ascii
+from staketaxcsv.common import json_cache
+
+ASSET_PREFETCH_WORKERS = 8
 
 TICKER_PATTERNS = ["X-NFT", ".+"]
 
@@ -95,6 +103,7 @@ class Asset:
             "decimals": 6,
         }
     }
+    catalog_loaded = False
     indexer = Indexer()
 
     def __init__(self, id, amount=0):
@@ -104,19 +113,12 @@ class Asset:
             raise ValueError("Asset amount cannot be negative")
 
         self._id = id
+        if id not in self.asset_list:
+            self.load_catalog()
         if id in self.asset_list:
             params = self.asset_list[id]
         else:
-            resp = self.indexer.get_asset(id)
-            if resp is None:
-                raise ValueError(f"Failed to retrieve asset {id}")
-
-            if resp["deleted"]:
-                resp = self.indexer.get_deleted_asset(id)
-                if resp is None:
-                    raise ValueError(f"Failed to retrieve deleted asset {id}")
-
-            params = _parse_asset(resp["params"])
+            params = self._fetch_asset_params(id)
             if params is not None:
                 self.asset_list[id] = params
         if params is None:
@@ -134,6 +136,60 @@ class Asset:
                 id = asset["asset-id"]
                 cls.asset_list[id] = {key: asset[key] for key in ["name", "unit-name", "decimals"]}
 
+    @classmethod
+    def _fetch_asset_params(cls, id):
+        resp = cls.indexer.get_asset(id)
+        if resp is None:
+            raise ValueError(f"Failed to retrieve asset {id}")
+
+        if resp["deleted"]:
+            resp = cls.indexer.get_deleted_asset(id)
+            if resp is None:
+                raise ValueError(f"Failed to retrieve deleted asset {id}")
+
+        return _parse_asset(resp["params"])
+
+    @classmethod
+    def prefetch(cls, transactions):
+        """ Retrieves (concurrently) metadata of all assets referenced in transactions not already in asset_list """
+        cls.load_catalog()
+
+        ids = set()
+        for transaction in transactions:
+            _add_asset_ids(transaction, ids)
+        missing = sorted(id for id in ids if id not in cls.asset_list)
+        if not missing:
+            return
+
+        logging.info("Prefetching %s of %s assets ...", len(missing), len(ids))
+        with ThreadPoolExecutor(max_workers=ASSET_PREFETCH_WORKERS) as executor:
+            for id, params in zip(missing, executor.map(_prefetch_asset_params, missing)):
+                if params is not None:
+                    cls.asset_list[id] = params
+
+        cls.save_catalog()
+
+    @classmethod
+    def load_catalog(cls):
+        """ Loads asset catalog file (STAKETAX_ALGO_ASSET_CATALOG_PATH) into asset_list, on first use """
+        path = settings_csv.ALGO_ASSET_CATALOG_PATH
+        if not path or cls.catalog_loaded:
+            return
+
+        for id, params in json_cache.read(path).items():
+            cls.asset_list.setdefault(int(id), params)
+        cls.catalog_loaded = True
+        logging.info("Loaded %s into Asset.asset_list ...", path)
+
+    @classmethod
+    def save_catalog(cls):
+        path = settings_csv.ALGO_ASSET_CATALOG_PATH
+        if not path or not cls.catalog_loaded:
+            return
+
+        json_cache.merge_write(path, {str(id): params for id, params in cls.asset_list.items()})
+        logging.info("Wrote Asset.asset_list to %s ...", path)
+
     @property
     def id(self):
         return self._id
@@ -283,3 +339,23 @@ class Asset:
 class Algo(Asset):
     def __init__(self, amount=0):
         super().__init__(0, amount)
+
+
+def _prefetch_asset_params(id):
+    try:
+        return Asset._fetch_asset_params(id)
+    except Exception as e:
+        logging.warning("Unable to prefetch asset %s: %s", id, e)
+        return None
+
+
+def _add_asset_ids(transaction, ids):
+    """ Adds ids of assets transferred (including inner transactions) or referenced by app calls to ids """
+    txtype = transaction.get("tx-type")
+    if txtype == co.TRANSACTION_TYPE_ASSET_TRANSFER:
+        ids.add(transaction[co.TRANSACTION_KEY_ASSET_TRANSFER]["asset-id"])
+    elif txtype == co.TRANSACTION_TYPE_APP_CALL:
+        ids.update(transaction[co.TRANSACTION_KEY_APP_CALL].get("foreign-assets", []))
+
+    for inner_transaction in transaction.get("inner-txns", []):
+        _add_asset_ids(inner_transaction, ids)
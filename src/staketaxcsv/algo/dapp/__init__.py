@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+import logging
 import os
 import traceback
 from importlib import util
 
+from staketaxcsv.algo import constants as co
 from staketaxcsv.algo.api.indexer import Indexer
 from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.common.TxInfo import TxInfo
@@ -11,6 +13,14 @@ from staketaxcsv.common.TxInfo import TxInfo
 class Dapp(ABC):
     plugins = []
 
+    # Dispatch index keys (see DappIndex).  When application_ids is set, the dapp is only consulted for groups
+    # with an app call to (or referencing as foreign app) one of application_ids, or with a transaction
+    # sent from/to one of addresses, or (if transfer_groups is set) groups without any app call.
+    # None: consulted for every group.
+    application_ids = None
+    addresses = ()
+    transfer_groups = False
+
     # For every class that inherits from the current,
     # the class name will be added to plugins
     def __init_subclass__(cls, **kwargs):
@@ -78,6 +88,106 @@ class Dapp(ABC):
         """
         pass
 
+    def get_dapp_handler(self, group: list):
+        """ Get the handler for the transaction group, so that dapps can match the group once
+        instead of in both :meth:`dapp.Dapp.is_dapp_transaction` and :meth:`dapp.Dapp.handle_dapp_transaction`.
+
+        Dapps that define `dapp_handlers`, a list of (predicate, handler) pairs, get the handler of the first
+        matching predicate.
+
+        Args:
+            group (list): List of transaction objects that share the same group id.
+
+        Returns:
+            function(group, txinfo) handling the group, or None when the group does not belong to this dapp.
+        """
+        dapp_handlers = getattr(self, "dapp_handlers", None)
+        if dapp_handlers is None:
+            return self.handle_dapp_transaction if self.is_dapp_transaction(group) else None
+
+        for is_match, handler in dapp_handlers:
+            if is_match(group):
+                return handler
+        return None
+
+    def ignore_dapp_transaction(self, group: list, txinfo: TxInfo):
+        """ Handler for dapp transaction groups that do not add any rows (i.e. opt-ins) """
+        pass
+
+
+class DappIndex:
+    """ Selects the dapps to consult for a transaction group, keyed by the application ids and addresses
+    each dapp declares.  Candidates keep the order of the dapps list.
+    """
+
+    def __init__(self, dapps: list) -> None:
+        self.dapps = dapps
+        self.always = set()
+        self.transfer_groups = set()
+        self.by_key = {}
+
+        for i, app in enumerate(dapps):
+            if app.application_ids is None:
+                self.always.add(i)
+                continue
+            if app.transfer_groups:
+                self.transfer_groups.add(i)
+            for app_id in app.application_ids:
+                self.by_key.setdefault(app_id, set()).add(i)
+            for address in app.addresses:
+                self.by_key.setdefault(address, set()).add(i)
+
+    def candidates(self, group: list) -> list:
+        indices = set(self.always)
+        has_app_call = False
+        for transaction in group:
+            for key in _index_keys(transaction):
+                indices.update(self.by_key.get(key, ()))
+            has_app_call = has_app_call or transaction["tx-type"] == co.TRANSACTION_TYPE_APP_CALL
+
+        if not has_app_call:
+            indices.update(self.transfer_groups)
+
+        return [self.dapps[i] for i in sorted(indices)]
+
+
+def _index_keys(transaction):
+    yield transaction.get("sender")
+
+    txtype = transaction["tx-type"]
+    if txtype == co.TRANSACTION_TYPE_APP_CALL:
+        details = transaction[co.TRANSACTION_KEY_APP_CALL]
+        yield details["application-id"]
+        yield from details.get("foreign-apps", [])
+    elif txtype == co.TRANSACTION_TYPE_PAYMENT:
+        yield transaction[co.TRANSACTION_KEY_PAYMENT].get("receiver")
+    elif txtype == co.TRANSACTION_TYPE_ASSET_TRANSFER:
+        yield transaction[co.TRANSACTION_KEY_ASSET_TRANSFER].get("receiver")
+
+
+class DappStats:
+    """ Time spent per dapp plugin (matching and handling groups) """
+
+    # dapp name -> [seconds, groups consulted, groups handled]
+    stats = {}
+
+    @classmethod
+    def reset(cls):
+        cls.stats = {}
+
+    @classmethod
+    def add(cls, name, seconds, handled):
+        stat = cls.stats.setdefault(name, [0.0, 0, 0])
+        stat[0] += seconds
+        stat[1] += 1
+        stat[2] += int(handled)
+
+    @classmethod
+    def log(cls):
+        for name, (seconds, consulted, handled) in sorted(cls.stats.items(), key=lambda kv: -kv[1][0]):
+            logging.info("dapp=%s seconds=%.3f groups_consulted=%s groups_handled=%s",
+                         name, seconds, consulted, handled)
+
 
 def load_module(path):
     name = os.path.split(path)[-1]
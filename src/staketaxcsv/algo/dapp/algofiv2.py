@@ -3,6 +3,7 @@ from decimal import Decimal
 
 from algosdk import encoding
 from functools import partial, reduce
+from staketaxcsv.algo import constants as co
 from staketaxcsv.algo.api.indexer import Indexer
 from staketaxcsv.algo.asset import Asset
 from staketaxcsv.algo.cost_basis import FIFO, DepositCostBasisTracker, Entry
@@ -168,6 +169,18 @@ ALGOFIV2_LENDING_CONTRACTS = [
 
 
 class AlgofiV2(Dapp):
+    application_ids = frozenset([
+        APPLICATION_ID_ALGOFIV2_LENDING_MANAGER,
+        APPLICATION_ID_ALGOFIV2_LENDING_POOL_MANAGER,
+        APPLICATION_ID_ALGOFIV2_GOVERNANCE_ADMIN,
+        APPLICATION_ID_ALGOFIV2_GOVERNANCE_VOTING_ESCROW,
+        APPLICATION_ID_ALGOFIV2_GOVERNANCE_REWARDS_MANAGER,
+        *ALGOFIV2_MARKET_CONTRACTS,
+        *ALGOFIV2_STAKING_CONTRACTS,
+        *ALGOFIV2_LENDING_CONTRACTS,
+    ])
+    addresses = frozenset(co.ADDRESS_GOVERNANCE_REWARDS_POOLS)
+
     def __init__(self, indexer: Indexer, user_address: str, account: dict, exporter: Exporter) -> None:
         super().__init__(indexer, user_address, account, exporter)
         self.indexer = indexer
@@ -175,6 +188,34 @@ class AlgofiV2(Dapp):
         self.exporter = exporter
         self.storage_address = self._get_algofiv2_storage_address(account)
         self.cost_basis_tracker = DepositCostBasisTracker()
+        self.dapp_handlers = [
+            (self._is_algofiv2_lend_swap, self._handle_algofiv2_lend_swap),
+            (self._is_algofiv2_pool_swap, self._handle_algofiv2_pool_swap),
+            (self._is_algofiv2_claim_staking_rewards, self._handle_algofiv2_claim_staking_rewards),
+            (self._is_algofiv2_claim_lending_rewards, self._handle_algofiv2_claim_lending_rewards),
+            (self._is_algofiv2_deposit_collateral, self._handle_algofiv2_deposit_collateral),
+            (self._is_algofiv2_withdraw_collateral, self._handle_algofiv2_withdraw_collateral),
+            (self._is_algofiv2_borrow, self._handle_algofiv2_borrow),
+            (self._is_algofiv2_repay_borrow, self._handle_algofiv2_repay_borrow),
+            (self._is_algofiv2_farm_stake, self._handle_algofiv2_farm_stake),
+            (self._is_algofiv2_farm_unstake, self._handle_algofiv2_farm_unstake),
+            (self._is_algofiv2_lend_stake, self._handle_algofiv2_lend_stake),
+            (self._is_algofiv2_lend_unstake, self._handle_algofiv2_lend_unstake),
+            (self._is_algofiv2_lend_lp_add, self._handle_algofiv2_lend_lp_add),
+            (self._is_algofiv2_pool_lp_add, self._handle_algofiv2_pool_lp_add),
+            (self._is_algofiv2_lend_lp_remove, self._handle_algofiv2_lend_lp_remove),
+            (self._is_algofiv2_pool_lp_remove, self._handle_algofiv2_pool_lp_remove),
+            (self._is_algofiv2_lend_zap, self._handle_algofiv2_lend_zap),
+            (self._is_algofiv2_pool_zap, self._handle_algofiv2_pool_zap),
+            (self._is_algofiv2_liquidate, self._handle_algofiv2_liquidate),
+            (self._is_algofiv2_governance_reward, self._handle_algofiv2_governance_reward),
+            (self._is_algofiv2_user_optin, self.ignore_dapp_transaction),
+            (self._is_algofiv2_market_optin, self.ignore_dapp_transaction),
+            (self._is_algofiv2_market_closeout, self.ignore_dapp_transaction),
+            (self._is_algofiv2_governance_increase_lock, self._handle_algofiv2_governance_increase_lock),
+            (self._is_algofiv2_governance_airdrop, self._handle_algofiv2_governance_airdrop),
+            (self._is_algofiv2_governance_optin, self.ignore_dapp_transaction),
+        ]
 
     @property
     def name(self):
@@ -191,114 +232,14 @@ class AlgofiV2(Dapp):
         return txs
 
     def is_dapp_transaction(self, group: list) -> bool:
-        return (self._is_algofiv2_lend_swap(group)
-                    or self._is_algofiv2_pool_swap(group)
-                    or self._is_algofiv2_claim_staking_rewards(group)
-                    or self._is_algofiv2_claim_lending_rewards(group)
-                    or self._is_algofiv2_deposit_collateral(group)
-                    or self._is_algofiv2_withdraw_collateral(group)
-                    or self._is_algofiv2_borrow(group)
-                    or self._is_algofiv2_repay_borrow(group)
-                    or self._is_algofiv2_farm_stake(group)
-                    or self._is_algofiv2_farm_unstake(group)
-                    or self._is_algofiv2_lend_stake(group)
-                    or self._is_algofiv2_lend_unstake(group)
-                    or self._is_algofiv2_lend_lp_add(group)
-                    or self._is_algofiv2_pool_lp_add(group)
-                    or self._is_algofiv2_lend_lp_remove(group)
-                    or self._is_algofiv2_pool_lp_remove(group)
-                    or self._is_algofiv2_lend_zap(group)
-                    or self._is_algofiv2_pool_zap(group)
-                    or self._is_algofiv2_liquidate(group)
-                    or is_governance_reward_transaction(self.storage_address, group)
-                    or self._is_algofiv2_user_optin(group)
-                    or self._is_algofiv2_market_optin(group)
-                    or self._is_algofiv2_market_closeout(group)
-                    or self._is_algofiv2_governance_airdrop(group)
-                    or self._is_algofiv2_governance_optin(group)
-                    or self._is_algofiv2_governance_increase_lock(group))
+        return self.get_dapp_handler(group) is not None
 
     def handle_dapp_transaction(self, group: list, txinfo: TxInfo):
-        if self._is_algofiv2_lend_swap(group):
-            self._handle_algofiv2_lend_swap(group, txinfo)
-
-        elif self._is_algofiv2_pool_swap(group):
-            self._handle_algofiv2_pool_swap(group, txinfo)
-
-        elif self._is_algofiv2_claim_staking_rewards(group):
-            self._handle_algofiv2_claim_staking_rewards(group, txinfo)
-
-        elif self._is_algofiv2_claim_lending_rewards(group):
-            self._handle_algofiv2_claim_lending_rewards(group, txinfo)
-
-        elif self._is_algofiv2_deposit_collateral(group):
-            self._handle_algofiv2_deposit_collateral(group, txinfo)
-
-        elif self._is_algofiv2_withdraw_collateral(group):
-            self._handle_algofiv2_withdraw_collateral(group, txinfo)
-
-        elif self._is_algofiv2_borrow(group):
-            self._handle_algofiv2_borrow(group, txinfo)
-
-        elif self._is_algofiv2_repay_borrow(group):
-            self._handle_algofiv2_repay_borrow(group, txinfo)
-
-        elif self._is_algofiv2_farm_stake(group):
-            self._handle_algofiv2_farm_stake(group, txinfo)
-
-        elif self._is_algofiv2_farm_unstake(group):
-            self._handle_algofiv2_farm_unstake(group, txinfo)
-
-        elif self._is_algofiv2_lend_stake(group):
-            self._handle_algofiv2_lend_stake(group, txinfo)
-
-        elif self._is_algofiv2_lend_unstake(group):
-            self._handle_algofiv2_lend_unstake(group, txinfo)
-
-        elif self._is_algofiv2_lend_lp_add(group):
-            self._handle_algofiv2_lend_lp_add(group, txinfo)
-
-        elif self._is_algofiv2_pool_lp_add(group):
-            self._handle_algofiv2_pool_lp_add(group, txinfo)
-
-        elif self._is_algofiv2_lend_lp_remove(group):
-            self._handle_algofiv2_lend_lp_remove(group, txinfo)
-
-        elif self._is_algofiv2_pool_lp_remove(group):
-            self._handle_algofiv2_pool_lp_remove(group, txinfo)
-
-        elif self._is_algofiv2_lend_zap(group):
-            self._handle_algofiv2_lend_zap(group, txinfo)
-
-        elif self._is_algofiv2_pool_zap(group):
-            self._handle_algofiv2_pool_zap(group, txinfo)
-
-        elif self._is_algofiv2_liquidate(group):
-            self._handle_algofiv2_liquidate(group, txinfo)
-
-        elif is_governance_reward_transaction(self.storage_address, group):
-            handle_governance_reward_transaction(group, self.exporter, txinfo)
-
-        elif self._is_algofiv2_user_optin(group):
-            pass
-
-        elif self._is_algofiv2_market_optin(group):
-            pass
-
-        elif self._is_algofiv2_market_closeout(group):
-            pass
-
-        elif self._is_algofiv2_governance_increase_lock(group):
-            self._handle_algofiv2_governance_increase_lock(group, txinfo)
-
-        elif self._is_algofiv2_governance_airdrop(group):
-            self._handle_algofiv2_governance_airdrop(group, txinfo)
-
-        elif self._is_algofiv2_governance_optin(group):
-            pass
-
-        else:
+        handler = self.get_dapp_handler(group)
+        if handler is None:
             export_unknown(self.exporter, txinfo)
+        else:
+            handler(group, txinfo)
 
     def _get_algofiv2_storage_address(self, account):
         if account is None:
@@ -743,6 +684,9 @@ class AlgofiV2(Dapp):
 
         return self._is_algofiv2_pool_swap(group[:i + 4]) and self._is_algofiv2_pool_lp_add(group[i + 4:])
 
+    def _is_algofiv2_governance_reward(self, group):
+        return is_governance_reward_transaction(self.storage_address, group)
+
     def _is_algofiv2_liquidate(self, group):
         # Only transactions where the user is the liquidatee, not the liquidator
         if len(group) != 1:
@@ -1091,6 +1035,9 @@ class AlgofiV2(Dapp):
         self._handle_algofiv2_pool_swap(group[:i + 4], txinfo, 0)
         self._handle_algofiv2_pool_lp_add(group[i + 4:], txinfo, 1)
 
+    def _handle_algofiv2_governance_reward(self, group, txinfo):
+        handle_governance_reward_transaction(group, self.exporter, txinfo)
+
     def _handle_algofiv2_liquidate(self, group, txinfo):
         send_assets = list(generate_inner_transfer_assets(group[0],
                                                           filter=partial(is_transaction_sender, self.storage_address)))
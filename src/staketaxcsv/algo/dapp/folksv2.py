@@ -111,12 +111,49 @@ DEFLEX_TRANSACTION_SWAP_FINALIZE = "tTD7Hw=="  # "User_swap_finalize" ABI select
 
 
 class FolksV2(Dapp):
+    application_ids = frozenset([
+        APPLICATION_ID_FOLKSV2_DEPOSIT,
+        APPLICATION_ID_FOLKSV2_DEPOSIT_STAKING,
+        APPLICATION_ID_FOLKSV2_ORACLE_ADAPTER,
+        APPLICATION_ID_FOLKSV2_OP_UP,
+        *APPLICATION_ID_FOLKSV2_LOANS,
+        *APPLICATION_ID_FOLKSV2_POOLS,
+        *APPLICATION_ID_FOLKS_GOVERNANCE_DISTRIBUTOR,
+    ])
+    transfer_groups = True  # create loan
+
     def __init__(self, indexer: Indexer, user_address: str, account: dict, exporter: Exporter) -> None:
         super().__init__(indexer, user_address, account, exporter)
         self.indexer = indexer
         self.user_address = user_address
         self.exporter = exporter
         self.cost_basis_tracker = DepositCostBasisTracker()
+        self.dapp_handlers = [
+            (self._is_folksv2_deposit, self._handle_folksv2_deposit),
+            (self._is_folksv2_withdraw, self._handle_folksv2_withdraw),
+            (self._is_folksv2_stake_deposit, self._handle_folksv2_stake_deposit),
+            (self._is_folksv2_stake_withdraw, self._handle_folksv2_withdraw),
+            (self._is_folksv2_stake_claim_rewards, self._handle_folksv2_stake_claim_rewards),
+            (self._is_folksv2_create_loan, self.ignore_dapp_transaction),
+            (self._is_folksv2_move_to_collateral, self.ignore_dapp_transaction),
+            (self._is_folksv2_escrow_withdraw, self.ignore_dapp_transaction),
+            (self._is_folksv2_borrow, self._handle_folksv2_borrow),
+            (self._is_folksv2_repay_with_txn, self._handle_folksv2_repay_with_txn),
+            (self._is_folksv2_swap_repay, self._handle_folksv2_swap_repay),
+            (self._is_folksv2_swap_collateral, self._handle_folksv2_swap_collateral),
+            (self._is_folksv2_increase_collateral, self._handle_folksv2_increase_collateral),
+            (self._is_folksv2_reduce_collateral, self._handle_folksv2_reduce_collateral),
+            (self._is_folksv2_remove_loan, self.ignore_dapp_transaction),
+            (self._is_folksv2_governance_commit, self._handle_folksv2_governance_commit),
+            (self._is_folksv2_governance_burn, self._handle_folksv2_governance_burn),
+            (self._is_folksv2_governance_galgo_mint, self._handle_folksv2_governance_galgo_mint),
+            (self._is_folksv2_governance_unmint_premint, self._handle_folksv2_governance_unmint_premint),
+            (self._is_folksv2_governance_claim_premint, self._handle_folksv2_governance_claim_premint),
+            (self._is_folksv2_governance_unmint, self._handle_folksv2_governance_unmint),
+            (self._is_folksv2_governance_rewards_claim, self._handle_folksv2_governance_rewards_claim),
+            (self._is_folksv2_governance_leveraged_commit, self._handle_folksv2_governance_leveraged_commit),
+            (self._is_folksv2_governance_leveraged_unroll, self._handle_folksv2_governance_leveraged_unroll),
+        ]
 
     @property
     def name(self):
@@ -126,106 +163,14 @@ class FolksV2(Dapp):
         return []
 
     def is_dapp_transaction(self, group: list) -> bool:
-        return (self._is_folksv2_deposit(group)
-                    or self._is_folksv2_withdraw(group)
-                    or self._is_folksv2_stake_deposit(group)
-                    or self._is_folksv2_stake_withdraw(group)
-                    or self._is_folksv2_stake_claim_rewards(group)
-                    or self._is_folksv2_create_loan(group)
-                    or self._is_folksv2_move_to_collateral(group)
-                    or self._is_folksv2_escrow_withdraw(group)
-                    or self._is_folksv2_borrow(group)
-                    or self._is_folksv2_repay_with_txn(group)
-                    or self._is_folksv2_swap_repay(group)
-                    or self._is_folksv2_swap_collateral(group)
-                    or self._is_folksv2_increase_collateral(group)
-                    or self._is_folksv2_reduce_collateral(group)
-                    or self._is_folksv2_remove_loan(group)
-                    or self._is_folksv2_governance_commit(group)
-                    or self._is_folksv2_governance_burn(group)
-                    or self._is_folksv2_governance_galgo_mint(group)
-                    or self._is_folksv2_governance_unmint_premint(group)
-                    or self._is_folksv2_governance_claim_premint(group)
-                    or self._is_folksv2_governance_unmint(group)
-                    or self._is_folksv2_governance_rewards_claim(group)
-                    or self._is_folksv2_governance_leveraged_commit(group)
-                    or self._is_folksv2_governance_leveraged_unroll(group))
+        return self.get_dapp_handler(group) is not None
 
     def handle_dapp_transaction(self, group: list, txinfo: TxInfo):
-        if self._is_folksv2_deposit(group):
-            self._handle_folksv2_deposit(group, txinfo)
-
-        elif self._is_folksv2_withdraw(group):
-            self._handle_folksv2_withdraw(group, txinfo)
-
-        elif self._is_folksv2_stake_deposit(group):
-            self._handle_folksv2_stake_deposit(group, txinfo)
-
-        elif self._is_folksv2_stake_withdraw(group):
-            self._handle_folksv2_withdraw(group, txinfo)
-
-        elif self._is_folksv2_stake_claim_rewards(group):
-            self._handle_folksv2_stake_claim_rewards(group, txinfo)
-
-        elif self._is_folksv2_create_loan(group):
-            pass
-
-        elif self._is_folksv2_move_to_collateral(group):
-            pass
-
-        elif self._is_folksv2_escrow_withdraw(group):
-            pass
-
-        elif self._is_folksv2_borrow(group):
-            self._handle_folksv2_borrow(group, txinfo)
-
-        elif self._is_folksv2_repay_with_txn(group):
-            self._handle_folksv2_repay_with_txn(group, txinfo)
-
-        elif self._is_folksv2_swap_repay(group):
-            self._handle_folksv2_swap_repay(group, txinfo)
-
-        elif self._is_folksv2_swap_collateral(group):
-            self._handle_folksv2_swap_collateral(group, txinfo)
-
-        elif self._is_folksv2_increase_collateral(group):
-            self._handle_folksv2_deposit(group[:-2], txinfo)
-
-        elif self._is_folksv2_reduce_collateral(group):
-            self._handle_folksv2_reduce_collateral(group, txinfo)
-
-        elif self._is_folksv2_remove_loan(group):
-            pass
-
-        elif self._is_folksv2_governance_commit(group):
-            self._handle_folksv2_governance_commit(group, txinfo)
-
-        elif self._is_folksv2_governance_burn(group):
-            self._handle_folksv2_governance_burn(group, txinfo)
-
-        elif self._is_folksv2_governance_galgo_mint(group):
-            self._handle_folksv2_governance_galgo_mint(group, txinfo)
-
-        elif self._is_folksv2_governance_unmint_premint(group):
-            self._handle_folksv2_governance_unmint_premint(group, txinfo)
-
-        elif self._is_folksv2_governance_claim_premint(group):
-            self._handle_folksv2_governance_claim_premint(group, txinfo)
-
-        elif self._is_folksv2_governance_unmint(group):
-            self._handle_folksv2_governance_unmint(group, txinfo)
-
-        elif self._is_folksv2_governance_rewards_claim(group):
-            self._handle_folksv2_governance_rewards_claim(group, txinfo)
-
-        elif self._is_folksv2_governance_leveraged_commit(group):
-            self._handle_folksv2_governance_leveraged_commit(group, txinfo)
-
-        elif self._is_folksv2_governance_leveraged_unroll(group):
-            self._handle_folksv2_governance_leveraged_unroll(group, txinfo)
-
-        else:
+        handler = self.get_dapp_handler(group)
+        if handler is None:
             export_unknown(self.exporter, txinfo)
+        else:
+            handler(group, txinfo)
 
     def _is_folksv2_deposit(self, group):
         length = len(group)
@@ -628,6 +573,9 @@ class FolksV2(Dapp):
 
         export_repay_tx(self.exporter, txinfo, send_asset, fee_amount, self.name + " Repay", z_index)
 
+    def _handle_folksv2_increase_collateral(self, group, txinfo):
+        self._handle_folksv2_deposit(group[:-2], txinfo)
+
     def _handle_folksv2_reduce_collateral(self, group, txinfo, z_index=0):
         fee_amount = get_fee_amount(self.user_address, group)
 
@@ -1,10 +1,12 @@
 
 import logging
+import time
 from datetime import datetime
 
 from staketaxcsv.algo import constants as co
 from staketaxcsv.algo.asset import Algo
 from staketaxcsv.algo.config_algo import localconfig
+from staketaxcsv.algo.dapp import DappStats
 from staketaxcsv.algo.handle_amm import handle_swap, is_swap_group
 from staketaxcsv.algo.handle_transfer import handle_transfer_transactions
 from staketaxcsv.algo.transaction import is_app_call
@@ -12,15 +14,28 @@ from staketaxcsv.common.ErrorCounter import ErrorCounter
 from staketaxcsv.common.TxInfo import TxInfo
 
 
-def get_group_transactions(groupid, start, transactions):
-    group = []
-    for tx in transactions[start:]:
-        current_groupid = tx.get("group", None)
-        if current_groupid != groupid:
-            break
-        group.append(tx)
+def get_group_ends(transactions):
+    """
+    Returns list where entry i is the index after the last transaction of the group starting at transactions[i]
+    (i.e. end of consecutive run of transactions with same groupid, or i + 1 for transactions without group).
+    Built in one pass, so that grouping is linear in number of transactions.
+    """
+    length = len(transactions)
+    ends = [0] * length
+    end = length
+    next_groupid = None
+    for i in range(length - 1, -1, -1):
+        groupid = transactions[i].get("group", None)
+        if not groupid or groupid != next_groupid:
+            end = i + 1
+        ends[i] = end
+        next_groupid = groupid
+    return ends
+
+
+def get_group_transactions(transactions, start, end):
     # Make sure the transactions are in the right order
-    return sorted(group, key=lambda val: val["intra-round-offset"])
+    return sorted(transactions[start:end], key=lambda val: val["intra-round-offset"])
 
 
 def get_group_txinfo(wallet_address, transaction):
@@ -40,15 +55,20 @@ def has_app_transactions(group):
 
 def handle_transaction_group(wallet_address, dapps, group, exporter, txinfo):
     for app in dapps:
+        start = time.perf_counter()
+        handler = None
         try:
-            if app.is_dapp_transaction(group):
-                return app.handle_dapp_transaction(group, txinfo)
+            handler = app.get_dapp_handler(group)
+            if handler is not None:
+                return handler(group, txinfo)
         except Exception as e:
             logging.error("Exception handling txid=%s with plugin=%s, exception=%s",
                           txinfo.txid, app.name, str(e))
             ErrorCounter.increment("exception", txinfo.txid)
             if localconfig.debug:
                 raise (e)
+        finally:
+            DappStats.add(app.name, time.perf_counter() - start, handler is not None)
 
     if is_swap_group(wallet_address, group):
         handle_swap(wallet_address, group, exporter, txinfo)
@@ -1,14 +1,23 @@
 import logging
 
 from staketaxcsv.algo.config_algo import localconfig
+from staketaxcsv.algo.dapp import DappIndex, DappStats
 from staketaxcsv.algo.export_tx import export_unknown
-from staketaxcsv.algo.handle_group import get_group_transactions, get_group_txinfo, handle_transaction_group
+from staketaxcsv.algo.handle_group import (
+    get_group_ends,
+    get_group_transactions,
+    get_group_txinfo,
+    handle_transaction_group,
+)
 from staketaxcsv.algo.transaction import get_transaction_txinfo
 from staketaxcsv.common.ErrorCounter import ErrorCounter
 
 
 def process_txs(wallet_address, dapps, transactions, exporter, progress):
     length = len(transactions)
+    group_ends = get_group_ends(transactions)
+    dapp_index = DappIndex(dapps)
+    DappStats.reset()
     i = 0
     while i < length:
         transaction = transactions[i]
@@ -21,8 +30,8 @@ def process_txs(wallet_address, dapps, transactions, exporter, progress):
                 group = [transaction]
             else:
                 txinfo = get_group_txinfo(wallet_address, transaction)
-                group = get_group_transactions(groupid, i, transactions)
-            handle_transaction_group(wallet_address, dapps, group, exporter, txinfo)
+                group = get_group_transactions(transactions, i, group_ends[i])
+            handle_transaction_group(wallet_address, dapp_index.candidates(group), group, exporter, txinfo)
             i += len(group) - 1
         except Exception as e:
             logging.error("Exception processing txid=%s, exception=%s", txid, str(e))
@@ -35,3 +44,5 @@ def process_txs(wallet_address, dapps, transactions, exporter, progress):
         if i % 50 == 0:
             progress.report(i + 1, "Processed {} of {} transactions".format(i + 1, length))
         i += 1
+
+    DappStats.log()
@@ -1,7 +1,14 @@
+import copy
 import logging
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 from staketaxcsv import settings_csv as co
+from staketaxcsv.common.ErrorCounter import ErrorCounter
+from staketaxcsv.common.http_transport import HttpMetrics
 from staketaxcsv.common.ExporterTypes import FORMATS
+from staketaxcsv.osmo.denoms import TokenMetadata
 
 import staketaxcsv.report_algo
 import staketaxcsv.report_akt
@@ -125,6 +132,7 @@ def csv(ticker, wallet_address, csv_format, path=None, options=None, logs=True):
     # Print transactions table to console
     if logs:
         exporter.export_print()
+        HttpMetrics.log()
 
     # Write CSV
     exporter.export_format(csv_format, path)
@@ -154,11 +162,130 @@ def csv_all(ticker, wallet_address, dirpath=None, options=None, logs=True):
     # Print transactions table to console
     if logs:
         exporter.export_print()
+        HttpMetrics.log()
 
     # Write CSVs
-    for cur_format in FORMATS:
-        path = "{}/{}.{}.{}.csv".format(dirpath, ticker, wallet_address, cur_format)
-        exporter.export_format(cur_format, path)
+    exporter.export_formats(
+        FORMATS, lambda cur_format: "{}/{}.{}.{}.csv".format(dirpath, ticker, wallet_address, cur_format))
+
+
+def csv_batch(jobs, workers=4, dirpath=None, logs=False):
+    """ Writes CSV files for many wallets, running jobs in parallel in a pool of worker processes.
+
+    :param jobs: list of (ticker, wallet_address, csv_format) or (ticker, wallet_address, csv_format, options)
+                 tuples.  Use csv_format "all" to write all CSV formats (same as csv_all()).
+                 options must be picklable (i.e. no "job" object).
+    :param workers: (optional) number of worker processes.  Defaults to 4.
+    :param dirpath: (optional) <string directory path> directory to write CSV files to.
+                     By default, writes to /tmp .
+    :param logs: (optional) show logging.  Defaults to False.
+    :return: dictionary summary:
+             {
+               "jobs": [<result dict per job, in same order as jobs>, ...],
+               "succeeded": <count>,
+               "failed": <count>,
+               "error_count": {<error_type>: <count of txs across jobs>, ...},
+             }
+             Each result dict has keys ticker, wallet_address, csv_format, paths, num_rows, seconds,
+             error_count (ErrorCounter errors for this job), http_metrics (HttpMetrics per-host request
+             count/latency/bytes for this job), and error (traceback string if job failed, else None).
+
+    Each worker process runs one job at a time.  Before each job, report localconfig classes, ErrorCounter and
+    HttpMetrics are reset to their initial state, so jobs do not share options or errors.  The shared HTTP
+    transport session is kept for the life of the worker, so jobs on the same worker reuse its HTTP connections.
+    A job that raises an exception is recorded as failed without affecting other jobs.
+    """
+    dirpath = dirpath if dirpath else "/tmp"
+    if logs:
+        logging.basicConfig(level=logging.INFO)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_batch_worker_init, initargs=(logs,)) as executor:
+        futures = [executor.submit(_batch_job, tuple(job), dirpath) for job in jobs]
+        results = [future.result() for future in futures]
+
+    error_count = {}
+    for result in results:
+        for error_type, count in result["error_count"].items():
+            error_count[error_type] = error_count.get(error_type, 0) + count
+
+    failed = len([result for result in results if result["error"]])
+    return {
+        "jobs": results,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "error_count": error_count,
+    }
+
+
+# localconfig class -> initial class attributes (set in each csv_batch() worker process)
+_LOCALCONFIG_INITIAL = {}
+
+
+def _batch_worker_init(logs):
+    if logs:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        logging.disable(logging.CRITICAL)
+
+    for module in REPORT_MODULES.values():
+        cls = getattr(module, "localconfig", None)
+        if cls is not None and cls not in _LOCALCONFIG_INITIAL:
+            _LOCALCONFIG_INITIAL[cls] = copy.deepcopy(_class_attributes(cls))
+
+
+def _class_attributes(cls):
+    return {k: v for k, v in vars(cls).items() if not k.startswith("__")}
+
+
+def _reset_batch_state():
+    """ Restores localconfig classes and ErrorCounter to initial state, before next job in worker """
+    for cls, initial in _LOCALCONFIG_INITIAL.items():
+        for k in _class_attributes(cls):
+            if k not in initial:
+                delattr(cls, k)
+        for k, v in copy.deepcopy(initial).items():
+            setattr(cls, k, v)
+
+    ErrorCounter.errors = {}
+    HttpMetrics.reset()
+    TokenMetadata.reset()
+
+
+def _batch_job(job, dirpath):
+    ticker, wallet_address, csv_format = job[:3]
+    options = job[3] if len(job) > 3 and job[3] else {}
+    result = {
+        "ticker": ticker,
+        "wallet_address": wallet_address,
+        "csv_format": csv_format,
+        "paths": [],
+        "num_rows": 0,
+        "seconds": 0,
+        "error_count": {},
+        "http_metrics": {},
+        "error": None,
+    }
+
+    start_time = time.time()
+    try:
+        _reset_batch_state()
+
+        module = REPORT_MODULES[ticker]
+        module.read_options(dict(options))
+        exporter = module.txhistory(wallet_address)
+        exporter.sort_rows()
+        result["num_rows"] = len(exporter.rows)
+
+        cur_formats = FORMATS if csv_format == "all" else [csv_format]
+        result["paths"] = exporter.export_formats(
+            cur_formats, lambda cur_format: "{}/{}.{}.{}.csv".format(dirpath, ticker, wallet_address, cur_format))
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["seconds"] = round(time.time() - start_time, 3)
+    result["error_count"] = dict(ErrorCounter.errors)
+    result["http_metrics"] = HttpMetrics.summary()
+    return result
 
 
 def transaction(ticker, wallet_address, txid, csv_format="", path="", options=None):
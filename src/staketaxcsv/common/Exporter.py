@@ -1,12 +1,13 @@
 import csv
 import io
 import logging
+import math
+import re
 import time
 import json
 from datetime import datetime
 import copy
 
-import pandas as pd
 import pytz
 from pytz import timezone
 from staketaxcsv.common import ExporterTypes as et
@@ -18,6 +19,38 @@ from staketaxcsv.luna1.constants import EXCHANGE_TERRA_CLASSIC_BLOCKCHAIN
 
 class Row:
 
+    __slots__ = (
+        "timestamp", "tx_type", "received_amount", "received_currency", "sent_amount", "sent_currency", "fee",
+        "fee_currency", "exchange", "wallet_address", "txid", "url", "z_index", "comment",
+    )
+
+    LUNA1_REMAP = {
+        "AUD": "AUT",
+        "CAD": "CAT",
+        "CHF": "CHT",
+        "CNY": "CNT",
+        "DKK": "DKT",
+        "EUR": "EUT",
+        "GBP": "GBT",
+        "HKD": "HKT",
+        "IDR": "IDT",
+        "INR": "INT",
+        "JPY": "JPT",
+        "KRT": "KRT",
+        "LUNA": "LUNC",
+        "MNT": "MNT",
+        "MYR": "MYT",
+        "NOT": "NOT",
+        "PHP": "PHT",
+        "SDR": "SDT",
+        "SEK": "SET",
+        "THB": "THT",
+        "USDT": "UUSDT",
+        "UST": "USTC",
+        "WHALE": "UWHALE",
+    }
+    LUNA1_REMAP_CUTOFF = "2022-05-28 00:00:00"
+
     def __init__(self, timestamp, tx_type, received_amount, received_currency, sent_amount, sent_currency, fee,
                  fee_currency, exchange, wallet_address, txid, url="", z_index=0, comment=""):
         self.timestamp = timestamp
@@ -43,38 +76,10 @@ class Row:
         return currency
 
     def _format_currency_luna1(self, currency, timestamp):
-        remap = {
-            "AUD": "AUT",
-            "CAD": "CAT",
-            "CHF": "CHT",
-            "CNY": "CNT",
-            "DKK": "DKT",
-            "EUR": "EUT",
-            "GBP": "GBT",
-            "HKD": "HKT",
-            "IDR": "IDT",
-            "INR": "INT",
-            "JPY": "JPT",
-            "KRT": "KRT",
-            "LUNA": "LUNC",
-            "MNT": "MNT",
-            "MYR": "MYT",
-            "NOT": "NOT",
-            "PHP": "PHT",
-            "SDR": "SDT",
-            "SEK": "SET",
-            "THB": "THT",
-            "USDT": "UUSDT",
-            "UST": "USTC",
-            "WHALE": "UWHALE",
-        }
-
         # Use new currency names for Terra classic after new Terra blockchain launched 5/28/22.
-        timestamp_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-        cutoff_date = datetime(2022, 5, 28)
-
-        if timestamp_dt > cutoff_date and currency in remap:
-            return remap[currency]
+        # (timestamp format "%Y-%m-%d %H:%M:%S" compares same as datetime, without parsing)
+        if timestamp > self.LUNA1_REMAP_CUTOFF and currency in self.LUNA1_REMAP:
+            return self.LUNA1_REMAP[currency]
         else:
             return currency
 
@@ -82,10 +87,12 @@ class Row:
         """ Avoid scientific notation """
         if amount is None or amount == "":
             return ""
-        elif float(amount) == 0:
+
+        value = float(amount)
+        if value == 0:
             return 0
-        elif float(amount) < .001:
-            return "{:.9f}".format(float(amount))
+        elif value < .001:
+            return "{:.9f}".format(value)
         else:
             return amount
 
@@ -122,11 +129,19 @@ class Row:
 
 class Exporter:
 
+    # List of csv formats that support REALIZED_PNL
+    FORMATS_REALIZED_PNL = [et.FORMAT_KOINLY, et.FORMAT_COINTRACKING, et.FORMAT_COINTRACKER, et.FORMAT_KRYPTOS]
+
+    # CSV formats that support LP_DEPOSIT/LP_WITHDRAW
+    FORMATS_LP = [et.FORMAT_COINTRACKING, et.FORMAT_COINPANDA, et.FORMAT_COINTELLI,
+                  et.FORMAT_DIVLY, et.FORMAT_CRYPTOBOOKS, et.FORMAT_KOINLY, et.FORMAT_KRYPTOS]
+
     def __init__(self, wallet_address, localconfig=None, ticker=""):
         self.wallet_address = wallet_address
         self.rows = []
         self.is_reverse = None  # last sorted direction
         self.ticker = ticker
+        self.rows_export_cache = None  # during export_formats(): row view key -> list of rows
 
         if localconfig and hasattr(localconfig, "koinlynullmap"):
             json_path = localconfig.koinlynullmap
@@ -173,6 +188,16 @@ class Exporter:
             self.is_reverse = reverse
 
     def _rows_export(self, csv_format, reverse=True, export_all=False):
+        if self.rows_export_cache is None:
+            return self._rows_export_view(csv_format, reverse, export_all)
+
+        # Formats with same capabilities share same row view
+        key = (reverse, export_all, csv_format in self.FORMATS_REALIZED_PNL, csv_format in self.FORMATS_LP)
+        if key not in self.rows_export_cache:
+            self.rows_export_cache[key] = list(self._rows_export_view(csv_format, reverse, export_all))
+        return self.rows_export_cache[key]
+
+    def _rows_export_view(self, csv_format, reverse, export_all):
         self.sort_rows(reverse)
 
         if export_all:
@@ -181,16 +206,13 @@ class Exporter:
         else:
             allowed_types = list(et.TX_TYPES_CSVEXPORT)
 
-            # List of csv formats that support REALIZED_PNL
-            if csv_format in [et.FORMAT_KOINLY, et.FORMAT_COINTRACKING, et.FORMAT_COINTRACKER, et.FORMAT_KRYPTOS]:
+            if csv_format in self.FORMATS_REALIZED_PNL:
                 allowed_types.append(et.TX_TYPE_REALIZED_PNL)
 
             # Filter rows based on the allowed tx types.
             rows = filter(lambda row: row.tx_type in allowed_types, self.rows)
 
-        if csv_format in [et.FORMAT_COINTRACKING, et.FORMAT_COINPANDA, et.FORMAT_COINTELLI,
-                          et.FORMAT_DIVLY, et.FORMAT_CRYPTOBOOKS, et.FORMAT_KOINLY, et.FORMAT_KRYPTOS]:
-            # CSV formats that support LP_DEPOSIT/LP_WITHDRAW
+        if csv_format in self.FORMATS_LP:
             return rows
         else:
             # CSV formats that do not support LP_DEPOSIT/LP_WITHDRAW:
@@ -289,15 +311,28 @@ class Exporter:
         table.extend([row.as_array_short() for row in self.rows])
         return tabulate(table)
 
+    def export_formats(self, csvformats, csvpath_func):
+        """ Writes file for each format, computing filtered/converted rows once per distinct row view.
+
+        csvpath_func: function(csvformat) -> csvpath
+        Returns list of paths written.
+        """
+        self.rows_export_cache = {}
+        try:
+            return [self.export_format(csvformat, csvpath_func(csvformat)) for csvformat in csvformats]
+        finally:
+            self.rows_export_cache = None
+
     def export_format(self, csvformat, csvpath):
         if csvformat == et.FORMAT_DEFAULT:
             self.export_default_csv(csvpath)
         elif csvformat == et.FORMAT_BALANCES_CALCULATED:
             self.export_balances_csv(csvpath)
+        elif csvformat == et.FORMAT_BALANCES_CALCULATED_LONG:
+            self.export_balances_long_csv(csvpath)
         elif csvformat == et.FORMAT_ACCOINTING:
-            self.export_accointing_csv(csvpath)
             xlsxpath = csvpath.replace(".csv", ".xlsx")
-            self.convert_csv_to_xlsx(csvpath, xlsxpath)
+            self.export_accointing_csv(csvpath, xlsxpath)
             return xlsxpath
         elif csvformat == et.FORMAT_AWAKENTAX:
             self.export_awakentax_csv(csvpath)
@@ -306,9 +341,8 @@ class Exporter:
         elif csvformat == et.FORMAT_BITTYTAX:
             self.export_bittytax_csv(csvpath)
         elif csvformat == et.FORMAT_BLOCKPIT:
-            self.export_blockpit_csv(csvpath)
             xlsxpath = csvpath.replace(".csv", ".xlsx")
-            self.convert_csv_to_xlsx(csvpath, xlsxpath)
+            self.export_blockpit_csv(csvpath, xlsxpath)
             return xlsxpath
         elif csvformat == et.FORMAT_COINLEDGER:
             self.export_coinledger_csv(csvpath)
@@ -343,15 +377,54 @@ class Exporter:
         elif csvformat == et.FORMAT_ZENLEDGER:
             self.export_zenledger_csv(csvpath)
         elif csvformat == et.FORMAT_KRYPTOS:
-            self.export_kryptos_csv(csvpath)
             xlsxpath = csvpath.replace(".csv", ".xlsx")
-            self.convert_csv_to_xlsx(csvpath, xlsxpath)
+            self.export_kryptos_csv(csvpath, xlsxpath)
             return xlsxpath
         else:
             raise Exception("export_format(): Unknown csvformat={}".format(csvformat))
 
         return csvpath
 
+    def _write_table(self, csvpath, header, lines, xlsxpath=None):
+        """ Writes header and lines to CSV.  If xlsxpath specified, also streams them to xlsx workbook
+            (write-only mode, so rows are not kept in memory). """
+        if xlsxpath:
+            from openpyxl import Workbook  # only needed for xlsx formats
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("Sheet1")
+            sheet.append(header)
+
+        with open(csvpath, 'w', newline='', encoding='utf-8') as f:
+            mywriter = csv.writer(f)
+            mywriter.writerow(header)
+
+            for line in lines:
+                mywriter.writerow(line)
+                if xlsxpath:
+                    sheet.append([self._xlsx_value(value) for value in line])
+        logging.info("Wrote to %s", csvpath)
+
+        if xlsxpath:
+            workbook.save(xlsxpath)
+            logging.info("Wrote to %s", xlsxpath)
+
+    def _xlsx_value(self, value):
+        """ Returns cell value for CSV field: empty cell for "", number for numeric string """
+        if value is None or value == "":
+            return None
+        if isinstance(value, (int, float)):
+            return value
+
+        value = str(value)
+        if not re.fullmatch(r"-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?", value):
+            return value
+        if re.fullmatch(r"-?\d+", value):
+            # Keep integers not exactly representable in excel (i.e. long ids) as text
+            return int(value) if abs(int(value)) < 2 ** 53 else value
+
+        number = float(value)
+        return number if math.isfinite(number) else value
+
     def export_default_csv(self, csvpath=None, truncate=0):
         self.sort_rows(reverse=True)
 
@@ -900,9 +973,8 @@ class Exporter:
                 # Notes field
                 notes = f"{row.comment}"
 
-                # Fix no-value fees
-                if not row.fee_currency:
-                    row.fee = ""
+                # Fix no-value fees (without modifying row, which is shared with other formats)
+                fee = row.fee if row.fee_currency else ""
 
                 line = [
                     transaction_type,
@@ -913,7 +985,7 @@ class Exporter:
                     to_currency,
                     to_amount,
                     row.fee_currency,
-                    row.fee,
+                    fee,
                     notes,
                     row.txid
                 ]
@@ -1168,74 +1240,63 @@ class Exporter:
 
         return dt.strftime("%d/%m/%Y %H:%M:%S")
 
-    def export_accointing_csv(self, csvpath):
-        """ Writes CSV, whose xlsx translation is suitable for import into Accointing """
-        rows = self._rows_export(et.FORMAT_ACCOINTING)
-        with open(csvpath, 'w', newline='', encoding='utf-8') as f:
-            mywriter = csv.writer(f)
+    def export_accointing_csv(self, csvpath, xlsxpath=None):
+        """ Writes CSV (and xlsx if xlsxpath specified), whose xlsx is suitable for import into Accointing """
+        self._write_table(csvpath, et.ACCOINT_FIELDS, self._accointing_lines(), xlsxpath)
 
-            # header row
-            mywriter.writerow(et.ACCOINT_FIELDS)
-
-            # data rows
-            for row in rows:
-                # Determine transaction_type, classification
-                if row.tx_type == et.TX_TYPE_STAKING:
-                    transaction_type = "deposit"
-                    classification = "staked"
-                elif row.tx_type == et.TX_TYPE_AIRDROP:
-                    transaction_type = "deposit"
-                    classification = "airdrop"
-                elif row.tx_type == et.TX_TYPE_TRADE:
-                    transaction_type = "order"
-                    classification = ""
-                elif row.tx_type == et.TX_TYPE_SPEND:
+    def _accointing_lines(self):
+        rows = self._rows_export(et.FORMAT_ACCOINTING)
+        for row in rows:
+            # Determine transaction_type, classification
+            if row.tx_type == et.TX_TYPE_STAKING:
+                transaction_type = "deposit"
+                classification = "staked"
+            elif row.tx_type == et.TX_TYPE_AIRDROP:
+                transaction_type = "deposit"
+                classification = "airdrop"
+            elif row.tx_type == et.TX_TYPE_TRADE:
+                transaction_type = "order"
+                classification = ""
+            elif row.tx_type == et.TX_TYPE_SPEND:
+                transaction_type = "withdraw"
+                classification = "payment"
+            elif row.tx_type == et.TX_TYPE_TRANSFER:
+                if row.sent_amount:
                     transaction_type = "withdraw"
-                    classification = "payment"
-                elif row.tx_type == et.TX_TYPE_TRANSFER:
-                    if row.sent_amount:
-                        transaction_type = "withdraw"
-                    elif row.received_amount:
-                        transaction_type = "deposit"
-                    else:
-                        transaction_type = ""
-                        logging.error("Bad condition for transfer")
-                    classification = ""
-                elif row.tx_type == et.TX_TYPE_INCOME:
-                    transaction_type = "deposit"
-                    classification = "income"
-                elif row.tx_type == et.TX_TYPE_BORROW:
+                elif row.received_amount:
                     transaction_type = "deposit"
-                    classification = ""
-                elif row.tx_type == et.TX_TYPE_REPAY:
-                    transaction_type = "withdraw"
-                    classification = ""
                 else:
                     transaction_type = ""
-                    classification = ""
-                    logging.critical("Transaction not handled correctly.  Fix this!")
-
-                line = [
-                    transaction_type,                            # transactionType
-                    self._accointing_timestamp(row.timestamp),   # date
-                    row.received_amount,                         # inBuyAmount
-                    row.received_currency,                       # inBuyAsset
-                    row.sent_amount,                             # outSellAmount
-                    row.sent_currency,                           # outSellAsset
-                    row.fee,                                     # feeAmount
-                    row.fee_currency,                            # feeAsset
-                    classification,                              # classification
-                    row.txid,                                    # operationId
-                    row.comment,                                 # comments
-                ]
-                mywriter.writerow(line)
-
-        logging.info("Wrote to %s", csvpath)
-
-    def convert_csv_to_xlsx(self, csvpath, xlsxpath):
-        read_file = pd.read_csv(csvpath)
-        read_file.to_excel(xlsxpath, index=None, header=True)
-        logging.info("Wrote to %s", xlsxpath)
+                    logging.error("Bad condition for transfer")
+                classification = ""
+            elif row.tx_type == et.TX_TYPE_INCOME:
+                transaction_type = "deposit"
+                classification = "income"
+            elif row.tx_type == et.TX_TYPE_BORROW:
+                transaction_type = "deposit"
+                classification = ""
+            elif row.tx_type == et.TX_TYPE_REPAY:
+                transaction_type = "withdraw"
+                classification = ""
+            else:
+                transaction_type = ""
+                classification = ""
+                logging.critical("Transaction not handled correctly.  Fix this!")
+
+            line = [
+                transaction_type,                            # transactionType
+                self._accointing_timestamp(row.timestamp),   # date
+                row.received_amount,                         # inBuyAmount
+                row.received_currency,                       # inBuyAsset
+                row.sent_amount,                             # outSellAmount
+                row.sent_currency,                           # outSellAsset
+                row.fee,                                     # feeAmount
+                row.fee_currency,                            # feeAsset
+                classification,                              # classification
+                row.txid,                                    # operationId
+                row.comment,                                 # comments
+            ]
+            yield line
 
     def export_awakentax_csv(self, csvpath):
         """ Writes CSV, suitable for import into awaken.tax """
@@ -1291,8 +1352,11 @@ class Exporter:
                 mywriter.writerow(line)
         logging.info("Wrote to %s", csvpath)
 
-    def export_kryptos_csv(self, csvpath):
-        """ Writes CSV, suitable for import into Kryptos """
+    def export_kryptos_csv(self, csvpath, xlsxpath=None):
+        """ Writes CSV (and xlsx if xlsxpath specified), suitable for import into Kryptos """
+        self._write_table(csvpath, et.KRYPTOS_FIELDS, self._kryptos_lines(), xlsxpath)
+
+    def _kryptos_lines(self):
         kryptos_tx_types = {
             et.TX_TYPE_AIRDROP: "deposit",
             et.TX_TYPE_STAKING: "deposit",
@@ -1308,76 +1372,66 @@ class Exporter:
             et.TX_TYPE_MARGIN_TRADE_FEE: "withdrawal"
         }
         rows = self._rows_export(et.FORMAT_KRYPTOS)
+        for row in rows:
+            # Determine transaction type
+            tx_type = kryptos_tx_types.get(row.tx_type, "transfer")
+            
+            # Handle special cases for transfer types
+            if tx_type == "transfer":
+                if row.received_amount and not row.sent_amount:
+                    tx_type = "deposit"
+                elif row.sent_amount and not row.received_amount:
+                    tx_type = "withdrawal"
+                else:
+                    tx_type = "transfer"
 
-        with open(csvpath, 'w', newline='', encoding='utf-8') as f:
-            mywriter = csv.writer(f)
-
-            # header row
-            mywriter.writerow(et.KRYPTOS_FIELDS)
-
-            # data rows
-            for row in rows:
-                # Determine transaction type
-                tx_type = kryptos_tx_types.get(row.tx_type, "transfer")
-                
-                # Handle special cases for transfer types
-                if tx_type == "transfer":
-                    if row.received_amount and not row.sent_amount:
-                        tx_type = "deposit"
-                    elif row.sent_amount and not row.received_amount:
-                        tx_type = "withdrawal"
-                    else:
-                        tx_type = "transfer"
-
-                # Convert timestamp to ISO format
-                iso_timestamp = self._kryptos_timestamp(row.timestamp)
-
-                # Determine base currency (use fee currency if available, otherwise use received/sent currency)
-                base_currency = ""
-                if row.fee_currency:
-                    base_currency = row.fee_currency
-                elif row.received_currency:
-                    base_currency = row.received_currency
-                elif row.sent_currency:
-                    base_currency = row.sent_currency
-
-                # Calculate net worth (simplified - in practice this would need price data)
-                net_worth = ""
-                fee_net_worth = ""
-
-                # Build description
-                description = row.comment if row.comment else f"{tx_type} transaction"
-
-                # Determine From Address and To Address based on transaction direction
-                # From Address: wallet_address when wallet is sending assets
-                # To Address: wallet_address when wallet is receiving assets
-                # Counterparty addresses are not available in Row object, so they remain empty
-                from_address = row.wallet_address if row.sent_amount else ""
-                to_address = row.wallet_address if row.received_amount else ""
-
-                line = [
-                    iso_timestamp,                    # Date-Time
-                    tx_type,                          # Type
-                    row.received_currency or "",      # Received Asset
-                    row.received_amount or "",        # Received Amount
-                    row.sent_currency or "",          # Sent Asset
-                    row.sent_amount or "",            # Sent Amount
-                    net_worth,                        # Net Worth
-                    base_currency,                    # Base Currency
-                    row.fee_currency or "",           # Fee Asset
-                    row.fee or "",                    # Fee Amount
-                    fee_net_worth,                    # Fee Net Worth
-                    description,                      # Description
-                    row.txid or "",                   # Tx Hash
-                    "",                               # Sent Asset Contract Address
-                    "",                               # Received Asset Contract Address
-                    from_address,                     # From Address
-                    to_address,                       # To Address
-                    row.comment or ""                 # Comment
-                ]
-                mywriter.writerow(line)
+            # Convert timestamp to ISO format
+            iso_timestamp = self._kryptos_timestamp(row.timestamp)
 
-        logging.info("Wrote to %s", csvpath)
+            # Determine base currency (use fee currency if available, otherwise use received/sent currency)
+            base_currency = ""
+            if row.fee_currency:
+                base_currency = row.fee_currency
+            elif row.received_currency:
+                base_currency = row.received_currency
+            elif row.sent_currency:
+                base_currency = row.sent_currency
+
+            # Calculate net worth (simplified - in practice this would need price data)
+            net_worth = ""
+            fee_net_worth = ""
+
+            # Build description
+            description = row.comment if row.comment else f"{tx_type} transaction"
+
+            # Determine From Address and To Address based on transaction direction
+            # From Address: wallet_address when wallet is sending assets
+            # To Address: wallet_address when wallet is receiving assets
+            # Counterparty addresses are not available in Row object, so they remain empty
+            from_address = row.wallet_address if row.sent_amount else ""
+            to_address = row.wallet_address if row.received_amount else ""
+
+            line = [
+                iso_timestamp,                    # Date-Time
+                tx_type,                          # Type
+                row.received_currency or "",      # Received Asset
+                row.received_amount or "",        # Received Amount
+                row.sent_currency or "",          # Sent Asset
+                row.sent_amount or "",            # Sent Amount
+                net_worth,                        # Net Worth
+                base_currency,                    # Base Currency
+                row.fee_currency or "",           # Fee Asset
+                row.fee or "",                    # Fee Amount
+                fee_net_worth,                    # Fee Net Worth
+                description,                      # Description
+                row.txid or "",                   # Tx Hash
+                "",                               # Sent Asset Contract Address
+                "",                               # Received Asset Contract Address
+                from_address,                     # From Address
+                to_address,                       # To Address
+                row.comment or ""                 # Comment
+            ]
+            yield line
 
     def _kryptos_timestamp(self, ts):
         """ Convert timestamp to ISO format for Kryptos """
@@ -1761,8 +1815,11 @@ class Exporter:
 
         logging.info("Wrote to %s", csvpath)
 
-    def export_blockpit_csv(self, csvpath):
-        """ Writes CSV, whose xlsx translation is suitable for import into blockpit.io """
+    def export_blockpit_csv(self, csvpath, xlsxpath=None):
+        """ Writes CSV (and xlsx if xlsxpath specified), whose xlsx is suitable for import into blockpit.io """
+        self._write_table(csvpath, et.BLOCKPIT_FIELDS, self._blockpit_lines(), xlsxpath)
+
+    def _blockpit_lines(self):
         BLOCKPIT_LABELS = {
             et.TX_TYPE_STAKING: "Staking",
             et.TX_TYPE_AIRDROP: "Airdrop",
@@ -1774,40 +1831,30 @@ class Exporter:
             et.TX_TYPE_REPAY: "transfer",
         }
         rows = self._rows_export(et.FORMAT_BLOCKPIT)
+        for i, row in enumerate(rows):
+            # Determine Label
+            label = BLOCKPIT_LABELS[row.tx_type]
+            if label == "transfer":
+                if row.sent_amount:
+                    label = "Withdrawal"
+                else:
+                    label = "Deposit"
+
+            line = [
+                self._blockpit_timestamp(row.timestamp),  # Date (UTC)
+                self.ticker + "_blockchain",              # Integration Name
+                label,                                    # Label
+                row.sent_currency,                        # Outgoing Asset
+                row.sent_amount,                          # Outgoing Amount
+                row.received_currency,                    # Incoming Asset
+                row.received_amount,                      # Incoming Amount
+                row.fee_currency,                         # Fee Asset (optional)
+                row.fee,                                  # Fee Amount (optional)
+                row.comment,                              # Comment (optional)
+                row.txid,                                 # Trx. ID (optional)
+            ]
 
-        with open(csvpath, 'w', newline='', encoding='utf-8') as f:
-            mywriter = csv.writer(f)
-
-            # header row
-            mywriter.writerow(et.BLOCKPIT_FIELDS)
-
-            # data rows
-            for i, row in enumerate(rows):
-                # Determine Label
-                label = BLOCKPIT_LABELS[row.tx_type]
-                if label == "transfer":
-                    if row.sent_amount:
-                        label = "Withdrawal"
-                    else:
-                        label = "Deposit"
-
-                line = [
-                    self._blockpit_timestamp(row.timestamp),  # Date (UTC)
-                    self.ticker + "_blockchain",              # Integration Name
-                    label,                                    # Label
-                    row.sent_currency,                        # Outgoing Asset
-                    row.sent_amount,                          # Outgoing Amount
-                    row.received_currency,                    # Incoming Asset
-                    row.received_amount,                      # Incoming Amount
-                    row.fee_currency,                         # Fee Asset (optional)
-                    row.fee,                                  # Fee Amount (optional)
-                    row.comment,                              # Comment (optional)
-                    row.txid,                                 # Trx. ID (optional)
-                ]
-
-                mywriter.writerow(line)
-
-        logging.info("Wrote to %s", csvpath)
+            yield line
 
     def _blockpit_timestamp(self, ts):
         # Convert "2021-08-04 15:25:43" to "14.08.2021 15:25:43"
@@ -1957,57 +2004,99 @@ class Exporter:
 
     def export_balances_csv(self, csvpath, truncate=None):
         """ Writes CSV, which shows balance history of wallet based on CSV. """
+        import numpy as np  # only needed for balances formats
+
         self.sort_rows(reverse=False)
+        rows = self.rows
+        currencies_list, columns = self._balances_columns()
 
-        # Find all currencies
-        currencies = set()
-        for row in self.rows:
-            if row.received_currency:
-                currencies.add(row.received_currency)
-            if row.sent_currency:
-                currencies.add(row.sent_currency)
-            if row.fee_currency:
-                currencies.add(row.fee_currency)
+        # Each balance formatted once (cells repeat it until next change); "0" before first change
+        columns = [(change_rows, np.array(["0"] + [str(b) for b in balances.tolist()], dtype=object))
+                   for change_rows, balances in columns]
 
-        # Initialize balance of each currency to zero at beginning
-        balances = {}
-        for currency in currencies:
-            balances[currency] = 0
+        # Rows newest first (truncated), written in chunks so that only chunk x currencies cells are in memory
+        chunk_size = 1000
+        stop = max(0, len(rows) - truncate) if truncate else 0
 
-        # Create table array that represents new csv
-        currencies_list = sorted(list(currencies))
-        table = []
+        with open(csvpath, 'w', newline='', encoding='utf-8') as f:
+            mywriter = csv.writer(f)
+            mywriter.writerow(["timestamp", "txid"] + currencies_list)
 
-        # For each original row, create a corresponding row with all currency balances.
-        for row in self.rows:
-            if row.received_currency and row.received_amount:
-                balances[row.received_currency] += float(row.received_amount)
-            if row.sent_currency and row.sent_amount:
-                balances[row.sent_currency] -= float(row.sent_amount)
-            if row.fee_currency and row.fee:
-                balances[row.fee_currency] -= float(row.fee)
+            for end in range(len(rows), stop, -chunk_size):
+                row_indices = np.arange(end - 1, max(stop, end - chunk_size) - 1, -1)
 
-            balance_row = [row.timestamp, row.txid]
-            for currency in currencies_list:
-                balance_row.append(balances[currency])
+                block = np.empty((len(row_indices), len(currencies_list)), dtype=object)
+                for k, (change_rows, balance_strs) in enumerate(columns):
+                    # Balance after last change at or before row
+                    block[:, k] = balance_strs[np.searchsorted(change_rows, row_indices, side="right")]
 
-            table.append(balance_row)
+                for i, balance_row in zip(row_indices.tolist(), block.tolist()):
+                    mywriter.writerow([rows[i].timestamp, rows[i].txid] + balance_row)
+        logging.info("Wrote to %s", csvpath)
 
-        table.reverse()
+    def export_balances_long_csv(self, csvpath, truncate=None):
+        """ Writes CSV of balance history in long (sparse) form: one line per row and currency changed in that
+            row, with balance after row.  Same data as export_balances_csv(), but size does not grow with
+            number of currencies. """
+        import numpy as np  # only needed for balances formats
 
+        self.sort_rows(reverse=False)
+        rows = self.rows
+        currencies_list, columns = self._balances_columns()
+
+        # Balance of each currency after last change in each row
+        row_indices, currency_indices, balances = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], []
+        for k, (change_rows, column_balances) in enumerate(columns):
+            last = np.append(change_rows[1:] != change_rows[:-1], True) if len(change_rows) else change_rows
+            row_indices.append(change_rows[last])
+            currency_indices.append(np.full(np.count_nonzero(last), k))
+            balances.extend(column_balances[last].tolist())
+        row_indices = np.concatenate(row_indices)
+        currency_indices = np.concatenate(currency_indices)
+
+        # Rows newest first (truncated), currencies in sorted order within row
+        order = np.lexsort((currency_indices, -row_indices))
         if truncate:
-            table = table[:truncate]
-
-        # Add header row to beginning of array
-        header_row = ["timestamp", "txid"]
-        header_row.extend(currencies_list)
-        table.insert(0, header_row)
+            order = order[row_indices[order] >= len(rows) - truncate]
 
-        # Write table array to csv
         with open(csvpath, 'w', newline='', encoding='utf-8') as f:
             mywriter = csv.writer(f)
-            mywriter.writerows(table)
-            logging.info("Wrote to %s", csvpath)
+            mywriter.writerow(["timestamp", "txid", "currency", "balance"])
+
+            for n in order.tolist():
+                row = rows[row_indices[n]]
+                mywriter.writerow([row.timestamp, row.txid, currencies_list[currency_indices[n]], balances[n]])
+        logging.info("Wrote to %s", csvpath)
+
+    def _balances_columns(self):
+        """ Returns (sorted list of currencies, list of (change_rows, balances) per currency), where balances[n] is
+            running balance after nth change and change_rows[n] is index (in self.rows) of row making the change.
+
+            Changes are summed in same order as applied to balances row by row (received, sent, fee), so that
+            balances are identical to adding them one at a time.
+        """
+        import numpy as np  # only needed for balances formats
+
+        # currency -> ([row index], [signed amount])
+        changes = {}
+        for i, row in enumerate(self.rows):
+            for currency, amount, sign in ((row.received_currency, row.received_amount, 1),
+                                           (row.sent_currency, row.sent_amount, -1),
+                                           (row.fee_currency, row.fee, -1)):
+                if currency:
+                    change_rows, amounts = changes.setdefault(currency, ([], []))
+                    if amount:
+                        change_rows.append(i)
+                        amounts.append(sign * float(amount))
+
+        currencies_list = sorted(changes)
+        columns = []
+        for currency in currencies_list:
+            change_rows, amounts = changes[currency]
+            # (+ 0.0 so that a zero balance is never -0.0)
+            balances = np.cumsum(np.array(amounts, dtype=np.float64)) + 0.0
+            columns.append((np.array(change_rows, dtype=np.int64), balances))
+        return currencies_list, columns
 
     def convert_alloyed_symbols(self):
         """
@@ -2,6 +2,7 @@
 # CSV formats
 FORMAT_DEFAULT = "default"
 FORMAT_BALANCES_CALCULATED = "balances_calculated"  # based on CSV
+FORMAT_BALANCES_CALCULATED_LONG = "balances_calculated_long"  # based on CSV (one line per currency change)
 FORMAT_ACCOINTING = "accointing"
 FORMAT_AWAKENTAX = "awakentax"
 FORMAT_BITCOINTAX = "bitcointax"
@@ -53,6 +54,10 @@ FORMATS = [
     FORMAT_KRYPTOS,
     FORMAT_BALANCES_CALCULATED,
 ]
+# Formats only exported when requested explicitly (not included in "all")
+FORMATS_EXTRA = [
+    FORMAT_BALANCES_CALCULATED_LONG,
+]
 
 # Other
 LP_TREATMENT_TRANSFERS = "transfers"
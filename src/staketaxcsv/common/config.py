@@ -7,3 +7,4 @@ class config:
     debug = False
     limit = 20000  # max txs
     koinlynullmap = None
+    incremental = False  # resume from previous run's saved rows (see common/incremental.py)
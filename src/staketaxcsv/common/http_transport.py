@@ -0,0 +1,159 @@
+"""
+Shared HTTP transport used by api clients (LCD, RPC, mintscan, FCD, osmosis, algo indexer).
+
+  * One requests.Session per process, with a keep-alive connection pool per host (gzip is
+    requested by default).  Pool size set by STAKETAX_HTTP_POOL_SIZE.
+  * Per-host rate limiting: set_host_rate() for a token bucket limit on a host, and throttle() for
+    minimum seconds between requests to a host (in place of fixed sleeps after each request).
+  * Per-host request count/latency/bytes metrics (see HttpMetrics).
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from staketaxcsv.common.rate_limiter import TokenBucket
+from staketaxcsv.settings_csv import HTTP_POOL_SIZE
+
+POOL_HOSTS = 32  # number of per-host connection pools kept by each adapter
+
+
+def _host(url):
+    """ 'https://lcd.osmosis.zone/cosmos/...' -> 'lcd.osmosis.zone' (also accepts bare host) """
+    return urlparse(url).netloc or url
+
+
+class HostLimits:
+
+    # host -> TokenBucket
+    buckets = {}
+    # host -> (lock, monotonic time of last throttled request)
+    intervals = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def set_rate(cls, host, rate, capacity=1):
+        with cls.lock:
+            cls.buckets[host] = TokenBucket(rate, capacity)
+
+    @classmethod
+    def acquire(cls, host):
+        bucket = cls.buckets.get(host)
+        if bucket:
+            bucket.acquire()
+
+    @classmethod
+    def throttle(cls, host, min_interval):
+        with cls.lock:
+            if host not in cls.intervals:
+                cls.intervals[host] = [threading.Lock(), 0.0]
+            interval = cls.intervals[host]
+
+        with interval[0]:
+            wait_seconds = interval[1] + min_interval - time.monotonic()
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+            interval[1] = time.monotonic()
+
+
+class HttpMetrics:
+
+    # host -> {"requests": int, "errors": int, "seconds": float, "bytes": int}
+    hosts = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def add(cls, host, seconds, num_bytes, error=False):
+        with cls.lock:
+            stats = cls.hosts.setdefault(host, {"requests": 0, "errors": 0, "seconds": 0.0, "bytes": 0})
+            stats["requests"] += 1
+            stats["errors"] += int(error)
+            stats["seconds"] += seconds
+            stats["bytes"] += num_bytes
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.hosts = {}
+
+    @classmethod
+    def summary(cls):
+        """ Returns dict of host -> {requests, errors, seconds, avg_ms, bytes} """
+        with cls.lock:
+            out = {}
+            for host, stats in cls.hosts.items():
+                out[host] = dict(stats)
+                out[host]["seconds"] = round(stats["seconds"], 3)
+                out[host]["avg_ms"] = round(1000 * stats["seconds"] / stats["requests"], 1)
+            return out
+
+    @classmethod
+    def log(cls):
+        if len(cls.hosts) > 0:
+            data = {
+                "http_metrics": cls.summary(),
+                "RLOG": 1,
+                "event": "http_metrics"
+            }
+            logging.info(data)
+
+
+class TransportSession(requests.Session):
+    """ requests.Session that applies per-host rate limits and records per-host metrics """
+
+    def __init__(self):
+        super().__init__()
+        self.mount("https://", self.make_adapter())
+        self.mount("http://", self.make_adapter())
+
+    @staticmethod
+    def make_adapter(max_retries=0):
+        return HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=max_retries)
+
+    def request(self, method, url, *args, **kwargs):
+        host = _host(url)
+        HostLimits.acquire(host)
+
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            HttpMetrics.add(host, time.monotonic() - start, 0, error=True)
+            raise
+
+        HttpMetrics.add(host, time.monotonic() - start, len(response.content), error=response.status_code >= 400)
+        return response
+
+
+class Transport:
+
+    session = None
+    lock = threading.Lock()
+
+
+def get_session():
+    """ Returns shared TransportSession """
+    with Transport.lock:
+        if Transport.session is None:
+            Transport.session = TransportSession()
+        return Transport.session
+
+
+def mount_retries(url_prefix, retries):
+    """ Use urllib3 Retry config for requests to url_prefix (i.e. node url) """
+    get_session().mount(url_prefix, TransportSession.make_adapter(max_retries=retries))
+
+
+def set_host_rate(url, requests_per_second, capacity=1):
+    """ Limits requests to host of url (url or bare host) to requests_per_second """
+    HostLimits.set_rate(_host(url), requests_per_second, capacity)
+
+
+def throttle(url, min_interval):
+    """ Blocks until min_interval seconds have passed since the previous throttled request to host of url """
+    if min_interval:
+        HostLimits.throttle(_host(url), min_interval)
@@ -2,6 +2,7 @@ import logging
 import pprint
 import re
 import base64
+from functools import cached_property
 
 import staketaxcsv.common.ibc.constants as co
 from staketaxcsv.common.ibc import util_ibc, denoms
@@ -11,10 +12,16 @@ COIN_SPENT = "coin_spent"
 RECEIVER = "receiver"
 SPENDER = "spender"
 AMOUNT = "amount"
+TRANSFER = "transfer"
+WASM = "wasm"
 
 
 class MsgInfoIBC:
-    """ Single message info for index <i> """
+    """ Single message info for index <i>
+
+    Events are indexed by type in one pass at construction.  Transfer/wasm/events_by_type views are
+    computed on first access (and cached), so messages whose handlers never read them never pay for them.
+    """
 
     lcd_node = None
     wallet_address = None
@@ -35,16 +42,62 @@ class MsgInfoIBC:
 
         # Unified events extraction
         self.events = log["events"] if log else events or []
-
-        self.transfers = self._transfers()
-        self.transfers_net = util_ibc.aggregate_transfers_net(self.transfers[0], self.transfers[1])
-        self.transfers_net_exact = util_ibc.aggregate_transfers_net(
-            self.transfers[0], self.transfers[1], tiny_amount_filter=False
-        )
-        self.transfers_event = self._transfers_from_transfer_event(show_addrs=True)
-        self.wasm = MsgInfoIBC._wasm(log) if log else []
         self.contract = self._contract(message)
-        self.events_by_type = self._events_by_type()
+
+        # <event type> -> list of events
+        self.events_of_type = self._index_events()
+
+    @cached_property
+    def transfers(self):
+        return self._transfers()
+
+    @cached_property
+    def transfers_net(self):
+        return util_ibc.aggregate_transfers_net(self.transfers[0], self.transfers[1])
+
+    @cached_property
+    def transfers_net_exact(self):
+        return util_ibc.aggregate_transfers_net(self.transfers[0], self.transfers[1], tiny_amount_filter=False)
+
+    @cached_property
+    def transfers_event(self):
+        return self._transfers_from_transfer_event(show_addrs=True)
+
+    @cached_property
+    def wasm(self):
+        if not self.log:
+            return []
+        wasm_events = self.events_of_type.get(WASM)
+        return MsgInfoIBC._wasm_actions(wasm_events[0]) if wasm_events else []
+
+    @cached_property
+    def events_by_type(self):
+        return self._events_by_type()
+
+    def _index_events(self):
+        """ Single pass over events: decodes base64 attributes (rare cases), cleans up transfer events, and
+            returns dict of <event type> -> list of events """
+        out = {}
+        for event in self.events:
+            event_type, attributes = event["type"], event["attributes"]
+
+            # In rare cases, base64 decode required.
+            self._handle_base64_attributes(attributes)
+
+            # Prevent crash in weird data where key="authz_msg_index" for last 2 attributes
+            # (MsgMultiSend transfer events use different format and are ignored)
+            if (event_type == TRANSFER
+                 and self.msg_type != co.MSG_TYPE_MULTI_SEND
+                 and len(attributes) > 1
+                 and attributes[-1]["key"] == "authz_msg_index"
+                 and attributes[-2]["key"] == "authz_msg_index"):
+                attributes.pop()
+
+            if event_type in out:
+                out[event_type].append(event)
+            else:
+                out[event_type] = [event]
+        return out
 
     def print(self):
         print("\nmsg{}:".format(self.msg_index))
@@ -92,44 +145,34 @@ class MsgInfoIBC:
         return transfers_in, transfers_out
 
     def _has_event_type(self, target_event_type):
-        for event in self.events:
-            event_type, attributes = event["type"], event["attributes"]
-            if event_type == target_event_type:
-                return True
-        return False
+        return target_event_type in self.events_of_type
 
     def _num_keys(self, attributes):
-        return len(set([a["key"] for a in attributes]))
+        return len({a["key"] for a in attributes})
 
     def _transfers_coin_received(self):
         transfers_in = []
 
-        for event in self.events:
-            event_type, attributes = event["type"], event["attributes"]
+        for event in self.events_of_type.get(COIN_RECEIVED, []):
+            # Remove authz_msg_index key/values (if exists) so that uniform logic afterwards is consistent.
+            attributes = self._remove_authz_msg_index(event["attributes"])
 
-            # In rare cases, base64 decode required.
-            self._handle_base64_attributes(attributes)
+            for i in range(0, len(attributes), self._num_keys(attributes)):
+                first_key = attributes[i]["key"]
 
-            if event_type == COIN_RECEIVED:
-                # Remove authz_msg_index key/values (if exists) so that uniform logic afterwards is consistent.
-                attributes = self._remove_authz_msg_index(attributes)
-
-                for i in range(0, len(attributes), self._num_keys(attributes)):
-                    first_key = attributes[i]["key"]
-
-                    if first_key == AMOUNT:
-                        # Special case in JUNO only as of 10/4/2022
-                        amount_string = attributes[i]["value"]
-                        receiver = attributes[i + 1]["value"]
-                    elif first_key == RECEIVER:
-                        receiver = attributes[i]["value"]
-                        amount_string = attributes[i + 1].get("value", "")
-                    else:
-                        raise Exception("Unexpected format in coin_received event")
-
-                    if receiver == self.wallet_address:
-                        for amount, currency in self.amount_currency(amount_string):
-                            transfers_in.append((amount, currency))
+                if first_key == AMOUNT:
+                    # Special case in JUNO only as of 10/4/2022
+                    amount_string = attributes[i]["value"]
+                    receiver = attributes[i + 1]["value"]
+                elif first_key == RECEIVER:
+                    receiver = attributes[i]["value"]
+                    amount_string = attributes[i + 1].get("value", "")
+                else:
+                    raise Exception("Unexpected format in coin_received event")
+
+                if receiver == self.wallet_address:
+                    for amount, currency in self.amount_currency(amount_string):
+                        transfers_in.append((amount, currency))
 
         return transfers_in
 
@@ -156,32 +199,26 @@ class MsgInfoIBC:
     def _transfers_coin_spent(self):
         transfers_out = []
 
-        for event in self.events:
-            event_type, attributes = event["type"], event["attributes"]
+        for event in self.events_of_type.get(COIN_SPENT, []):
+            # Remove authz_msg_index key/values (if exists) so that uniform logic afterwards is consistent.
+            attributes = self._remove_authz_msg_index(event["attributes"])
 
-            # In rare cases, base64 decode required.
-            self._handle_base64_attributes(attributes)
+            for i in range(0, len(attributes), self._num_keys(attributes)):
+                first_key = attributes[i]["key"]
 
-            if event_type == COIN_SPENT:
-                # Remove authz_msg_index key/values (if exists) so that uniform logic afterwards is consistent.
-                attributes = self._remove_authz_msg_index(attributes)
-
-                for i in range(0, len(attributes), self._num_keys(attributes)):
-                    first_key = attributes[i]["key"]
-
-                    if first_key == AMOUNT:
-                        # Special case in JUNO only as of 10/4/2022
-                        amount_string = attributes[i]["value"]
-                        spender = attributes[i + 1]["value"]
-                    elif first_key == SPENDER:
-                        spender = attributes[i]["value"]
-                        amount_string = attributes[i + 1].get("value", "")
-                    else:
-                        raise Exception("Unexpected format in coin_spent event")
-
-                    if spender == self.wallet_address:
-                        for amount, currency in self.amount_currency(amount_string):
-                            transfers_out.append((amount, currency))
+                if first_key == AMOUNT:
+                    # Special case in JUNO only as of 10/4/2022
+                    amount_string = attributes[i]["value"]
+                    spender = attributes[i + 1]["value"]
+                elif first_key == SPENDER:
+                    spender = attributes[i]["value"]
+                    amount_string = attributes[i + 1].get("value", "")
+                else:
+                    raise Exception("Unexpected format in coin_spent event")
+
+                if spender == self.wallet_address:
+                    for amount, currency in self.amount_currency(amount_string):
+                        transfers_out.append((amount, currency))
 
         return transfers_out
 
@@ -190,49 +227,38 @@ class MsgInfoIBC:
             using transfer event element only. """
         transfers_in, transfers_out = [], []
 
-        for event in self.events:
-            event_type, attributes = event["type"], event["attributes"]
+        # ignore MsgMultiSend case (uses different format)
+        if self.msg_type == co.MSG_TYPE_MULTI_SEND:
+            return transfers_in, transfers_out
 
-            # In rare cases, base64 decode required.
-            self._handle_base64_attributes(attributes)
+        for event in self.events_of_type.get(TRANSFER, []):
+            attributes = event["attributes"]
+
+            for i in range(0, len(attributes), self._num_keys(attributes)):
+                first_key = attributes[i]["key"]
 
-            if event_type == "transfer":
-                # ignore MsgMultiSend case (uses different format)
-                if self.msg_type == co.MSG_TYPE_MULTI_SEND:
-                    continue
-
-                # Prevent crash in weird data where key="authz_msg_index" for last 2 attributes
-                if (len(attributes) > 1
-                     and attributes[-1]["key"] == "authz_msg_index"
-                     and attributes[-2]["key"] == "authz_msg_index"):
-                    attributes.pop()
-
-                # Handle all other cases
-                for i in range(0, len(attributes), self._num_keys(attributes)):
-                    first_key = attributes[i]["key"]
-
-                    if first_key == AMOUNT:
-                        # Special case in JUNO only as of 10/4/2022
-                        amount_string = attributes[i]["value"]
-                        recipient = attributes[i + 1]["value"]
-                        sender = attributes[i + 2]["value"]
-                    else:
-                        recipient = attributes[i]["value"]
-                        sender = attributes[i + 1]["value"]
-                        amount_string = attributes[i + 2].get("value", "")
-
-                    if recipient == self.wallet_address:
-                        for amount, currency in self.amount_currency(amount_string):
-                            if show_addrs:
-                                transfers_in.append((amount, currency, sender, recipient))
-                            else:
-                                transfers_in.append((amount, currency))
-                    elif sender == self.wallet_address:
-                        for amount, currency in self.amount_currency(amount_string):
-                            if show_addrs:
-                                transfers_out.append((amount, currency, sender, recipient))
-                            else:
-                                transfers_out.append((amount, currency))
+                if first_key == AMOUNT:
+                    # Special case in JUNO only as of 10/4/2022
+                    amount_string = attributes[i]["value"]
+                    recipient = attributes[i + 1]["value"]
+                    sender = attributes[i + 2]["value"]
+                else:
+                    recipient = attributes[i]["value"]
+                    sender = attributes[i + 1]["value"]
+                    amount_string = attributes[i + 2].get("value", "")
+
+                if recipient == self.wallet_address:
+                    for amount, currency in self.amount_currency(amount_string):
+                        if show_addrs:
+                            transfers_in.append((amount, currency, sender, recipient))
+                        else:
+                            transfers_in.append((amount, currency))
+                elif sender == self.wallet_address:
+                    for amount, currency in self.amount_currency(amount_string):
+                        if show_addrs:
+                            transfers_out.append((amount, currency, sender, recipient))
+                        else:
+                            transfers_out.append((amount, currency))
         return transfers_in, transfers_out
 
     def amount_currency(self, amount_string):
@@ -265,36 +291,38 @@ class MsgInfoIBC:
     @classmethod
     def _wasm(cls, log):
         """ Parses wasm in log to return list of action dictionaries. """
-        events = log["events"]
-        for event in events:
-            attributes, event_type = event["attributes"], event["type"]
-
-            if event_type == "wasm":
-                actions = []
-                action = {}
+        for event in log["events"]:
+            if event["type"] == WASM:
+                return cls._wasm_actions(event)
 
-                for kv in attributes:
-                    k, v = kv["key"], kv["value"]
+        return []
 
-                    if k in ["contract_address", "_contract_address"]:
-                        # reached beginning of next action
+    @classmethod
+    def _wasm_actions(cls, event):
+        """ Parses wasm event to return list of action dictionaries. """
+        actions = []
+        action = {}
 
-                        # add previous action to list
-                        if len(action):
-                            actions.append(action)
+        for kv in event["attributes"]:
+            k, v = kv["key"], kv["value"]
 
-                        # start new action
-                        action = {}
-                        action[k] = v
-                    else:
-                        action[k] = v
+            if k in ["contract_address", "_contract_address"]:
+                # reached beginning of next action
 
+                # add previous action to list
                 if len(action):
                     actions.append(action)
 
-                return actions
+                # start new action
+                action = {}
+                action[k] = v
+            else:
+                action[k] = v
 
-        return []
+        if len(action):
+            actions.append(action)
+
+        return actions
 
     def _contract(self, message):
         if message and "contract" in message:
@@ -1,14 +1,13 @@
 import logging
 import math
-import time
 from urllib.parse import urlencode
 
-import requests
 import staketaxcsv.common.ibc.constants as co
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.debug_util import debug_cache
 from staketaxcsv.common.ibc.constants import (
     EVENTS_TYPE_SENDER, EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SIGNER, EVENTS_TYPE_LIST_DEFAULT)
-from staketaxcsv.common.ibc.util_ibc import remove_duplicates
+from staketaxcsv.common.ibc import lcd_fetch
 from staketaxcsv.settings_csv import REPORTS_DIR
 from staketaxcsv.common.query import get_with_retries
 from staketaxcsv.settings_csv import MINTSCAN_KEY
@@ -17,7 +16,7 @@ TXS_LIMIT_PER_QUERY = 50
 
 class LcdAPI_v1:
     """ <= v0.45.x (cosmos sdk version) """
-    session = requests.Session()
+    session = http_transport.get_session()
     debug = False
 
     def __init__(self, node):
@@ -36,10 +35,8 @@ class LcdAPI_v1:
                 'Accept': 'application/json, text/plain, */*'
             }
 
+        http_transport.throttle(url, sleep_seconds)
         data = get_with_retries(self.session, url, query_params, headers)
-
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
         return data
 
     def _node_info(self):
@@ -125,6 +122,12 @@ class LcdAPI_v1:
             total_count_txs = int(data["pagination"]["total"])
         return elems, next_offset, total_count_txs
 
+    def get_txs_page(self, wallet_address, events_type, index, limit=TXS_LIMIT_PER_QUERY, sleep_seconds=1):
+        """ Returns (elems, has_more, total_count_txs) for page index (0 is first page) """
+        elems, next_offset, total_count_txs = self.get_txs(
+            wallet_address, events_type, index * limit, limit, sleep_seconds)
+        return elems, next_offset is not None, total_count_txs
+
     def _ibc_address_to_denom(self, ibc_address):
         """ 'ibc/0471F1C4E7AFD3F07702BEF6DC365268D64570F7C1FDC98EA6098DD6DE59817B' -> 'OSMO' """
         _, hash = ibc_address.split("/")
@@ -160,32 +163,13 @@ class LcdAPI_v1:
 
 
 def get_txs_all(node, address, max_txs, progress=None, limit=TXS_LIMIT_PER_QUERY, sleep_seconds=1,
-                stage_name="default", events_types=None):
+                stage_name="default", events_types=None, known_txids=None):
     api = LcdAPI_v1(node)
     events_types = events_types if events_types else EVENTS_TYPE_LIST_DEFAULT
     max_pages = math.ceil(max_txs / limit)
 
-    out = []
-    pages_total = 0
-    for events_type in events_types:
-        offset = 0
-        if progress:
-            progress.report_message(f"Starting fetch for event_type={events_type}")
-
-        for i in range(max_pages):
-            elems, offset, _ = api.get_txs(address, events_type, offset, limit, sleep_seconds)
-            out.extend(elems)
-
-            pages_total += 1
-            if progress:
-                message = f"Fetched page {i+1} for {events_type} stage ..."
-                progress.report(pages_total, message, stage_name)
-
-            if offset is None:
-                break
-
-    out = remove_duplicates(out)
-    return out
+    return lcd_fetch.get_pages_all(
+        api, address, events_types, limit, max_pages, sleep_seconds, progress, stage_name, known_txids)
 
 
 def get_txs_pages_count(node, address, max_txs, limit=TXS_LIMIT_PER_QUERY, events_types=None, sleep_seconds=1):
@@ -193,9 +177,8 @@ def get_txs_pages_count(node, address, max_txs, limit=TXS_LIMIT_PER_QUERY, event
     events_types = events_types if events_types else EVENTS_TYPE_LIST_DEFAULT
 
     total_pages = 0
-    for event_type in events_types:
-        # Number of queries for events message.sender
-        _, _, num_txs = api.get_txs(address, event_type, offset=0, limit=limit, sleep_seconds=sleep_seconds)
+    first_pages = lcd_fetch.probe(api, address, events_types, limit, sleep_seconds)
+    for event_type, (_, _, num_txs) in zip(events_types, first_pages):
         num_txs = min(num_txs, max_txs)
         num_pages = math.ceil(num_txs / limit) if num_txs else 1
 
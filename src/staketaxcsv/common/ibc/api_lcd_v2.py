@@ -7,7 +7,7 @@ from staketaxcsv.settings_csv import REPORTS_DIR
 from staketaxcsv.common.debug_util import debug_cache
 from staketaxcsv.common.ibc.constants import (
     EVENTS_TYPE_SENDER, EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SIGNER, EVENTS_TYPE_LIST_DEFAULT)
-from staketaxcsv.common.ibc.util_ibc import remove_duplicates
+from staketaxcsv.common.ibc import lcd_fetch
 from staketaxcsv.common.query import version_ge
 
 TXS_LIMIT_PER_QUERY = 100
@@ -74,6 +74,12 @@ class LcdAPI_v2(LcdAPI_v1):
 
         return elems, total_count_txs, is_last_page
 
+    def get_txs_page(self, wallet_address, events_type, index, limit=TXS_LIMIT_PER_QUERY, sleep_seconds=1):
+        """ Returns (elems, has_more, total_count_txs) for page index (0 is first page) """
+        elems, total_count_txs, is_last_page = self.get_txs(
+            wallet_address, events_type, index + 1, limit, sleep_seconds)
+        return elems, not is_last_page, total_count_txs
+
     def _get_txs_one_by_one(self, wallet_address, events_type, page, limit, sleep_seconds):
         """ Rewrites original query by retrieving set of txs one-by-one. """
         p_start = (page - 1) * limit + 1
@@ -94,35 +100,14 @@ class LcdAPI_v2(LcdAPI_v1):
 
 
 def get_txs_all(node, address, max_txs, progress=None, limit=TXS_LIMIT_PER_QUERY, sleep_seconds=1,
-                debug=False, stage_name="default", events_types=None):
+                debug=False, stage_name="default", events_types=None, known_txids=None):
     LcdAPI_v2.debug = debug
     api = LcdAPI_v2(node)
     events_types = events_types if events_types else EVENTS_TYPE_LIST_DEFAULT
     max_pages = math.ceil(max_txs / limit)
 
-    out = []
-    pages_total = 0
-    for events_type in events_types:
-        page = 1
-        if progress:
-            progress.report_message(f"Starting fetch for event_type={events_type}")
-
-        for _ in range(max_pages):
-            elems, _, is_last_page = api.get_txs(address, events_type, page, limit, sleep_seconds)
-            out.extend(elems)
-
-            if progress:
-                pages_total += 1
-                message = f"Fetched page {page} for {events_type} stage..."
-                progress.report(pages_total, message, stage_name)
-
-            page += 1
-
-            if is_last_page:
-                break
-
-    out = remove_duplicates(out)
-    return out
+    return lcd_fetch.get_pages_all(
+        api, address, events_types, limit, max_pages, sleep_seconds, progress, stage_name, known_txids)
 
 
 def get_txs_pages_count(node, address, max_txs, limit=TXS_LIMIT_PER_QUERY,
@@ -131,9 +116,8 @@ def get_txs_pages_count(node, address, max_txs, limit=TXS_LIMIT_PER_QUERY,
     events_types = events_types if events_types else EVENTS_TYPE_LIST_DEFAULT
 
     total_pages = 0
-    for event_type in events_types:
-        # Number of queries for events message.sender
-        _, num_txs, _ = api.get_txs(address, event_type, page=1, limit=limit, sleep_seconds=sleep_seconds)
+    first_pages = lcd_fetch.probe(api, address, events_types, limit, sleep_seconds)
+    for event_type, (_, _, num_txs) in zip(events_types, first_pages):
         num_txs = min(num_txs, max_txs)
         num_pages = math.ceil(num_txs / limit) if num_txs else 1
 
@@ -2,15 +2,18 @@
 For list of supported networks for mintscan api, see https://docs.cosmostation.io/apis#supported-chain-list .
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
+import datetime
 import logging
 import math
 import pprint
-import requests
-import time
+import threading
 
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.query import get_with_retries
-from staketaxcsv.settings_csv import MINTSCAN_KEY
+from staketaxcsv.settings_csv import (
+    MINTSCAN_KEY, MINTSCAN_REQUESTS_PER_SECOND, MINTSCAN_FETCH_WINDOWS, MINTSCAN_FETCH_WORKERS)
 from staketaxcsv.common.ibc.util_ibc import remove_duplicates
 from staketaxcsv.common.ibc.constants import MINTSCAN_LABELS
 from staketaxcsv.common.debug_util import debug_cache
@@ -18,11 +21,13 @@ from staketaxcsv.settings_csv import REPORTS_DIR
 from urllib.parse import quote
 
 TXS_LIMIT_PER_QUERY = 20
+FROM_DATE_DEFAULT = "2016-01-01"
 
 
 class MintscanAPI:
     """ Mintscan API for fetching transaction data """
-    session = requests.Session()
+    session = http_transport.get_session()
+    http_transport.set_host_rate("https://apis.mintscan.io", MINTSCAN_REQUESTS_PER_SECOND)
 
     def __init__(self, ticker):
         if not MINTSCAN_KEY:
@@ -47,6 +52,7 @@ class MintscanAPI:
         url = self.base_url + uri_path
         encoded_query = "&".join(f"{quote(str(k))}={quote(str(v))}" for k, v in query_params.items())
         logging.info("Requesting url %s?%s ...", url, encoded_query)
+        http_transport.throttle(url, sleep_seconds)
         data = get_with_retries(self.session, url, query_params, headers=self.headers)
 
         if isinstance(data, dict) and data.get("statusCode") == 401:
@@ -60,8 +66,6 @@ class MintscanAPI:
             # error="All allowed credits for today have been used."
             raise Exception(f"statusCode=406.  Daily api credit limit exceeded")
 
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
         return data
 
     def _get_tx(self, txid):
@@ -91,7 +95,7 @@ class MintscanAPI:
         if to_date_time:
             params['toDateTime'] = to_date_time
 
-        data = self._query(uri_path, params, sleep_seconds=0.1)
+        data = self._query(uri_path, params)
         return data
 
     def get_txs(self, address, search_after=None, limit=TXS_LIMIT_PER_QUERY, from_date=None, to_date=None):
@@ -101,7 +105,7 @@ class MintscanAPI:
         """
         # api truncates data to only one month if no fromDateTime.  So this is used to avoid this.
         if from_date is None:
-            from_date = "2016-01-01"
+            from_date = FROM_DATE_DEFAULT
 
         from_date_ts = from_date + " 00:00:00"
         to_date_ts = to_date + " 23:59:59" if to_date else None
@@ -159,7 +163,7 @@ class MintscanAPI:
         if to_date_time:
             params['toDateTime'] = to_date_time
 
-        data = self._query(uri_path, params, sleep_seconds=0.1)
+        data = self._query(uri_path, params)
         return data
 
     def get_balances(self, address, search_after=None, limit=TXS_LIMIT_PER_QUERY, from_date=None, to_date=None):
@@ -169,7 +173,7 @@ class MintscanAPI:
         """
         # api truncates data to only one month if no fromDateTime.  So this is used to avoid this.
         if from_date is None:
-            from_date = "2016-01-01"
+            from_date = FROM_DATE_DEFAULT
 
         from_date_ts = from_date + " 00:00:00"
         to_date_ts = to_date + " 23:59:59" if to_date else None
@@ -193,7 +197,15 @@ def get_txs_page_count(ticker, address, max_txs, start_date=None, end_date=None)
     return num_pages
 
 
-def get_txs_all(ticker, address, max_txs, progress=None, start_date=None, end_date=None):
+def get_txs_all(ticker, address, max_txs, progress=None, start_date=None, end_date=None,
+                num_windows=MINTSCAN_FETCH_WINDOWS, known_txids=None):
+    """
+    known_txids: (optional) set of txids already fetched in previous run.  If specified, paging stops at
+                 first page containing a known txid (since all older txs are known).
+    """
+    if num_windows > 1 and not known_txids:
+        return _get_txs_all_windows(ticker, address, max_txs, progress, start_date, end_date, num_windows)
+
     api = MintscanAPI(ticker)
     max_pages = math.ceil(max_txs / TXS_LIMIT_PER_QUERY)
 
@@ -212,11 +224,112 @@ def get_txs_all(ticker, address, max_txs, progress=None, start_date=None, end_da
 
         if is_last_page:
             break
+        if known_txids and any(elem["txhash"] in known_txids for elem in elems):
+            break
+
+    out = remove_duplicates(out)
+    return out
 
+
+def _get_txs_all_windows(ticker, address, max_txs, progress, start_date, end_date, num_windows):
+    """ Same result as serial get_txs_all(), but pages date windows of [start_date, end_date] concurrently.
+
+    Windows are fetched newest first, so concatenating them reproduces the serial (newest first) page
+    stream.  First page of each window is probed to learn its tx count, so that windows beyond max_txs
+    are not fetched.
+    """
+    api = MintscanAPI(ticker)
+    max_elems = math.ceil(max_txs / TXS_LIMIT_PER_QUERY) * TXS_LIMIT_PER_QUERY
+    windows = _date_windows(start_date, end_date, num_windows)
+    fetcher = _WindowFetcher(api, address, progress)
+
+    if progress:
+        progress.report_message(f"Starting fetch stage ({len(windows)} date windows) ...")
+    with ThreadPoolExecutor(max_workers=MINTSCAN_FETCH_WORKERS) as executor:
+        probes = list(executor.map(fetcher.fetch_first_page, windows))
+
+        futures = []
+        remaining = max_elems
+        for window, probe in zip(windows, probes):
+            if remaining <= 0:
+                break
+            max_pages = math.ceil(remaining / TXS_LIMIT_PER_QUERY)
+            futures.append(executor.submit(fetcher.fetch_window, window, probe, max_pages))
+
+            total_txs = probe[3]
+            if total_txs is not None:
+                remaining -= total_txs
+
+        out = []
+        for future in futures:
+            out.extend(future.result())
+
+    out = out[:max_elems]
     out = remove_duplicates(out)
     return out
 
 
+def _date_windows(start_date, end_date, num_windows):
+    """ Splits [start_date, end_date] into at most num_windows (from_date, to_date) windows, newest first.
+
+    end_date=None is kept as open-ended to_date in newest window (same as serial query).
+    """
+    start = datetime.date.fromisoformat(start_date if start_date else FROM_DATE_DEFAULT)
+    end = datetime.date.fromisoformat(end_date) if end_date else datetime.datetime.utcnow().date()
+    num_days = (end - start).days + 1
+    if num_days <= 1:
+        return [(start_date, end_date)]
+
+    days_per_window = math.ceil(num_days / min(num_windows, num_days))
+    out = []
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + datetime.timedelta(days=days_per_window - 1), end)
+        out.append((window_start.isoformat(), window_end.isoformat()))
+        window_start = window_end + datetime.timedelta(days=1)
+
+    out[-1] = (out[-1][0], end_date)
+    out.reverse()
+    return out
+
+
+class _WindowFetcher:
+    """ Pages one date window at a time (called from worker threads) and reports combined progress. """
+
+    def __init__(self, api, address, progress):
+        self.api = api
+        self.address = address
+        self.progress = progress
+        self.pages_fetched = 0
+        self.lock = threading.Lock()
+
+    def _get_page(self, window, search_after):
+        from_date, to_date = window
+        result = self.api.get_txs(
+            self.address, search_after, limit=TXS_LIMIT_PER_QUERY, from_date=from_date, to_date=to_date)
+
+        with self.lock:
+            self.pages_fetched += 1
+            if self.progress:
+                self.progress.report(self.pages_fetched, f"Fetched page {self.pages_fetched} ...")
+        return result
+
+    def fetch_first_page(self, window):
+        return self._get_page(window, None)
+
+    def fetch_window(self, window, first_page, max_pages):
+        elems, search_after, is_last_page, _ = first_page
+        out = list(elems)
+
+        num_pages = 1
+        while not is_last_page and num_pages < max_pages:
+            elems, search_after, is_last_page, _ = self._get_page(window, search_after)
+            out.extend(elems)
+            num_pages += 1
+
+        return out
+
+
 def get_balances_all(ticker, address, max_txs, start_date=None, end_date=None):
     api = MintscanAPI(ticker)
     max_pages = math.ceil(max_txs / TXS_LIMIT_PER_QUERY)
@@ -1,40 +1,47 @@
 import ast
 import base64
-import binascii
-import functools
+import json
 import logging
 import math
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.parse import urlencode
-import requests
 from dateutil import parser
 
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.query import get_with_retries
 from staketaxcsv.common.ibc.constants import (
     EVENTS_TYPE_SENDER, EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SIGNER, EVENTS_TYPE_LIST_DEFAULT)
 from staketaxcsv.common.ibc.util_ibc import remove_duplicates
+from staketaxcsv.common.tx_store import get_tx_store
 from staketaxcsv.common.ibc.protobuf_decoder import (
     CosmosTransactionFeeExtractor,
     ProtobufParser,
     ProtobufParserCallback,
 )
 TXS_LIMIT_PER_QUERY = 50
+NORMALIZE_POOL_MIN_TXS = 2000  # decode in process pool when normalizing at least this many txs
+NORMALIZE_POOL_CHUNKSIZE = 200
+BLOCKCHAIN_MAX_HEIGHTS = 20  # max block headers returned by one /blockchain query
+BLOCK_TIME_WORKERS = 4
 
 
 class RpcAPI:
-    session = requests.Session()
+    session = http_transport.get_session()
     debug = False
 
+    # (node, height) -> block time, shared by all instances
+    block_time_cache = {}
+
     def __init__(self, node):
         self.node = node
 
     def _query(self, uri_path, query_params, sleep_seconds=0.0):
         url = f"{self.node}{uri_path}"
         logging.info("Requesting url %s?%s ...", url, urlencode(query_params))
+        http_transport.throttle(url, sleep_seconds)
         json_response = get_with_retries(self.session, url, query_params, {})
-
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
         return json_response
 
     def _block(self, height):
@@ -45,6 +52,14 @@ class RpcAPI:
 
         return data
 
+    def _blockchain(self, min_height, max_height):
+        uri_path = "/blockchain"
+        query_params = {"minHeight": min_height, "maxHeight": max_height}
+
+        data = self._query(uri_path, query_params, sleep_seconds=0.2)
+
+        return data
+
     def _txs_search(self, wallet_address, events_type, page, per_page):
         uri_path = "/tx_search"
         query_params = {"page": page, "per_page": per_page}
@@ -92,10 +107,23 @@ class RpcAPI:
 
         return elems, next_page, total_count_pages, total_count_txs
 
-    @functools.lru_cache
     def block_time(self, height):
-        data = self._block(height)
-        return data["result"]["block"]["header"]["time"]
+        key = (self.node, int(height))
+        if key not in RpcAPI.block_time_cache:
+            data = self._block(height)
+            RpcAPI.block_time_cache[key] = data["result"]["block"]["header"]["time"]
+        return RpcAPI.block_time_cache[key]
+
+    def block_times_range(self, min_height, max_height):
+        """ Returns dict of height -> block time for blocks in range (at most BLOCKCHAIN_MAX_HEIGHTS blocks) """
+        data = self._blockchain(min_height, max_height)
+
+        out = {}
+        for block_meta in data.get("result", {}).get("block_metas", []):
+            header = block_meta["header"]
+            out[int(header["height"])] = header["time"]
+            RpcAPI.block_time_cache[(self.node, int(header["height"]))] = header["time"]
+        return out
 
 
 def get_tx(node, txid, normalize=True):
@@ -159,83 +187,189 @@ def normalize_rpc_txns(node, elems, progress_rpc=None, stage_name=""):
     would have.
     Decodes base64 encoded fields as needed.
     """
-    for i, elem in enumerate(elems):
-        elem = _decode(elem)
+    num_elems = len(elems)
+
+    def _report(num, message):
+        if progress_rpc and stage_name:
+            progress_rpc.report(num, message, stage_name)
+
+    # Progress: decoding is reported as first half of stage, block time lookups as second half
+    def _report_decoded(i):
+        if i % NORMALIZE_POOL_CHUNKSIZE == 0:
+            _report(i // 2, "Decoded {} of {} elements...".format(i, num_elems))
+
+    def _report_block_times(num_done, num_heights):
+        _report(num_elems // 2 + (num_elems - num_elems // 2) * num_done // num_heights,
+                "Fetched block times for {} of {} blocks...".format(num_done, num_heights))
+
+    # Decode elems (cpu only), using process pool for large sets.  elems are modified in place.
+    if num_elems >= NORMALIZE_POOL_MIN_TXS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            decoded_elems = executor.map(_normalize_decode, elems, chunksize=NORMALIZE_POOL_CHUNKSIZE)
+            for i, (elem, decoded_elem) in enumerate(zip(elems, decoded_elems), 1):
+                elem.clear()
+                elem.update(decoded_elem)
+                _report_decoded(i)
+    else:
+        for i, elem in enumerate(elems, 1):
+            _normalize_decode(elem)
+            _report_decoded(i)
 
-        # add the txhash field
-        elem["txhash"] = elem["hash"]
+    # add the timestamp field
+    block_times = get_block_times(node, [elem["height"] for elem in elems], progress=_report_block_times)
+    for elem in elems:
+        _add_timestamp_from_block_time(elem, block_times)
 
-        # add code field
-        if "code" in elem["tx_result"]:
-            elem["code"] = elem["tx_result"]["code"]
+    _report(num_elems, "Normalized {} of {} elements...".format(num_elems, num_elems))
 
-        # add the timestamp field
-        _add_timestamp_from_block_time(elem, node)
 
-        # add the fee
-        _add_fee_from_cosmos_transaction_authinfo(elem)
+def _normalize_decode(elem):
+    """ Normalizes elem fields that do not require queries (all but timestamp).  Returns modified elem. """
+    elem = _decode(elem)
 
-        # add transaction messages
-        _add_messages_from_logs(elem)
+    # add the txhash field
+    elem["txhash"] = elem["hash"]
 
-        if progress_rpc and stage_name and i % 10 == 0:
-            progress_rpc.report(i, "Normalized {} of {} elements...".format(i, len(elems)), stage_name)
+    # add code field
+    if "code" in elem["tx_result"]:
+        elem["code"] = elem["tx_result"]["code"]
 
-    if progress_rpc and stage_name:
-        progress_rpc.report(len(elems), "Normalized {} of {} elements...".format(len(elems), len(elems)), stage_name)
+    # add the fee
+    _add_fee_from_cosmos_transaction_authinfo(elem)
+
+    # add transaction messages
+    _add_messages_from_logs(elem)
+
+    return elem
 
 
 def _decode(elem):
-    """ Modifies transaction data with decoded version """
-    try:
-        elem["tx_result"]["log"] = ast.literal_eval(elem["tx_result"]["log"])
-    except SyntaxError as e:
+    """ Modifies transaction data with decoded version.
+
+    Note: tx_result.events attributes are left base64 encoded, since processors only read tx_result.log
+    """
+    log = elem["tx_result"]["log"]
+    logs = _parse_log(log)
+    if logs is None:
         # Occurs with failed transactions.
         # Sample log element: "failed to execute message; message index: 0: ..."
-        elem["tx_result"]["log_original"] = elem["tx_result"]["log"]
-        elem["tx_result"]["log"] = []
-
-    events = elem["tx_result"]["events"]
-    for event in events:
-        for kv in event["attributes"]:
-            k, v = kv["key"], kv["value"]
-
-            try:
-                kv["key"] = base64.b64decode(k).decode() if k else ""
-                kv["value"] = base64.b64decode(v).decode() if v else ""
-            except binascii.Error as e:
-                pass
-            except UnicodeDecodeError as e:
-                pass
+        elem["tx_result"]["log_original"] = log
+        logs = []
+    elem["tx_result"]["log"] = logs
 
     elem["tx"] = base64.b64decode(elem["tx"])
 
     return elem
 
 
-def _add_timestamp_from_block_time(elem, node):
+def _parse_log(log):
+    """ Returns parsed log (json, or python literal in older nodes), or None if not parseable """
+    try:
+        return json.loads(log)
+    except ValueError:
+        pass
+
+    try:
+        return ast.literal_eval(log)
+    except SyntaxError:
+        return None
+
+
+def get_block_times(node, heights, progress=None):
     """
-    Add a timestamp field to an RPC element.
+    Returns dict of height (int) -> block time for heights.
+
+    Block times are looked up in memory, then in tx store (if enabled, persisted per node), then fetched
+    concurrently via /blockchain range queries (which return up to BLOCKCHAIN_MAX_HEIGHTS headers each).
+    Any heights still missing (i.e. node without /blockchain) fall back to /block queries.
+
+    progress: (optional) function(num_done, num_missing) called after each range query and /block query
     """
-    # since there isn't a timestamp on the RPC transaction data, we
-    # need to get the timestamp based on the block processing time
-    # it's also converted from the RPC format to the LCD format:
-    #     i.e. "2021-08-26T21:08:44.86954814Z" -> "2021-08-26T21:08:44Z"
-    height = elem["height"]
+    api = RpcAPI(node)
+    heights = sorted(set(int(height) for height in heights))
+    out = {height: RpcAPI.block_time_cache[(node, height)]
+           for height in heights if (node, height) in RpcAPI.block_time_cache}
+
+    # persisted block times
+    store = get_tx_store()
+    namespace = "blocktime:" + node
+    missing = [height for height in heights if height not in out]
+    if store and missing:
+        for height, block_time in store.get_many(namespace, [str(height) for height in missing]).items():
+            out[int(height)] = block_time
+            RpcAPI.block_time_cache[(node, int(height))] = block_time
+
+    # range queries
+    missing = [height for height in heights if height not in out]
+    ranges = _height_ranges(missing, BLOCKCHAIN_MAX_HEIGHTS)
+    if ranges:
+        logging.info("Fetching block times for %s heights using %s /blockchain queries ...", len(missing), len(ranges))
+    missing_set = set(missing)
+    num_done = 0
+    with ThreadPoolExecutor(max_workers=BLOCK_TIME_WORKERS) as executor:
+        for result in executor.map(lambda r: _block_times_range(api, *r), ranges):
+            out.update(result)
+            num_done += sum(1 for height in result if height in missing_set)
+            if progress:
+                progress(num_done, len(missing))
+
+    # single block queries
+    fallback = [height for height in missing if height not in out]
+    with ThreadPoolExecutor(max_workers=BLOCK_TIME_WORKERS) as executor:
+        for height, block_time in zip(fallback, executor.map(lambda h: _block_time(api, h), fallback)):
+            out[height] = block_time
+            num_done += 1
+            if progress:
+                progress(num_done, len(missing))
+
+    if store and missing:
+        store.put_many(namespace, [(str(height), out[height]) for height in missing])
 
+    return {height: out[height] for height in heights}
+
+
+def _height_ranges(heights, max_heights):
+    """ Returns list of (min_height, max_height) ranges, each spanning at most max_heights, covering sorted heights """
+    ranges = []
+    for height in heights:
+        if ranges and height < ranges[-1][0] + max_heights:
+            ranges[-1][1] = height
+        else:
+            ranges.append([height, height])
+    return [tuple(r) for r in ranges]
+
+
+def _block_times_range(api, min_height, max_height):
+    try:
+        return api.block_times_range(min_height, max_height)
+    except Exception as e:
+        logging.info("Unable to query /blockchain for heights %s-%s: %s", min_height, max_height, e)
+        return {}
+
+
+def _block_time(api, height):
     # Retry up to 5 times, in case of unstable server
     for i in range(5):
         try:
-            block_timestamp = RpcAPI(node).block_time(height)
-            break
+            return api.block_time(height)
         except KeyError as e:
             seconds = i * 2
             logging.info("KeyError.  Retrying in %s seconds", seconds)
             time.sleep(seconds)
             continue
+    return api.block_time(height)
+
 
-    block_timestamp = parser.parse(block_timestamp).strftime("%Y-%m-%dT%H:%M:%SZ")
-    elem["timestamp"] = block_timestamp
+def _add_timestamp_from_block_time(elem, block_times):
+    """
+    Add a timestamp field to an RPC element.
+    """
+    # since there isn't a timestamp on the RPC transaction data, we
+    # use the block processing time.
+    # it's also converted from the RPC format to the LCD format:
+    #     i.e. "2021-08-26T21:08:44.86954814Z" -> "2021-08-26T21:08:44Z"
+    block_timestamp = block_times[int(elem["height"])]
+    elem["timestamp"] = parser.parse(block_timestamp).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _add_fee_from_cosmos_transaction_authinfo(elem):
@@ -1,6 +1,14 @@
+import logging
+
 import staketaxcsv.common.ibc.api_rpc
 from staketaxcsv.common.ibc.util_ibc import remove_duplicates
 from staketaxcsv.common.ibc.api_rpc import TXS_LIMIT_PER_QUERY
+from staketaxcsv.common.tx_store import get_tx_store, write_through
+
+
+def tx_store_namespace(nodes):
+    """ Normalized rpc txs are stored in tx store under first node of chain """
+    return "rpc:" + nodes[0]
 
 
 def get_tx(nodes, txid):
@@ -36,14 +44,31 @@ def get_txs_all(nodes, wallet_address, max_txs, progress_rpc=None, limit=TXS_LIM
         cur_elems = staketaxcsv.common.ibc.api_rpc.get_txs_all(
             node, wallet_address, max_txs, progress=progress_rpc, limit=limit, stage_name=stage_name_fetch)
 
+        # use already normalized txs from tx store (if enabled)
+        stored = _stored_normalized(nodes, cur_elems)
+        cur_elems = [elem for elem in cur_elems if elem["hash"] not in stored]
+
         if progress_rpc:
             progress_rpc.update_estimate_node(node, len(cur_elems))
 
         # normalize data into lcd data processor
         staketaxcsv.common.ibc.api_rpc.normalize_rpc_txns(
             node, cur_elems, progress_rpc, stage_name=stage_name_normalize)
+        write_through(tx_store_namespace(nodes), cur_elems)
 
         elems.extend(cur_elems)
+        elems.extend(stored.values())
 
     elems = remove_duplicates(elems)
     return elems
+
+
+def _stored_normalized(nodes, elems):
+    """ Returns dict of txhash -> normalized tx, for txs in elems found in tx store """
+    store = get_tx_store()
+    if store is None:
+        return {}
+
+    stored = store.get_many(tx_store_namespace(nodes), [elem["hash"] for elem in elems])
+    logging.info("Found %s of %s txs in tx store.", len(stored), len(elems))
+    return stored
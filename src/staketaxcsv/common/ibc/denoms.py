@@ -1,14 +1,20 @@
 import json
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from staketaxcsv.common.ibc.api_lcd_v1 import LcdAPI_v1
 import staketaxcsv.common.ibc.constants as co
 from staketaxcsv.common.Cache import Cache
+from staketaxcsv.common import json_cache
 from staketaxcsv import settings_csv
 
 # downloaded from https://raw.githubusercontent.com/PulsarDefi/IBC-Token-Data-Cosmos/main/native_token_data.json
 PULSAR_DATA = os.path.dirname(os.path.realpath(__file__)) + "/pulsar_data.json"
 
+IBC_ADDRESS_REGEX = re.compile(r"ibc/[0-9A-Fa-f]{64}")
+PREFETCH_MAX_WORKERS = 8
+
 
 class IBCAddrs:
 
@@ -21,6 +27,7 @@ class IBCAddrs:
     }
 
     loaded = False
+    loaded_local = False
 
     @classmethod
     def ibc_address_to_denom(cls, node, ibc_address):
@@ -35,8 +42,34 @@ class IBCAddrs:
         IBCAddrs.addrs[ibc_address] = denom
         return denom
 
+    @classmethod
+    def prefetch(cls, node, elems, resolved=None):
+        """ Looks up (concurrently) denoms of all ibc addresses found in elems, so that processing elems
+        does not wait on lcd query per ibc address.
+
+        resolved: (optional) set of ibc addresses already resolved by other means (not looked up)
+        """
+        cls._load_cache()
+        if not node:
+            return
+
+        ibc_addresses = set(IBC_ADDRESS_REGEX.findall(json.dumps(elems)))
+        missing = sorted(ibc_addresses - set(IBCAddrs.addrs.keys()) - set(resolved or ()))
+        if not missing:
+            return
+
+        logging.info("Prefetching denoms for %s ibc addresses ...", len(missing))
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as executor:
+            denoms = list(executor.map(lambda ibc_address: _lookup_denom(node, ibc_address), missing))
+
+        for ibc_address, denom in zip(missing, denoms):
+            # Failed lookups are left to ibc_address_to_denom() (and its error handling) during processing
+            if denom:
+                IBCAddrs.addrs[ibc_address] = denom
+
     @classmethod
     def _load_cache(cls):
+        cls._load_local_cache()
         if not settings_csv.DB_CACHE:
             return
 
@@ -47,8 +80,19 @@ class IBCAddrs:
             IBCAddrs.loaded = True
             logging.info("Loaded cache into IBCAddrs.addrs ...")
 
+    @classmethod
+    def _load_local_cache(cls):
+        path = settings_csv.IBC_DENOM_CACHE_PATH
+        if not path or IBCAddrs.loaded_local:
+            return
+
+        IBCAddrs.addrs.update(json_cache.read(path))
+        IBCAddrs.loaded_local = True
+        logging.info("Loaded %s into IBCAddrs.addrs ...", path)
+
     @classmethod
     def set_cache(cls):
+        cls._set_local_cache()
         if not settings_csv.DB_CACHE:
             return
 
@@ -56,6 +100,23 @@ class IBCAddrs:
             Cache().set_ibc_addresses(IBCAddrs.addrs)
             logging.info("Set cache using IBCAddrs.addrs ...")
 
+    @classmethod
+    def _set_local_cache(cls):
+        path = settings_csv.IBC_DENOM_CACHE_PATH
+        if not path or not IBCAddrs.loaded_local:
+            return
+
+        json_cache.merge_write(path, {k: v for k, v in IBCAddrs.addrs.items() if v}, indent=2)
+        logging.info("Wrote IBCAddrs.addrs to %s ...", path)
+
+
+def _lookup_denom(node, ibc_address):
+    try:
+        return LcdAPI_v1(node).ibc_address_to_denom(ibc_address)
+    except Exception as e:
+        logging.warning("Unable to prefetch denom for ibc address %s, exception=%s", ibc_address, str(e))
+        return None
+
 
 class PulsarData:
 
@@ -0,0 +1,147 @@
+"""
+Fetch planner for LCD account txs (api_lcd_v1/api_lcd_v2 get_txs_all() and get_txs_pages_count()).
+
+  * Page 1 of each events type, fetched by get_txs_pages_count() to learn tx totals, is kept (ProbePages) and
+    reused by the following get_txs_all() instead of being requested again.
+  * Once totals are known, remaining pages of all events types are requested concurrently (at most
+    LCD_FETCH_WORKERS pages ahead).  Per-node request spacing is still enforced by http_transport.throttle().
+    Events types whose first page already contains a known txid (incremental run) get no further pages.
+  * Pages are consumed in serial order (events type, then page) and deduped as they arrive, so the result
+    (including early stop at known_txids) is the same as paging one events type after another.
+
+api: LcdAPI_v1 or LcdAPI_v2 (get_txs_page() returns (elems, has_more, total_count_txs) for page index)
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from staketaxcsv.settings_csv import LCD_FETCH_WORKERS
+
+PROBE_TTL_SECONDS = 600
+PROBE_MAX_ENTRIES = 100
+
+
+class ProbePages:
+
+    # (api class name, node, address, events_type, limit) -> (time, page)
+    pages = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def put(cls, key, page):
+        with cls.lock:
+            cls.pages.pop(key, None)
+            cls.pages[key] = (time.time(), page)
+            while len(cls.pages) > PROBE_MAX_ENTRIES:
+                cls.pages.pop(next(iter(cls.pages)))
+
+    @classmethod
+    def pop(cls, key):
+        with cls.lock:
+            entry = cls.pages.pop(key, None)
+        if entry is None or time.time() - entry[0] > PROBE_TTL_SECONDS:
+            return None
+        return entry[1]
+
+
+def _probe_key(api, address, events_type, limit):
+    return type(api).__name__, api.node, address, events_type, limit
+
+
+def probe(api, address, events_types, limit, sleep_seconds, workers=LCD_FETCH_WORKERS):
+    """ Returns first page of each events type (same order), and keeps them for get_pages_all() """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pages = list(executor.map(
+            lambda events_type: api.get_txs_page(address, events_type, 0, limit, sleep_seconds), events_types))
+
+    for events_type, page in zip(events_types, pages):
+        ProbePages.put(_probe_key(api, address, events_type, limit), page)
+    return pages
+
+
+def get_pages_all(api, address, events_types, limit, max_pages, sleep_seconds, progress=None,
+                  stage_name="default", known_txids=None, workers=LCD_FETCH_WORKERS):
+    """ Returns txs of all events types (deduped, sorted by timestamp), fetching at most max_pages per events type.
+
+    known_txids: (optional) set of txids already fetched in previous run.  If specified, paging of events type
+                 stops at first page containing a known txid (since all older txs are known).
+    """
+    if max_pages <= 0:
+        return []
+
+    def _fetch(events_type, index):
+        return api.get_txs_page(address, events_type, index, limit, sleep_seconds)
+
+    out = []
+    txids = set()
+    pages_total = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        first_pages = []
+        for events_type in events_types:
+            page = ProbePages.pop(_probe_key(api, address, events_type, limit))
+            first_pages.append(_completed(page) if page is not None else executor.submit(_fetch, events_type, 0))
+
+        # Remaining pages of each events type, as implied by its total in first page
+        plan = deque()
+        for events_type, first_page in zip(events_types, first_pages):
+            elems, has_more, total_count_txs = first_page.result()
+            if known_txids and any(elem["txhash"] in known_txids for elem in elems):
+                # Paging stops at first page
+                continue
+            num_pages = min(max_pages, math.ceil(total_count_txs / limit)) if has_more else 1
+            plan.extend((events_type, index) for index in range(1, num_pages))
+
+        pending = deque()
+        for events_type, first_page in zip(events_types, first_pages):
+            if progress:
+                progress.report_message(f"Starting fetch for event_type={events_type}")
+
+            index, page = 0, first_page
+            while True:
+                # Keep next planned pages (of any events type) in flight
+                while plan and len(pending) < max(1, workers):
+                    pending.append((*plan[0], executor.submit(_fetch, *plan.popleft())))
+
+                elems, has_more, _ = page.result()
+                for elem in elems:
+                    if elem["txhash"] not in txids:
+                        txids.add(elem["txhash"])
+                        out.append(elem)
+
+                pages_total += 1
+                if progress:
+                    message = f"Fetched page {index + 1} for {events_type} stage ..."
+                    progress.report(pages_total, message, stage_name)
+
+                index += 1
+                if not has_more or index >= max_pages:
+                    break
+                if known_txids and any(elem["txhash"] in known_txids for elem in elems):
+                    break
+
+                if pending and pending[0][0] == events_type:
+                    _, _, page = pending.popleft()
+                elif plan and plan[0][0] == events_type:
+                    page = executor.submit(_fetch, *plan.popleft())
+                else:
+                    # More pages than total implied (i.e. new txs since first page)
+                    page = executor.submit(_fetch, events_type, index)
+
+            # Drop planned pages not needed after early stop
+            while pending and pending[0][0] == events_type:
+                pending.popleft()[2].cancel()
+            while plan and plan[0][0] == events_type:
+                plan.popleft()
+
+    out.sort(key=lambda elem: elem["timestamp"], reverse=False)
+    return out
+
+
+def _completed(result):
+    future = Future()
+    future.set_result(result)
+    return future
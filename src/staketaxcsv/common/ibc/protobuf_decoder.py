@@ -1,5 +1,4 @@
 import io
-import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -8,7 +7,7 @@ from typing import List, Optional, Tuple
 
 class Varint:
     """
-    Constructs the integer encoded as a base 128 varint from a stream of bytes.
+    Constructs the integer encoded as a base 128 varint from a buffer of bytes.
     """
     _varint: int
     _shift: int
@@ -26,21 +25,37 @@ class Varint:
         return self._varint
 
     def from_bytes(self, byte_stream: io.BytesIO) -> None:
-        while True:
-            byte = byte_stream.read(1)
-            if byte == b"":
-                raise EOFError("unexpected end of byte sequence while parsing varint")
+        buffer = byte_stream.getbuffer()
+        offset = self.from_buffer(buffer, byte_stream.tell())
+        del buffer
+        byte_stream.seek(offset)
 
-            # single byte, so byte order doesn't matter
-            byte = int.from_bytes(byte, sys.byteorder)
+    def from_buffer(self, buffer: memoryview, offset: int) -> int:
+        """ Reads varint starting at buffer[offset] (without copying).  Returns offset after varint. """
+        self._varint, end_offset = decode_varint(buffer, offset)
+        self._shift = 7 * (end_offset - offset)
+        return end_offset
 
-            # add this byte's data into the varint
-            self._varint |= (byte & 0x7f) << self._shift
-            self._shift += 7
 
-            # if the most significant bit is set, there is another byte to read for this varint
-            if not byte & 0x80:
-                break
+def decode_varint(buffer: memoryview, offset: int) -> Tuple[int, int]:
+    """ Returns (value, offset after varint) for base 128 varint starting at buffer[offset] """
+    value = 0
+    shift = 0
+    buffer_size = len(buffer)
+    while True:
+        if offset >= buffer_size:
+            raise EOFError("unexpected end of byte sequence while parsing varint")
+
+        byte = buffer[offset]
+        offset += 1
+
+        # add this byte's data into the varint
+        value |= (byte & 0x7f) << shift
+        shift += 7
+
+        # if the most significant bit is set, there is another byte to read for this varint
+        if not byte & 0x80:
+            return value, offset
 
 
 class ProtobufWireType(Enum):
@@ -183,18 +198,20 @@ class ProtobufParser:
     Implements the encoding described here: https://developers.google.com/protocol-buffers/docs/encoding.
     """
 
-    _buffer: io.BytesIO
+    _buffer: memoryview
     _buffer_size: int
+    _offset: int
     _callback: ProtobufParserCallback
 
     def __init__(self, protobuf_bytes: bytes, callback: ProtobufParserCallback):
-        self._buffer = io.BytesIO(protobuf_bytes)
+        self._buffer = memoryview(protobuf_bytes)
         self._buffer_size = len(protobuf_bytes)
+        self._offset = 0
         self._callback = callback
 
     def parse(self) -> None:
         parser_stack: ProtobufParserStack = ProtobufParserStack()
-        while self._buffer.tell() < self._buffer_size:
+        while self._offset < self._buffer_size:
             # get the next field key
             wire_type, field_number = self._get_field_key()
 
@@ -202,7 +219,7 @@ class ProtobufParser:
             parser_stack.push_frame(field_number=field_number, end_of_field_offset=None)
             field_value, parse_embedded_message, embedded_message_length = self._get_field_value(wire_type, field_number, parser_stack)
             if parse_embedded_message:
-                parser_stack.update_frame(end_of_field_offset=self._buffer.tell() + embedded_message_length)
+                parser_stack.update_frame(end_of_field_offset=self._offset + embedded_message_length)
                 continue
 
             # callback the application with any values found
@@ -212,7 +229,7 @@ class ProtobufParser:
             # cleanup
             parser_stack.pop_frame()
             while frame := parser_stack.peek_frame():
-                if frame.end_of_field_offset != self._buffer.tell():
+                if frame.end_of_field_offset != self._offset:
                     break
 
                 parser_stack.pop_frame()
@@ -256,12 +273,12 @@ class ProtobufParser:
         # see what the user wants us to do
         action = self._callback.on_length_delimited_field(field_number, parser_stack.field_path)
 
-        # see if we should read the field_value
+        # see if we should read the field_value (skipped fields are not copied)
         field_value = None
-        if action in [ProtobufParserMessageAction.SKIP, ProtobufParserMessageAction.PARSE_AS_BYTES]:
-            temp_value = self._read_bytes(field_value_length)
-            if action == ProtobufParserMessageAction.PARSE_AS_BYTES:
-                field_value = temp_value
+        if action == ProtobufParserMessageAction.PARSE_AS_BYTES:
+            field_value = self._read_bytes(field_value_length)
+        elif action == ProtobufParserMessageAction.SKIP:
+            self._skip_bytes(field_value_length)
 
         return field_value, action == ProtobufParserMessageAction.PARSE_AS_MESSAGE, field_value_length
 
@@ -273,13 +290,18 @@ class ProtobufParser:
 
     def _read_varint(self) -> Varint:
         varint = Varint()
-        varint.from_bytes(self._buffer)
+        self._offset = varint.from_buffer(self._buffer, self._offset)
 
         return varint
 
     def _read_bytes(self, size: int) -> bytes:
-        bytes_read = self._buffer.read(size)
-        if bytes_read == b"":
+        start = self._offset
+        self._skip_bytes(size)
+
+        return self._buffer[start:self._offset].tobytes()
+
+    def _skip_bytes(self, size: int) -> None:
+        if size > 0 and self._offset >= self._buffer_size:
             raise EOFError("unexpected end of byte sequence while reading protobuf")
 
-        return bytes_read
+        self._offset = min(self._offset + size, self._buffer_size)
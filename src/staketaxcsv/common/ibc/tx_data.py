@@ -5,9 +5,13 @@ Simpler wrapper interface to get transaction data
 """
 
 import logging
+import math
 
+from staketaxcsv.common import incremental
 from staketaxcsv.common.ibc import api_mintscan_v1, api_lcd, api_rpc, api_rpc_multinode
 from staketaxcsv.common.ibc.api_mintscan_v1 import MintscanAPI
+from staketaxcsv.common.ibc.util_ibc import remove_duplicates
+from staketaxcsv.common.tx_store import get_tx_store, read_through, write_through
 
 
 class TxDataLcd:
@@ -17,9 +21,10 @@ class TxDataLcd:
         self.max_txs = max_txs
         self.api = api_lcd.make_lcd_api(lcd_node)
         self.limit_per_query = limit_per_query
+        self.namespace = "lcd:" + lcd_node
 
     def get_tx(self, txid):
-        return self.api.get_tx(txid)
+        return read_through(self.namespace, txid, self.api.get_tx)
 
     def get_txs_all(self, address, progress, start_date=None, end_date=None):
         # only include optional parameter limit if defined
@@ -27,7 +32,19 @@ class TxDataLcd:
         if self.limit_per_query:
             kwargs["limit"] = self.limit_per_query
 
-        return api_lcd.get_txs_all(self.lcd_node, address, self.max_txs, progress=progress, **kwargs)
+        stored = _stored_elems(self.namespace, address)
+        if stored:
+            kwargs["known_txids"] = set(elem["txhash"] for elem in stored)
+        elif incremental.known_txids(address):
+            # --incremental without tx store: older txs are already in saved rows
+            kwargs["known_txids"] = incremental.known_txids(address)
+
+        elems = api_lcd.get_txs_all(self.lcd_node, address, self.max_txs, progress=progress, **kwargs)
+
+        is_complete = stored is not None or len(elems) < int(self.max_txs)
+        out = _merge_stored(elems, stored)
+        _save_elems(self.namespace, address, elems, out, is_complete)
+        return out
 
     def get_txs_pages_count(self, address, start_date=None, end_date=None):
         # only include optional parameter limit if defined
@@ -44,13 +61,30 @@ class TxDataMintscan:
         self.ticker = ticker
         self.max_txs = max_txs
         self.api = MintscanAPI(ticker)
+        self.namespace = "mintscan:" + ticker
 
     def get_tx(self, txid):
-        return self.api.get_tx(txid)
+        return read_through(self.namespace, txid, self.api.get_tx)
 
     def get_txs_all(self, address, progress, start_date=None, end_date=None):
-        return api_mintscan_v1.get_txs_all(
-            self.ticker, address, self.max_txs, progress=progress, start_date=start_date, end_date=end_date)
+        stored = _stored_elems(self.namespace, address)
+        if stored:
+            stored = [elem for elem in stored if _in_date_range(elem, start_date, end_date)]
+            known_txids = set(elem["txhash"] for elem in stored)
+        else:
+            known_txids = None
+
+        elems = api_mintscan_v1.get_txs_all(
+            self.ticker, address, self.max_txs, progress=progress, start_date=start_date, end_date=end_date,
+            known_txids=known_txids)
+
+        # Same as full fetch, keep only newest pages worth of max_txs
+        max_elems = math.ceil(int(self.max_txs) / api_mintscan_v1.TXS_LIMIT_PER_QUERY) * \
+            api_mintscan_v1.TXS_LIMIT_PER_QUERY
+        is_complete = (stored is not None or len(elems) < max_elems) and start_date is None
+        out = _merge_stored(elems, stored)[-max_elems:]
+        _save_elems(self.namespace, address, elems, out, is_complete)
+        return out
 
     def get_txs_pages_count(self, address, start_date=None, end_date=None):
         return api_mintscan_v1.get_txs_page_count(
@@ -64,6 +98,9 @@ class TxDataRpc:
         self.max_txs = max_txs
 
     def get_tx(self, txid):
+        return read_through(api_rpc_multinode.tx_store_namespace(self.rpc_nodes), txid, self._get_tx)
+
+    def _get_tx(self, txid):
         return api_rpc_multinode.get_tx(self.rpc_nodes, txid)
 
     def get_txs_all(self, address, progress_rpc, limit=api_rpc.TXS_LIMIT_PER_QUERY):
@@ -73,3 +110,38 @@ class TxDataRpc:
     def get_txs_pages_count(self, address, progress_rpc=None, limit=api_rpc.TXS_LIMIT_PER_QUERY):
         return api_rpc_multinode.get_txs_pages_count(
             self.rpc_nodes, address, self.max_txs, progress_rpc=progress_rpc, limit=limit)
+
+
+def _stored_elems(namespace, address):
+    """ Returns stored txs from previous completed fetch for address (or None if not available) """
+    store = get_tx_store()
+    if store is None:
+        return None
+    return store.account_elems(namespace, address)
+
+
+def _merge_stored(elems, stored):
+    if not stored:
+        return elems
+    logging.info("Fetched %s txs.  Merging with %s txs from tx store ...", len(elems), len(stored))
+    return remove_duplicates(elems + stored)
+
+
+def _save_elems(namespace, address, fetched_elems, elems, is_complete):
+    """ Saves fetched txs to tx store.  Only records txids for address if elems includes all older txs. """
+    store = get_tx_store()
+    if store is None:
+        return
+
+    write_through(namespace, fetched_elems)
+    if is_complete:
+        store.add_account_txids(namespace, address, [elem["txhash"] for elem in elems])
+
+
+def _in_date_range(elem, start_date, end_date):
+    date = elem["timestamp"][:10]
+    if start_date and date < start_date:
+        return False
+    if end_date and date > end_date:
+        return False
+    return True
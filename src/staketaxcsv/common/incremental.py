@@ -0,0 +1,129 @@
+"""
+Incremental wallet reports (--incremental option).
+
+  * After a report, saves its rows and high-water mark (newest row timestamp/txid) to
+    <INCREMENTAL_DIR>/incremental.<ticker>.<wallet_address>.json
+  * On re-run, txhistory() only fetches/processes transactions since the high-water mark date.  Its rows are
+    merged into the saved rows (rows for txids already saved are dropped), so refreshes cost O(new txs).
+  * Saved state is ignored (full rebuild) if start_date/end_date options differ from the saved run.
+  * Fetchers that cannot filter by date (LCD) stop paging at the first page containing a txid of the saved
+    rows (see known_txids()), with or without the tx store.
+"""
+
+import logging
+import os
+from functools import wraps
+
+from staketaxcsv.common import json_cache
+from staketaxcsv.common.Exporter import Row
+from staketaxcsv.settings_csv import INCREMENTAL_DIR
+
+STATE_VERSION = 1
+ROW_FIELDS = [
+    "timestamp", "tx_type", "received_amount", "received_currency", "sent_amount", "sent_currency", "fee",
+    "fee_currency", "exchange", "wallet_address", "txid", "url", "z_index", "comment",
+]
+
+
+class IncrementalRun:
+
+    # During incremental txhistory(): wallet address and txids of its saved rows
+    wallet_address = None
+    known_txids = None
+
+
+def known_txids(address):
+    """ Returns txids of rows saved by previous run, if incremental report for address is running (else None) """
+    if IncrementalRun.known_txids and address == IncrementalRun.wallet_address:
+        return IncrementalRun.known_txids
+    return None
+
+
+def incremental_report(ticker, localconfig):
+    """
+    Decorator for txhistory(wallet_address).  When localconfig.incremental is set, resumes from
+    the high-water mark of the previous run and merges with its saved rows.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(wallet_address):
+            if not localconfig.incremental:
+                return func(wallet_address)
+
+            start_date, end_date = localconfig.start_date, localconfig.end_date
+            state = _read_state(ticker, wallet_address, start_date, end_date)
+
+            if state:
+                high_water_date = state["high_water"]["timestamp"][:10]
+                logging.info("Incremental report: fetching transactions since %s ...", high_water_date)
+                localconfig.start_date = max(start_date, high_water_date) if start_date else high_water_date
+                IncrementalRun.wallet_address = wallet_address
+                IncrementalRun.known_txids = set(x[ROW_FIELDS.index("txid")] for x in state["rows"])
+            try:
+                exporter = func(wallet_address)
+            finally:
+                localconfig.start_date = start_date
+                IncrementalRun.wallet_address = None
+                IncrementalRun.known_txids = None
+
+            if state:
+                _merge_rows(exporter, [_row_from_list(x) for x in state["rows"]])
+            _write_state(ticker, wallet_address, start_date, end_date, exporter)
+
+            return exporter
+
+        return wrapper
+
+    return decorator
+
+
+def _state_path(ticker, wallet_address):
+    return os.path.join(INCREMENTAL_DIR, f"incremental.{ticker}.{wallet_address}.json")
+
+
+def _read_state(ticker, wallet_address, start_date, end_date):
+    path = _state_path(ticker, wallet_address)
+    state = json_cache.read(path)
+
+    if state.get("version") != STATE_VERSION or not state.get("high_water"):
+        return None
+    if state["start_date"] != start_date or state["end_date"] != end_date:
+        logging.info("Incremental report: date options changed since previous run.  Running full report.")
+        return None
+
+    logging.info("Loaded %s rows from %s", len(state["rows"]), path)
+    return state
+
+
+def _write_state(ticker, wallet_address, start_date, end_date, exporter):
+    high_water = None
+    if exporter.rows:
+        newest = max(exporter.rows, key=lambda row: row.timestamp)
+        high_water = {"timestamp": newest.timestamp, "txid": newest.txid}
+
+    state = {
+        "version": STATE_VERSION,
+        "start_date": start_date,
+        "end_date": end_date,
+        "high_water": high_water,
+        "rows": [[getattr(row, field) for field in ROW_FIELDS] for row in exporter.rows],
+    }
+
+    path = _state_path(ticker, wallet_address)
+    json_cache.write(path, state)
+    logging.info("Wrote %s rows (high_water=%s) to %s", len(exporter.rows), high_water, path)
+
+
+def _merge_rows(exporter, saved_rows):
+    """ Adds saved rows to exporter.  New rows for txids already in saved rows are dropped. """
+    saved_txids = set(row.txid for row in saved_rows)
+    new_rows = [row for row in exporter.rows if row.txid not in saved_txids]
+    logging.info("Incremental report: merging %s new rows with %s saved rows", len(new_rows), len(saved_rows))
+
+    exporter.rows = saved_rows + new_rows
+    exporter.is_reverse = None
+
+
+def _row_from_list(values):
+    return Row(**dict(zip(ROW_FIELDS, values)))
@@ -0,0 +1,50 @@
+"""
+Local files shared across processes (i.e. json caches of looked up metadata).
+
+  * Files are written to a temp file and then renamed over path, so readers (in other processes) never see a
+    partially written file.
+  * merge_write() merges with current file contents, in case written by another process since loaded.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+
+def read(path):
+    """ Returns data in json file at path ({} if file does not exist) """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write(path, data, indent=None):
+    """ Writes data to json file at path """
+    with atomic_open(path, "w") as f:
+        json.dump(data, f, indent=indent, sort_keys=True)
+
+
+def merge_write(path, entries, keep=None, indent=None):
+    """ Updates json file (dict) at path with entries.
+
+    keep: (optional) function(key, value) returning False for entries of current file to drop (i.e. expired)
+    """
+    data = read(path)
+    if keep:
+        data = {k: v for k, v in data.items() if keep(k, v)}
+    data.update(entries)
+    write(path, data, indent)
+
+
+@contextmanager
+def atomic_open(path, mode="w"):
+    """ Yields file object for temp file, which replaces file at path once closed """
+    dirpath = os.path.dirname(path)
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath, exist_ok=True)
+
+    path_tmp = "{}.{}.tmp".format(path, os.getpid())
+    with open(path_tmp, mode) as f:
+        yield f
+    os.replace(path_tmp, path)
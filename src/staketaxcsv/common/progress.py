@@ -12,7 +12,7 @@ class Stage:
         self.current_task_number = task_number
 
     def seconds_remaining(self):
-        return self.seconds_per_task * (self.total_tasks - self.current_task_number)
+        return self.seconds_per_task * max(0, self.total_tasks - self.current_task_number)
 
 
 class Progress:
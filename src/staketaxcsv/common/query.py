@@ -3,6 +3,8 @@ import time
 from requests.exceptions import JSONDecodeError, Timeout
 REQUEST_TYPE_GET = "GET"
 REQUEST_TYPE_POST = "POST"
+STATUS_TOO_MANY_REQUESTS = 429
+MAX_RETRY_AFTER_SECONDS = 60
 
 
 def get_with_retries(session, url, params, headers, retries=4, backoff_factor=2):
@@ -22,6 +24,13 @@ def _make_request_with_retries(request_type, session, url, data, headers, retrie
                 response = session.get(url, params=data, headers=headers)
             elif request_type == REQUEST_TYPE_POST:
                 response = session.post(url, json=data, headers=headers)
+
+            if response.status_code == STATUS_TOO_MANY_REQUESTS and attempt < retries - 1:
+                wait_time = _retry_after_seconds(response, backoff_factor * (2 ** attempt))
+                logging.warning(f"Rate limited (429) on attempt {attempt + 1}.  Waiting {wait_time} seconds before retrying...")
+                time.sleep(wait_time)
+                continue
+
             return response.json()  # Parse and return JSON here
 
         except (JSONDecodeError, Timeout, TimeoutError) as e:
@@ -37,6 +46,15 @@ def _make_request_with_retries(request_type, session, url, data, headers, retrie
     raise Exception("Failed to fetch data after maximum retries.")
 
 
+def _retry_after_seconds(response, default):
+    """ Returns seconds to wait from Retry-After header (in seconds form), else default """
+    retry_after = response.headers.get("Retry-After")
+    try:
+        return min(max(float(retry_after), 0), MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        return default
+
+
 # Output: "0.45.13" >= 2.1.1: False"
 def version_ge(version1, version2):
     version1_parts = [int(part) for part in version1.split('.')]
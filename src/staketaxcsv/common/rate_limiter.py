@@ -0,0 +1,44 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """ Thread-safe token bucket.  acquire() blocks until a request is allowed under the rate limit. """
+
+    def __init__(self, rate, capacity=1):
+        """
+        rate: tokens (requests) added per second (<= 0 disables limit)
+        capacity: max tokens that can accumulate (i.e. allowed burst size)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1):
+        """ Blocks until tokens are available.  More tokens than capacity are taken in capacity-sized parts
+            (i.e. batch larger than allowed burst size), since they could never accumulate at once. """
+        if self.rate <= 0:
+            return
+
+        while tokens > self.capacity:
+            self._acquire(self.capacity)
+            tokens -= self.capacity
+        self._acquire(tokens)
+
+    def _acquire(self, tokens):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_seconds = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait_seconds)
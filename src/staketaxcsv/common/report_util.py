@@ -5,15 +5,21 @@ import os
 
 import staketaxcsv.api
 from staketaxcsv.common.ExporterTypes import (
-    FORMAT_DEFAULT, FORMATS, LP_TREATMENT_CHOICES, LP_TREATMENT_TRANSFERS)
+    FORMAT_DEFAULT, FORMATS, FORMATS_EXTRA, LP_TREATMENT_CHOICES, LP_TREATMENT_TRANSFERS)
 from staketaxcsv.common.BalExporter import BALANCES_HISTORICAL
 from staketaxcsv.settings_csv import (
     REPORTS_DIR, TICKER_AKT, TICKER_ALGO, TICKER_ARCH, TICKER_ATOM, TICKER_COSMOSPLUS,
-    TICKER_COSMOSPLUS2, TICKER_EVMOS, TICKER_JUNO, TICKER_LUNA1, TICKER_LUNA2, TICKER_OSMO,
-    TICKER_SAGA, TICKER_SOL, TICKER_STRD, TICKER_TIA)
+    TICKER_COSMOSPLUS2, TICKER_DYDX, TICKER_DYM, TICKER_EVMOS, TICKER_HUAHUA, TICKER_INJ, TICKER_JUNO,
+    TICKER_LUNA1, TICKER_LUNA2, TICKER_NTRN, TICKER_OSMO, TICKER_SAGA, TICKER_SEI, TICKER_SOL, TICKER_STARS,
+    TICKER_STRD, TICKER_TIA)
 from staketaxcsv import settings_csv
 
 ALL = "all"
+# Reports with txhistory() decorated by @incremental_report
+INCREMENTAL_TICKERS = [
+    TICKER_AKT, TICKER_ARCH, TICKER_ATOM, TICKER_COSMOSPLUS2, TICKER_DYDX, TICKER_DYM, TICKER_EVMOS,
+    TICKER_HUAHUA, TICKER_INJ, TICKER_NTRN, TICKER_OSMO, TICKER_SEI, TICKER_SOL, TICKER_STARS, TICKER_STRD,
+    TICKER_TIA]
 STAKETAX_DEBUG_CACHE = "STAKETAX_DEBUG_CACHE"
 STAKETAX_CACHE = "STAKETAX_CACHE"
 
@@ -49,7 +55,7 @@ def parse_args(ticker):
         "--format",
         type=str,
         default=FORMAT_DEFAULT,
-        choices=[ALL] + FORMATS,
+        choices=[ALL] + FORMATS + FORMATS_EXTRA,
     )
     parser.add_argument(
         "--txid",
@@ -107,6 +113,13 @@ def parse_args(ticker):
             type=str,
             help="(YYYY-MM-DD) Only include transactions before end_date (inclusive)",
         )
+    if ticker in INCREMENTAL_TICKERS:
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            default=False,
+            help="Only fetch/process transactions since previous --incremental run, and merge with its rows.",
+        )
     if ticker in [TICKER_LUNA1, TICKER_OSMO, TICKER_ALGO]:
         parser.add_argument(
             "--lp_treatment",
@@ -210,6 +223,8 @@ def parse_args(ticker):
         options["exclude_asas"] = args.exclude_asas
     if "track_block" in args and args.track_block:
         options["track_block"] = True
+    if "incremental" in args and args.incremental:
+        options["incremental"] = True
     if "cosmosplus_node" in args:
         options["cosmosplus_node"] = args.cosmosplus_node
     if "cosmosplus_ticker" in args:
@@ -233,3 +248,4 @@ def read_common_options(localconfig, options):
     localconfig.debug = options.get("debug", False)
     localconfig.limit = options.get("limit", localconfig.limit)
     localconfig.koinlynullmap = options.get("koinlynullmap", localconfig.koinlynullmap)
+    localconfig.incremental = options.get("incremental", localconfig.incremental)
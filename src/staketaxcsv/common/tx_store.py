@@ -0,0 +1,208 @@
+"""
+Persistent on-disk store of raw transaction data, shared by all chain fetchers.
+
+  * Enabled by setting STAKETAX_TX_STORE_PATH=<path to sqlite file>.
+  * Transactions are keyed by (namespace, txid).  namespace identifies chain and data source
+    (i.e. "mintscan:ATOM", "lcd:<node>", "SOL"), since raw tx format differs per source.
+  * Also keeps index of txids per (namespace, address) from completed fetches, so repeat reports
+    can stop paging once they reach already stored transactions.
+  * Least recently used transactions are evicted when store exceeds STAKETAX_TX_STORE_MAX_MB.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from staketaxcsv import settings_csv
+
+EVICT_TARGET_RATIO = 0.9  # on eviction, shrink store to this fraction of max size
+SQL_MAX_VARS = 500
+
+
+class TxStore:
+
+    def __init__(self, path, max_bytes):
+        dirpath = os.path.dirname(path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS txs ("
+            "namespace TEXT, txid TEXT, data BLOB, size INTEGER, accessed REAL, "
+            "PRIMARY KEY (namespace, txid))")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS txs_accessed ON txs (accessed)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS account_txs ("
+            "namespace TEXT, address TEXT, txid TEXT, "
+            "PRIMARY KEY (namespace, address, txid))")
+
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM txs").fetchone()[0]
+
+    def get(self, namespace, txid):
+        return self.get_many(namespace, [txid]).get(txid)
+
+    def get_many(self, namespace, txids):
+        """ Returns dict of txid -> data, for txids found in store """
+        out = {}
+        txids = list(txids)
+        with self.lock:
+            for i in range(0, len(txids), SQL_MAX_VARS):
+                chunk = txids[i:i + SQL_MAX_VARS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT txid, data FROM txs WHERE namespace = ? AND txid IN ({placeholders})",
+                    [namespace] + chunk).fetchall()
+                for txid, data in rows:
+                    out[txid] = json.loads(zlib.decompress(data))
+
+                self.conn.execute(
+                    f"UPDATE txs SET accessed = ? WHERE namespace = ? AND txid IN ({placeholders})",
+                    [time.time(), namespace] + chunk)
+        return out
+
+    def put(self, namespace, txid, data):
+        self.put_many(namespace, [(txid, data)])
+
+    def put_many(self, namespace, items):
+        """ items: list of (txid, data) """
+        now = time.time()
+        rows = []
+        for txid, data in items:
+            blob = zlib.compress(json.dumps(data).encode("utf-8"))
+            rows.append((namespace, txid, blob, len(blob), now))
+        if not rows:
+            return
+
+        with self.lock:
+            self.conn.execute("BEGIN")
+            for row in rows:
+                prev = self.conn.execute(
+                    "SELECT size FROM txs WHERE namespace = ? AND txid = ?", row[:2]).fetchone()
+                if prev:
+                    self.total_bytes -= prev[0]
+                self.conn.execute("INSERT OR REPLACE INTO txs VALUES (?, ?, ?, ?, ?)", row)
+                self.total_bytes += row[3]
+            self.conn.execute("COMMIT")
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """ Deletes least recently accessed transactions until store is under target size """
+        target_bytes = self.max_bytes * EVICT_TARGET_RATIO
+        logging.info("Evicting from tx store (total_bytes=%s, max_bytes=%s) ...", self.total_bytes, self.max_bytes)
+
+        cursor = self.conn.execute("SELECT namespace, txid, size FROM txs ORDER BY accessed")
+        evicted = []
+        for namespace, txid, size in cursor:
+            if self.total_bytes <= target_bytes:
+                break
+            evicted.append((namespace, txid))
+            self.total_bytes -= size
+        cursor.close()
+
+        self.conn.execute("BEGIN")
+        self.conn.executemany("DELETE FROM txs WHERE namespace = ? AND txid = ?", evicted)
+        self.conn.execute("COMMIT")
+        logging.info("Evicted %s transactions from tx store.", len(evicted))
+
+    def account_txids(self, namespace, address):
+        """ Returns set of txids recorded for address from previous completed fetch """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT txid FROM account_txs WHERE namespace = ? AND address = ?", (namespace, address)).fetchall()
+        return set(row[0] for row in rows)
+
+    def add_account_txids(self, namespace, address, txids):
+        with self.lock:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO account_txs VALUES (?, ?, ?)",
+                [(namespace, address, txid) for txid in txids])
+            self.conn.execute("COMMIT")
+
+    def account_elems(self, namespace, address):
+        """ Returns stored tx data for all txids recorded for address.  Returns None if any were evicted. """
+        txids = self.account_txids(namespace, address)
+        if not txids:
+            return None
+
+        elems = self.get_many(namespace, txids)
+        if len(elems) < len(txids):
+            logging.info("tx store missing %s of %s txs for address=%s.  Ignoring stored txs.",
+                         len(txids) - len(elems), len(txids), address)
+            return None
+        return list(elems.values())
+
+
+class TxStores:
+
+    # path -> TxStore
+    stores = {}
+    lock = threading.Lock()
+
+
+def get_tx_store():
+    """ Returns shared TxStore, or None if STAKETAX_TX_STORE_PATH not set """
+    path = settings_csv.TX_STORE_PATH
+    if not path:
+        return None
+
+    with TxStores.lock:
+        if path not in TxStores.stores:
+            max_bytes = int(settings_csv.TX_STORE_MAX_MB) * 1024 * 1024
+            TxStores.stores[path] = TxStore(path, max_bytes)
+        return TxStores.stores[path]
+
+
+def read_through(namespace, txid, fetch_func, valid=None):
+    """ Returns tx data for txid from store if present.  Otherwise, returns fetch_func(txid) and stores result.
+
+    valid: (optional) function(data) -> bool.  Only results that pass are stored (default: non-empty results).
+    """
+    store = get_tx_store()
+    if store is None:
+        return fetch_func(txid)
+
+    data = store.get(namespace, txid)
+    if data is not None:
+        return data
+
+    data = fetch_func(txid)
+    if data and (valid is None or valid(data)):
+        store.put(namespace, txid, data)
+    return data
+
+
+def read_through_many(namespace, txids, fetch_many_func, valid=None):
+    """ Same as read_through(), for list of txids.  Returns list of tx data in same order as txids.
+
+    fetch_many_func: function(txids) -> list of tx data in same order, called only for txids not in store.
+    """
+    store = get_tx_store()
+    stored = store.get_many(namespace, txids) if store else {}
+
+    missing = [txid for txid in txids if txid not in stored]
+    fetched = dict(zip(missing, fetch_many_func(missing))) if missing else {}
+    if store:
+        store.put_many(namespace, [
+            (txid, data) for txid, data in fetched.items() if data and (valid is None or valid(data))])
+
+    return [stored[txid] if txid in stored else fetched[txid] for txid in txids]
+
+
+def write_through(namespace, elems, tx_hash_key="txhash"):
+    """ Saves list of fetched tx data to store (if enabled) """
+    store = get_tx_store()
+    if store is None:
+        return
+    store.put_many(namespace, [(elem[tx_hash_key], elem) for elem in elems])
@@ -2,11 +2,10 @@ import json
 import logging
 import math
 import os
-import time
 from urllib.parse import urlencode
 
-import requests
 from dateutil import parser
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.debug_util import debug_cache
 from staketaxcsv.common.ibc.constants import (
     EVENTS_TYPE_SENDER, EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SIGNER, EVENTS_TYPE_LIST_DEFAULT)
@@ -17,7 +16,7 @@ TXS_LIMIT_PER_QUERY = 50
 
 
 class FetRpcAPI:
-    session = requests.Session()
+    session = http_transport.get_session()
 
     def __init__(self, node):
         self.node = node
@@ -25,10 +24,8 @@ class FetRpcAPI:
     def _query(self, uri_path, query_params, sleep_seconds=0):
         url = f"{self.node}{uri_path}"
         logging.info("Requesting url %s?%s ...", url, urlencode(query_params))
+        http_transport.throttle(url, sleep_seconds)
         response = self.session.get(url, params=query_params)
-
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
         return response.json()
 
     @debug_cache(REPORTS_DIR)
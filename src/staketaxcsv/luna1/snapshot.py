@@ -0,0 +1,77 @@
+"""
+Frozen local snapshot of Terra Classic (LUNA1) history.
+
+  * Enabled by setting STAKETAX_LUNA1_SNAPSHOT_PATH=<path to sqlite file>.
+  * Keeps fetched FCD txs (per wallet) and contract histories (init msgs) permanently (never evicted, unlike
+    the shared tx store), since Terra Classic history does not change.
+  * Later reports for a wallet are served from the snapshot, only fetching txs newer than its last stored
+    height from FCD.
+"""
+
+import math
+import threading
+
+from staketaxcsv import settings_csv
+from staketaxcsv.common.tx_store import TxStore
+
+NAMESPACE_TXS = "fcd:LUNA1"
+NAMESPACE_CONTRACT_HISTORY = "lcd:LUNA1:contract_history"
+
+
+class Snapshots:
+
+    # path -> TxStore
+    stores = {}
+    lock = threading.Lock()
+
+
+def get_snapshot_store():
+    """ Returns snapshot TxStore, or None if STAKETAX_LUNA1_SNAPSHOT_PATH not set """
+    path = settings_csv.LUNA1_SNAPSHOT_PATH
+    if not path:
+        return None
+
+    with Snapshots.lock:
+        if path not in Snapshots.stores:
+            Snapshots.stores[path] = TxStore(path, math.inf)
+        return Snapshots.stores[path]
+
+
+def stored_txs(address):
+    """ Returns snapshot txs from previous completed fetch for address (or None if not available) """
+    store = get_snapshot_store()
+    if store is None:
+        return None
+    return store.account_elems(NAMESPACE_TXS, address)
+
+
+def last_height(elems):
+    return max(int(elem["height"]) for elem in elems) if elems else None
+
+
+def save_txs(address, fetched_elems, elems, is_complete):
+    """ Saves fetched txs to snapshot.  Only records txids for address if elems includes all older txs. """
+    store = get_snapshot_store()
+    if store is None:
+        return
+
+    store.put_many(NAMESPACE_TXS, [(elem["txhash"], elem) for elem in fetched_elems])
+    if is_complete:
+        store.add_account_txids(NAMESPACE_TXS, address, [elem["txhash"] for elem in elems])
+
+
+def contract_history(contract, fetch_func):
+    """ Returns contract history from snapshot if present.  Otherwise, returns fetch_func(contract) and
+        saves result (if it has entries). """
+    store = get_snapshot_store()
+    if store is None:
+        return fetch_func(contract)
+
+    data = store.get(NAMESPACE_CONTRACT_HISTORY, contract)
+    if data is not None:
+        return data
+
+    data = fetch_func(contract)
+    if data and data.get("entries"):
+        store.put(NAMESPACE_CONTRACT_HISTORY, contract, data)
+    return data
@@ -4,6 +4,7 @@ import base64
 import json
 import logging
 
+from staketaxcsv.luna1 import snapshot
 from staketaxcsv.luna1.api_lcd import LcdAPI
 from staketaxcsv.luna1.config_luna1 import localconfig
 from staketaxcsv.luna1.constants import CUR_UST
@@ -440,7 +441,7 @@ def _query_lp_address(addr, txid):
 
 
 def _query_wasm(addr):
-    data = LcdAPI.contract_history(addr)
+    data = snapshot.contract_history(addr, LcdAPI.contract_history)
 
     init_msg = data["entries"][0]["msg"]
 
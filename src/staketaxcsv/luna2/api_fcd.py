@@ -1,17 +1,18 @@
 import logging
-import time
 
-import requests
+from staketaxcsv.common import http_transport
 from staketaxcsv.common.debug_util import debug_cache
 from staketaxcsv.luna1.config_luna1 import localconfig
 from staketaxcsv.settings_csv import REPORTS_DIR
 
 FCD_URL = "https://fcd.phoenix-foundation.dev"
 LIMIT_FCD = 100
+FCD_REQUESTS_PER_SECOND = 0.2
 
 
 class FcdAPI:
-    session = requests.Session()
+    session = http_transport.get_session()
+    http_transport.set_host_rate(FCD_URL, FCD_REQUESTS_PER_SECOND)
 
     @classmethod
     def get_tx(cls, txhash):
@@ -38,7 +39,6 @@ class FcdAPI:
         logging.info("Querying FCD url=%s...", url)
         response = cls.session.get(url)
         data = response.json()
-        time.sleep(5)
         return data
 
     @classmethod
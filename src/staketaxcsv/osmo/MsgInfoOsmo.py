@@ -1,5 +1,6 @@
 import json
 import pprint
+from functools import cached_property
 
 from staketaxcsv.common.ibc.MsgInfoIBC import MsgInfoIBC
 from staketaxcsv.osmo.constants import MSG_TYPE_EXECUTE_CONTRACT
@@ -10,9 +11,11 @@ class MsgInfoOsmo(MsgInfoIBC):
 
     def __init__(self, wallet_address, msg_index, message, log, lcd_node):
         super().__init__(wallet_address, msg_index, message, log, lcd_node)
-        self.events_by_type = self._events_by_type()
         self.execute_contract_message = self._execute_contract_message()
-        self.events_as_dict = self._events_as_dict(self.events)
+
+    @cached_property
+    def events_as_dict(self):
+        return self._events_as_dict(self.events)
 
     def amount_currency_single(self, amount_raw, currency_raw):
         return denoms_osmo.amount_currency_from_raw(amount_raw, currency_raw, self.lcd_node)
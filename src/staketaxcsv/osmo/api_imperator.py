@@ -1,14 +1,14 @@
-import time
 from urllib.parse import quote
 
+from staketaxcsv.common import http_transport
 from staketaxcsv.osmo.api_util import APIUtil
 
 OSMO_HISTORICAL_API_NETLOC = "api-osmosis.imperator.co"
 
 
 def _query(uri_path, query_params):
+    http_transport.throttle(OSMO_HISTORICAL_API_NETLOC, 1)
     result = APIUtil.query_get(OSMO_HISTORICAL_API_NETLOC, uri_path, query_params)
-    time.sleep(1)
     return result
 
 
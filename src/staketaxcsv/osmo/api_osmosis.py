@@ -1,14 +1,15 @@
-import time
+import logging
 from urllib.parse import quote
 
+from staketaxcsv.common import http_transport
 from staketaxcsv.osmo.api_util import APIUtil
 
 OSMO_API_NETLOC = "sqsprod.osmosis.zone"
 
 
 def _query(uri_path, query_params):
+    http_transport.throttle(OSMO_API_NETLOC, 1)
     result = APIUtil.query_get(OSMO_API_NETLOC, uri_path, query_params)
-    time.sleep(1)
     return result
 
 
@@ -25,3 +26,20 @@ def get_token_metadata(ibc_address) -> str or None:
         return symbol, decimals
     else:
         return None, None
+
+
+def get_tokens_metadata(denoms) -> dict:
+    """ Returns dict of <denom> -> {"symbol": .., "decimals": .., ...} for multiple denoms in one query.
+        Denoms unknown to the api are missing (or the whole query may fail, returning {}). """
+    uri_path = "/tokens/metadata"
+    query_params = {"denoms": ",".join(quote(denom) for denom in denoms)}
+
+    try:
+        data = _query(uri_path, query_params)
+    except Exception as e:
+        logging.warning("Unable to query token metadata for %s denoms, exception=%s", len(denoms), str(e))
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+    return {denom: data[denom] for denom in denoms if isinstance(data.get(denom), dict)}
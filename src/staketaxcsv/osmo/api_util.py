@@ -1,13 +1,13 @@
 import logging
 from urllib.parse import urlencode, urlunparse
 
-import requests
+from staketaxcsv.common import http_transport
 
 SCHEME = "https"
 
 
 class APIUtil:
-    session = requests.Session()
+    session = http_transport.get_session()
 
     @classmethod
     def query_get(cls, netloc, uri_path, query_params):
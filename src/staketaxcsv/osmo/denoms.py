@@ -1,6 +1,19 @@
+import logging
+import re
+import time
+
 from staketaxcsv.osmo.config_osmo import localconfig
 from staketaxcsv.osmo import api_osmosis
+from staketaxcsv.common import json_cache
 from staketaxcsv.common.ibc import denoms as denoms_common
+from staketaxcsv import settings_csv
+
+# i.e. "5000000uosmo", "899999999ibc/27394FB...,1252125015450ibc/9712DBB..."
+AMOUNTS_REGEX = re.compile(r"^\d+[a-z][a-zA-Z0-9/:._-]{1,127}(,\d+[a-z][a-zA-Z0-9/:._-]{1,127})*$")
+AMOUNT_REGEX = re.compile(r"^(\d+)(.*)")
+METADATA_BATCH_SIZE = 50
+METADATA_MAX_SPLIT_DEPTH = 4  # max times a failed batch query is split in half to isolate unknown denoms
+COIN_EVENT_TYPES = ["coin_received", "coin_spent", "transfer"]  # events with "amount" attribute of coins
 
 
 def amount_currency_from_raw(amount_raw, currency_raw, lcd_node):
@@ -19,15 +32,131 @@ def _amount_currency_from_api_osmosis(amount_raw, currency_raw):
         symbol, decimals = localconfig.token_metadata[currency_raw]
     else:
         symbol, decimals = api_osmosis.get_token_metadata(currency_raw)
+        TokenMetadata.add(currency_raw, symbol, decimals)
+        symbol, decimals = localconfig.token_metadata[currency_raw]
+
+    if not symbol or not decimals:
+        return None, None
+
+    amount = float(amount_raw) / float(10 ** decimals)
+    return amount, symbol
 
+
+class TokenMetadata:
+    """ Resolves localconfig.token_metadata for many denoms in batched osmosis api queries, and persists it
+    (with a ttl) to STAKETAX_OSMO_TOKEN_METADATA_CACHE_PATH if set. """
+
+    # <denom> -> epoch seconds when metadata was fetched
+    fetched_at = {}
+    loaded_local = False
+
+    @classmethod
+    def reset(cls):
+        """ Forgets state tied to localconfig.token_metadata (i.e. when localconfig is reset between jobs) """
+        cls.fetched_at = {}
+        cls.loaded_local = False
+
+    @classmethod
+    def add(cls, denom, symbol, decimals):
         # i.e. USDC.eth.axl -> USDC
         if symbol and "." in symbol:
             symbol = symbol.split(".")[0]
 
-        localconfig.token_metadata[currency_raw] = (symbol, decimals)
+        localconfig.token_metadata[denom] = (symbol, decimals)
+        cls.fetched_at[denom] = time.time()
 
-    if not symbol or not decimals:
-        return None, None
+    @classmethod
+    def prefetch(cls, elems):
+        """ Looks up metadata of all denoms found in elems, in batches, so that processing elems
+        does not wait on osmosis api query per denom. """
+        cls._load_local_cache()
 
-    amount = float(amount_raw) / float(10 ** decimals)
-    return amount, symbol
+        missing = sorted(_denoms(elems) - set(localconfig.token_metadata.keys()))
+        if not missing:
+            return
+
+        logging.info("Prefetching token metadata for %s denoms ...", len(missing))
+        for i in range(0, len(missing), METADATA_BATCH_SIZE):
+            cls._prefetch_batch(missing[i:i + METADATA_BATCH_SIZE])
+
+    @classmethod
+    def resolved(cls):
+        """ Returns set of denoms with known symbol and decimals (i.e. no lcd fallback needed) """
+        return set(denom for denom, (symbol, decimals) in localconfig.token_metadata.items() if symbol and decimals)
+
+    @classmethod
+    def _prefetch_batch(cls, denoms, depth=0):
+        data = api_osmosis.get_tokens_metadata(denoms)
+
+        if not data and len(denoms) > 1 and depth < METADATA_MAX_SPLIT_DEPTH:
+            # Query may fail as a whole because of one unknown denom: split to isolate it
+            mid = len(denoms) // 2
+            cls._prefetch_batch(denoms[:mid], depth + 1)
+            cls._prefetch_batch(denoms[mid:], depth + 1)
+            return
+
+        if not data and len(denoms) == 1:
+            # Unknown to osmosis api: record as unresolved, so that processing does not query it again
+            cls.add(denoms[0], None, None)
+            return
+
+        # Denoms missing from result (or in failed batch at max split depth) are left to per-denom lookup
+        # during processing
+        for denom, info in data.items():
+            cls.add(denom, info.get("symbol", None), info.get("decimals", None))
+
+    @classmethod
+    def _load_local_cache(cls):
+        path = settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH
+        if not path or cls.loaded_local:
+            return
+
+        for denom, (symbol, decimals, fetched_at) in _read_local_cache(path).items():
+            if denom not in localconfig.token_metadata:
+                localconfig.token_metadata[denom] = (symbol, decimals)
+                cls.fetched_at[denom] = fetched_at
+        cls.loaded_local = True
+        logging.info("Loaded %s into localconfig.token_metadata ...", path)
+
+    @classmethod
+    def set_cache(cls):
+        path = settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH
+        if not path or not cls.loaded_local:
+            return
+
+        entries = {}
+        for denom, (symbol, decimals) in localconfig.token_metadata.items():
+            if denom in cls.fetched_at and symbol and decimals:
+                entries[denom] = (symbol, decimals, cls.fetched_at[denom])
+        json_cache.merge_write(path, entries, keep=_is_fresh, indent=2)
+        logging.info("Wrote localconfig.token_metadata to %s ...", path)
+
+
+def _read_local_cache(path):
+    """ Returns dict of <denom> -> [symbol, decimals, fetched_at] for entries not older than ttl """
+    return {denom: entry for denom, entry in json_cache.read(path).items() if _is_fresh(denom, entry)}
+
+
+def _is_fresh(denom, entry):
+    return entry[2] >= time.time() - float(settings_csv.OSMO_TOKEN_METADATA_TTL_DAYS) * 86400
+
+
+def _denoms(elems):
+    """ Returns set of denoms in coin events ("amount" attribute) and coin dicts ({"denom", "amount"}) in elems """
+    out = set()
+    stack = [elems]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if isinstance(obj.get("denom"), str) and "amount" in obj:
+                out.add(obj["denom"])
+            elif obj.get("type") in COIN_EVENT_TYPES and isinstance(obj.get("attributes"), list):
+                for attribute in obj["attributes"]:
+                    value = attribute.get("value")
+                    if attribute.get("key") == "amount" and isinstance(value, str) and AMOUNTS_REGEX.match(value):
+                        for amt_string in value.split(","):
+                            out.add(AMOUNT_REGEX.match(amt_string).group(2))
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return out
@@ -11,9 +11,11 @@ from staketaxcsv.common.ibc import api_lcd, historical_balances
 from staketaxcsv.akt.config_akt import localconfig
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.settings_csv import AKT_NODE, TICKER_AKT, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -52,6 +54,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_AKT, localconfig)
 def txhistory(wallet_address):
     """ Configure localconfig based on options dictionary. """
     start_date, end_date = localconfig.start_date, localconfig.end_date
@@ -67,6 +70,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(AKT_NODE, elems)
     staketaxcsv.akt.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
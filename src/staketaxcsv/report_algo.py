@@ -7,10 +7,12 @@ Prints transactions and writes CSV(s) to _reports/ALGO.<walletaddress>.<format>.
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import staketaxcsv.algo.processor
 from staketaxcsv.algo.api.indexer import Indexer
 from staketaxcsv.algo.api.nfdomains import NFDomains
+from staketaxcsv.algo.asset import Asset
 from staketaxcsv.algo.config_algo import localconfig
 from staketaxcsv.algo.dapp import Dapp
 from staketaxcsv.algo.progress_algo import ProgressAlgo
@@ -116,9 +118,11 @@ def txhistory(wallet_address):
 
         # Retrieve data
         elems = _get_txs(wallet_address, dapps, progress)
+        Asset.prefetch(elems)
 
         # Create rows for CSV
         staketaxcsv.algo.processor.process_txs(wallet_address, dapps, elems, exporter, progress)
+        Asset.save_catalog()
 
         _write_persistent_config(wallet_address)
     else:
@@ -132,7 +136,12 @@ def txhistory(wallet_address):
 
 
 def _get_txs(wallet_address, dapps, progress):
-    out = indexer.get_all_transactions(wallet_address)
+    # Fetch account transactions and dapp extra transactions (i.e. storage address histories) concurrently
+    with ThreadPoolExecutor(max_workers=1 + len(dapps)) as executor:
+        future_txs = executor.submit(indexer.get_all_transactions, wallet_address)
+        futures_extra = [executor.submit(app.get_extra_transactions) for app in dapps]
+        out = future_txs.result()
+        extra_txs = [tx for future in futures_extra for tx in future.result()]
 
     if out:
         # Reverse the list so transactions are in chronological order
@@ -141,8 +150,14 @@ def _get_txs(wallet_address, dapps, progress):
         if localconfig.track_block and len(out) > 0:
             last_round = out[-1]["confirmed-round"]
 
-        for app in dapps:
-            out.extend(app.get_extra_transactions())
+        # Merge extra transactions not already fetched (i.e. wallet tx also in storage address history)
+        # in chronological order (stable, so group transactions stay contiguous)
+        txids = set(tx["id"] for tx in out)
+        for tx in extra_txs:
+            if tx["id"] not in txids:
+                txids.add(tx["id"])
+                out.append(tx)
+        out.sort(key=lambda tx: (tx["confirmed-round"], tx.get("intra-round-offset", 0)))
 
         if last_round:
             localconfig.min_round = last_round + 1
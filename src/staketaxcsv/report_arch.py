@@ -12,9 +12,11 @@ from staketaxcsv.arch.config_arch import localconfig
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Cache import Cache
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.settings_csv import ARCH_NODE, TICKER_ARCH, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -53,6 +55,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_ARCH, localconfig)
 def txhistory(wallet_address):
     """ Configure localconfig based on options dictionary. """
     start_date, end_date = localconfig.start_date, localconfig.end_date
@@ -68,6 +71,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(ARCH_NODE, elems)
     staketaxcsv.arch.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -11,10 +11,12 @@ import staketaxcsv.atom.processor
 from staketaxcsv.atom.config_atom import localconfig
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.settings_csv import ATOM_NODE, TICKER_ATOM, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc import api_lcd, historical_balances
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -56,6 +58,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_ATOM, localconfig)
 def txhistory(wallet_address):
     start_date, end_date = localconfig.start_date, localconfig.end_date
     progress = ProgressMintScan(localconfig)
@@ -70,6 +73,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} ATOM transactions... ")
+    IBCAddrs.prefetch(ATOM_NODE, elems)
     staketaxcsv.atom.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -15,6 +15,7 @@ from staketaxcsv.common.Cache import Cache
 from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.settings_csv import BLD_NODE, TICKER_BLD, BLD_NODE_RPC
 from staketaxcsv.common.ibc.tx_data import TxDataRpc
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 BLD_RPC_NODES = [BLD_NODE_RPC]
 LIMIT_TXS_PER_QUERY = 20
@@ -66,6 +67,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress_rpc=progress, limit=LIMIT_TXS_PER_QUERY)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(BLD_NODE, elems)
     staketaxcsv.bld.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -15,6 +15,7 @@ from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.settings_csv import BTSG_NODE, TICKER_BTSG
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -64,6 +65,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(BTSG_NODE, elems)
     staketaxcsv.btsg.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
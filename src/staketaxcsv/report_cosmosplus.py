@@ -27,6 +27,7 @@ from staketaxcsv.cosmosplus.progress_cosmosplus import SECONDS_PER_PAGE, Progres
 from staketaxcsv.common.ibc.constants import MINTSCAN_LABELS
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -82,6 +83,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(localconfig.node, elems)
     staketaxcsv.cosmosplus.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -27,9 +27,11 @@ import staketaxcsv.cosmosplus2.processor
 from staketaxcsv.settings_csv import TICKER_COSMOSPLUS2
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.cosmosplus2.config_cosmosplus2 import localconfig
 from staketaxcsv.common.ibc import api_lcd, historical_balances
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
 from staketaxcsv.common.ibc.api_mintscan_v1 import MintscanAPI
@@ -76,6 +78,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_COSMOSPLUS2, localconfig)
 def txhistory(wallet_address):
     start_date, end_date = localconfig.start_date, localconfig.end_date
     progress = ProgressMintScan(localconfig)
@@ -90,6 +93,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(localconfig.node, elems)
     staketaxcsv.cosmosplus2.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -18,6 +18,7 @@ from staketaxcsv.dvpn.config_dvpn import localconfig
 from staketaxcsv.dvpn.progress_dvpn import LCD_SECONDS_PER_PAGE, ProgressDvpn
 from staketaxcsv.settings_csv import DVPN_NODE, DVPN_NODE_RPC, TICKER_DVPN
 from staketaxcsv.common.ibc import api_lcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -102,6 +103,7 @@ def txhistory(wallet_address):
 
     # Process all transactions
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(DVPN_NODE, elems)
     staketaxcsv.dvpn.processor.process_txs(wallet_address, elems, exporter)
 
     # Calculate payments from escrow to the dVPN node for bandwidth usage.
@@ -11,9 +11,11 @@ from staketaxcsv.common.ibc import api_lcd, historical_balances
 from staketaxcsv.dydx.config_dydx import localconfig
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.settings_csv import DYDX_NODE, TICKER_DYDX, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -56,6 +58,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_DYDX, localconfig)
 def txhistory(wallet_address):
     """ Configure localconfig based on options dictionary. """
     start_date, end_date = localconfig.start_date, localconfig.end_date
@@ -71,6 +74,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(DYDX_NODE, elems)
     staketaxcsv.dydx.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
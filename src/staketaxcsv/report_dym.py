@@ -12,10 +12,12 @@ import logging
 import staketaxcsv.dym.processor
 from staketaxcsv.common.address import dym_addrs
 from staketaxcsv.common.ibc import api_lcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 from staketaxcsv.common.ibc.tx_data import TxDataLcd, TxDataMintscan
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.dym.genesis_airdrop import genesis_airdrop
 from staketaxcsv.dym.config_dym import localconfig
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
@@ -67,6 +69,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_DYM, localconfig)
 def txhistory(wallet_address):
     """ Configure localconfig based on options dictionary. """
     start_date, end_date = localconfig.start_date, localconfig.end_date
@@ -86,6 +89,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(DYM_NODE, elems)
     staketaxcsv.dym.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -15,10 +15,12 @@ from staketaxcsv.common.address import evmo_addrs
 from staketaxcsv.common.ibc import api_lcd, historical_balances
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.evmos.config_evmos import localconfig
 from staketaxcsv.settings_csv import EVMOS_NODE, TICKER_EVMOS, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc.progress_mintscan import ProgressMintScan, SECONDS_PER_PAGE
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -69,6 +71,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_EVMOS, localconfig)
 def txhistory(wallet_address):
     start_date, end_date = localconfig.start_date, localconfig.end_date
     progress = ProgressMintScan(localconfig)
@@ -83,6 +86,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(EVMOS_NODE, elems)
     staketaxcsv.evmos.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -15,6 +15,7 @@ from staketaxcsv.common.Cache import Cache
 from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.settings_csv import GRAV_NODE, TICKER_GRAV, GRAV_NODE_RPC
 from staketaxcsv.common.ibc.tx_data import TxDataRpc
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 GRAV_RPC_NODES = [GRAV_NODE_RPC]
 LIMIT_TXS_PER_QUERY = 20
@@ -66,6 +67,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress_rpc=progress, limit=LIMIT_TXS_PER_QUERY)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(GRAV_NODE, elems)
     staketaxcsv.grav.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -13,10 +13,12 @@ from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common import report_util
 from staketaxcsv.common.Cache import Cache
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.huahua.config_huahua import localconfig
 from staketaxcsv.huahua.progress_huahua import SECONDS_PER_PAGE, ProgressHuahua
 from staketaxcsv.settings_csv import HUAHUA_NODE, TICKER_HUAHUA
 from staketaxcsv.common.ibc.tx_data import TxDataLcd, TxDataMintscan
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 LIMIT_PER_QUERY = 10
 
@@ -57,6 +59,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_HUAHUA, localconfig)
 def txhistory(wallet_address):
     start_date, end_date = localconfig.start_date, localconfig.end_date
     progress = ProgressHuahua()
@@ -71,6 +74,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress, start_date, end_date)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(HUAHUA_NODE, elems)
     staketaxcsv.huahua.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -19,6 +19,7 @@ from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.juno.config_juno import localconfig
 from staketaxcsv.settings_csv import JUNO_NODE, TICKER_JUNO, JUNO_NODES_RPC
 from staketaxcsv.common.ibc.tx_data import TxDataRpc
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 from staketaxcsv.juno.progress_juno import ProgressJuno, SECONDS_PER_TX, SECONDS_PER_PAGE
 
@@ -74,6 +75,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(JUNO_NODE, elems)
     staketaxcsv.juno.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -16,6 +16,7 @@ from staketaxcsv.kuji.config_kuji import localconfig
 from staketaxcsv.kuji.progress_kuji import SECONDS_PER_PAGE, ProgressKuji
 from staketaxcsv.settings_csv import KUJI_NODE, KUJI_NODE_TXS, TICKER_KUJI
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 LIMIT_PER_QUERY = 15
 
@@ -66,6 +67,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(KUJI_NODE, elems)
     staketaxcsv.kuji.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -15,6 +15,7 @@ from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.settings_csv import KYVE_NODE, TICKER_KYVE
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -64,6 +65,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(KYVE_NODE, elems)
     staketaxcsv.kyve.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -23,6 +23,7 @@ from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.common.ExporterTypes import LP_TREATMENT_TRANSFERS
 from staketaxcsv.luna1.api_fcd import LIMIT_FCD, FcdAPI
 from staketaxcsv.luna1.api_lcd import LcdAPI
+from staketaxcsv.luna1 import snapshot
 from staketaxcsv.luna1.config_luna1 import localconfig
 from staketaxcsv.luna1.progress_terra import SECONDS_PER_TX_FETCH, SECONDS_PER_TX_PROCESS, ProgressTerra
 from staketaxcsv.settings_csv import TICKER_LUNA1
@@ -119,25 +120,49 @@ def _cache_push(cache):
 
 
 def _get_txs(wallet_address, progress):
+    # Txs from frozen snapshot of previous report (if enabled), so only newer txs are fetched from fcd
+    stored = snapshot.stored_txs(wallet_address)
+    stored_height = snapshot.last_height(stored)
+
+    max_queries = _max_queries()
     offset = 0
     out = []
-    for _ in range(_max_queries()):
+    is_complete = False
+    for _ in range(max_queries):
         num_tx = len(out)
         progress.report(num_tx, f"Retrieving transaction {num_tx + 1} ...")
 
         data = FcdAPI.get_txs(wallet_address, offset)
         result = data["txs"]
-        out.extend(result)
+
+        if stored_height is not None:
+            # Stop once reached txs already in snapshot
+            new_result = [elem for elem in result if int(elem["height"]) > stored_height]
+            out.extend(new_result)
+            if len(new_result) < len(result):
+                is_complete = True
+                break
+        else:
+            out.extend(result)
 
         if data.get("next", None):
             offset = data["next"]
         else:
+            is_complete = True
             break
 
     message = f"Retrieved total {len(out)} txids..."
     progress.report_message(message)
 
-    return out
+    fetched = out
+    if stored:
+        logging.info("Fetched %s txs.  Merging with %s txs from snapshot ...", len(fetched), len(stored))
+        stored.sort(key=lambda elem: int(elem["height"]), reverse=True)
+        out = fetched + stored
+    snapshot.save_txs(wallet_address, fetched, out, is_complete)
+
+    # Same max txs as fetching entire history from fcd (newest first)
+    return out[:max_queries * LIMIT_FCD]
 
 
 if __name__ == "__main__":
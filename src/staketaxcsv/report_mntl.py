@@ -15,6 +15,7 @@ from staketaxcsv.mntl.config_mntl import localconfig
 from staketaxcsv.mntl.progress_mntl import SECONDS_PER_PAGE, ProgressMntl
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -64,6 +65,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(MNTL_NODE, elems)
     staketaxcsv.mntl.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -14,15 +14,18 @@ from staketaxcsv.common import report_util
 from staketaxcsv.common.Cache import Cache
 from staketaxcsv.common.ErrorCounter import ErrorCounter
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.common.ExporterTypes import LP_TREATMENT_TRANSFERS
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.osmo.config_osmo import localconfig
+from staketaxcsv.osmo.denoms import TokenMetadata
 from staketaxcsv.osmo.lp_rewards_numia import lp_rewards_tokens, lp_rewards
 from staketaxcsv.osmo.progress_osmo import ProgressOsmo
 from staketaxcsv.settings_csv import TICKER_OSMO, MINTSCAN_ON
 from staketaxcsv.common.ibc.tx_data import TxDataMintscan, TxDataLcd
 from staketaxcsv.common.ibc.progress_mintscan import SECONDS_PER_PAGE
 from staketaxcsv.common.ibc import historical_balances
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 from staketaxcsv import settings_csv
 from staketaxcsv.settings_csv import OSMO_NODE
@@ -73,6 +76,7 @@ def estimate_duration(wallet_address):
 
 
 @set_ibc_cache()
+@incremental_report(TICKER_OSMO, localconfig)
 def txhistory(wallet_address):
     if settings_csv.DB_CACHE:
         cache = Cache()
@@ -99,10 +103,14 @@ def txhistory(wallet_address):
 
     # Process transactions
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    TokenMetadata.prefetch(elems)
+    # lcd only used as fallback for denoms not resolved by osmosis api
+    IBCAddrs.prefetch(OSMO_NODE, elems, resolved=TokenMetadata.resolved())
     staketaxcsv.osmo.processor.process_txs(wallet_address, elems, exporter, progress=progress)
 
     # Fetch & process LP rewards data
     lp_rewards(wallet_address, exporter, progress)
+    TokenMetadata.set_cache()
 
     exporter.sort_rows(reverse=True)
     exporter.convert_alloyed_symbols()
@@ -17,6 +17,7 @@ from staketaxcsv.rowan.config_rowan import localconfig
 from staketaxcsv.rowan.progress_rowan import SECONDS_PER_PAGE, ProgressRowan
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -66,6 +67,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(ROWAN_NODE, elems)
     staketaxcsv.rowan.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
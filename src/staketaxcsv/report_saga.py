@@ -17,6 +17,7 @@ from staketaxcsv.common.Exporter import Exporter
 from staketaxcsv.settings_csv import SAGA_NODE, TICKER_SAGA
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd, TxDataMintscan
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -66,6 +67,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(SAGA_NODE, elems)
     staketaxcsv.saga.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -90,6 +92,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(SAGA_NODE, elems)
     staketaxcsv.saga.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
@@ -12,6 +12,7 @@ import staketaxcsv.sol.processor
 from staketaxcsv.common import report_util
 from staketaxcsv.common.ErrorCounter import ErrorCounter
 from staketaxcsv.common.Exporter import Exporter
+from staketaxcsv.common.incremental import incremental_report
 from staketaxcsv.settings_csv import MESSAGE_ADDRESS_NOT_FOUND, MESSAGE_STAKING_ADDRESS_FOUND, SOL_NODE, TICKER_SOL
 from staketaxcsv.sol import staking_rewards
 from staketaxcsv.sol.api_rpc import RpcAPI
@@ -87,6 +88,7 @@ def estimate_duration(wallet_address):
     return SECONDS_PER_STAKING_ADDRESS * num_staking_addresses + SECONDS_PER_TX * num_txids
 
 
+@incremental_report(TICKER_SOL, localconfig)
 def txhistory(wallet_address):
     logging.info("Using SOLANA_URL=%s...", SOL_NODE)
     start_date, end_date = localconfig.start_date, localconfig.end_date
@@ -94,6 +96,7 @@ def txhistory(wallet_address):
     progress = ProgressSol()
     exporter = Exporter(wallet_address, localconfig, TICKER_SOL)
     wallet_info = WalletInfo(wallet_address)
+    staketaxcsv.sol.processor.HandlerStats.reset()
 
     # ####### Fetch data to so that job progress can be estimated ##########
 
@@ -129,6 +132,7 @@ def txhistory(wallet_address):
                      staking_addr, len(staking_addr_txids))
         _fetch_and_process_txs(staking_addr_txids, staking_wallet_info, exporter, progress=None)
 
+    staketaxcsv.sol.processor.HandlerStats.log()
     ErrorCounter.log(TICKER_SOL, wallet_address)
     return exporter
 
@@ -136,8 +140,8 @@ def txhistory(wallet_address):
 def _fetch_and_process_txs(txids, wallet_info, exporter, progress=None):
     total_count = len(txids)
 
-    for i, txid in enumerate(txids):
-        elem = RpcAPI.fetch_tx(txid)
+    # Transactions are fetched ahead concurrently (if SOL_FETCH_WORKERS > 1), but processed in order
+    for i, (txid, elem) in enumerate(RpcAPI.fetch_txs_ordered(txids)):
         staketaxcsv.sol.processor.process_tx(wallet_info, exporter, txid, elem)
 
         if progress and i % 10 == 0:
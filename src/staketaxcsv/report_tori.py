@@ -16,6 +16,7 @@ from staketaxcsv.tori.config_tori import localconfig
 from staketaxcsv.tori.progress_tori import SECONDS_PER_PAGE, ProgressTori
 from staketaxcsv.common.ibc import api_lcd
 from staketaxcsv.common.ibc.tx_data import TxDataLcd
+from staketaxcsv.common.ibc.denoms import IBCAddrs
 from staketaxcsv.common.ibc.decorators import set_ibc_cache
 
 
@@ -65,6 +66,7 @@ def txhistory(wallet_address):
     elems = txdata.get_txs_all(wallet_address, progress)
 
     progress.report_message(f"Processing {len(elems)} transactions... ")
+    IBCAddrs.prefetch(TORI_NODE, elems)
     staketaxcsv.tori.processor.process_txs(wallet_address, elems, exporter)
 
     return exporter
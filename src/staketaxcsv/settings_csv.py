@@ -4,6 +4,10 @@ import os
 MINTSCAN_KEY = os.environ.get("STAKETAX_MINTSCAN_KEY", "")
 MINTSCAN_MAX_TXS = os.environ.get("STAKETAX_MINTSCAN_MAX_TXS", 5000)
 MINTSCAN_ON = (MINTSCAN_KEY != "")
+MINTSCAN_REQUESTS_PER_SECOND = float(os.environ.get("STAKETAX_MINTSCAN_REQUESTS_PER_SECOND", 10))
+# Set >1 to fetch account transactions concurrently over this many date windows
+MINTSCAN_FETCH_WINDOWS = int(os.environ.get("STAKETAX_MINTSCAN_FETCH_WINDOWS", 1))
+MINTSCAN_FETCH_WORKERS = int(os.environ.get("STAKETAX_MINTSCAN_FETCH_WORKERS", 8))
 
 # Required for OSMO LP rewards
 NUMIA_API_DOMAIN = os.environ.get("STAKETAX_NUMIA_API_DOMAIN", "")
@@ -59,6 +63,31 @@ TORI_NODE = os.environ.get("STAKETAX_TORI_NODE", "")
 # ########## Optional environment variables ########################################################
 DB_CACHE = os.environ.get("STAKETAX_DB_CACHE", False)
 
+# Persistent on-disk store of raw transactions (sqlite file), so repeat reports only fetch new txs
+TX_STORE_PATH = os.environ.get("STAKETAX_TX_STORE_PATH", "")
+TX_STORE_MAX_MB = os.environ.get("STAKETAX_TX_STORE_MAX_MB", 4096)
+
+# Max keep-alive connections kept per api host (shared http transport)
+HTTP_POOL_SIZE = int(os.environ.get("STAKETAX_HTTP_POOL_SIZE", 10))
+
+# Max lcd account tx pages (of all event types) requested concurrently per report
+LCD_FETCH_WORKERS = int(os.environ.get("STAKETAX_LCD_FETCH_WORKERS", 4))
+
+# Permanent local snapshot (sqlite file) of terra classic (LUNA1) txs and contract histories
+LUNA1_SNAPSHOT_PATH = os.environ.get("STAKETAX_LUNA1_SNAPSHOT_PATH", "")
+
+# Local json file cache of ibc address -> denom lookups, shared across reports
+IBC_DENOM_CACHE_PATH = os.environ.get("STAKETAX_IBC_DENOM_CACHE_PATH", "")
+
+# Local json file cache of osmosis token metadata (symbol, decimals), refreshed after ttl
+OSMO_TOKEN_METADATA_CACHE_PATH = os.environ.get("STAKETAX_OSMO_TOKEN_METADATA_CACHE_PATH", "")
+OSMO_TOKEN_METADATA_TTL_DAYS = os.environ.get("STAKETAX_OSMO_TOKEN_METADATA_TTL_DAYS", 7)
+
+# Local json file catalog of algorand asset (ASA) metadata, shared across reports
+ALGO_ASSET_CATALOG_PATH = os.environ.get("STAKETAX_ALGO_ASSET_CATALOG_PATH", "")
+# Set >1 to fetch algorand account transactions concurrently over this many round ranges
+ALGO_FETCH_SHARDS = int(os.environ.get("STAKETAX_ALGO_FETCH_SHARDS", 1))
+
 # ### One of below required for faster solana staking rewards history
 # (flipside free tier is sufficient; solscan api costs money; db method has issues after 12/2024)
 
@@ -68,6 +97,16 @@ SOL_REWARDS_USE_DB = os.environ.get("STAKETAX_SOL_REWARDS_USE_DB", False)
 
 # ###
 
+# Max requests (rpc calls) per second to SOL_NODE (default: 3.3 for public api.mainnet-beta node, else 10)
+SOL_REQUESTS_PER_SECOND = float(os.environ.get(
+    "STAKETAX_SOL_REQUESTS_PER_SECOND", 3.3 if "api.mainnet-beta.solana.com" in SOL_NODE else 10))
+# Set >1 to prefetch solana transactions concurrently (transactions are still processed in order)
+SOL_FETCH_WORKERS = int(os.environ.get("STAKETAX_SOL_FETCH_WORKERS", 1))
+# Set >1 to fetch solana transactions in JSON-RPC batch requests of this size (if SOL_NODE supports it)
+SOL_FETCH_BATCH_SIZE = int(os.environ.get("STAKETAX_SOL_FETCH_BATCH_SIZE", 1))
+# Max accounts (wallet and its token accounts) whose transaction signatures are paged concurrently
+SOL_TXIDS_WORKERS = int(os.environ.get("STAKETAX_SOL_TXIDS_WORKERS", 4))
+
 # #############################################################################
 
 TICKER_AKT = "AKT"
@@ -113,3 +152,4 @@ MESSAGE_ADDRESS_NOT_FOUND = "Wallet address not found"
 MESSAGE_STAKING_ADDRESS_FOUND = "Staking address found.  Please input the main wallet address instead."
 
 REPORTS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "_reports")
+INCREMENTAL_DIR = os.environ.get("STAKETAX_INCREMENTAL_DIR", REPORTS_DIR)
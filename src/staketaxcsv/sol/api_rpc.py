@@ -1,18 +1,29 @@
 import logging
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import requests
 
 from staketaxcsv.common.query import post_with_retries
 from staketaxcsv.common.debug_util import debug_cache
-from staketaxcsv.settings_csv import REPORTS_DIR, SOL_NODE
+from staketaxcsv.common.rate_limiter import TokenBucket
+from staketaxcsv.common.tx_store import read_through, read_through_many
+from staketaxcsv.settings_csv import (
+    REPORTS_DIR, SOL_FETCH_BATCH_SIZE, SOL_FETCH_WORKERS, SOL_NODE, SOL_REQUESTS_PER_SECOND, TICKER_SOL)
 from staketaxcsv.sol.config_sol import localconfig
 from staketaxcsv.sol.constants import BILLION, PROGRAMID_STAKE, PROGRAMID_TOKEN_ACCOUNTS, PROGRAMID_TOKEN_2022
 TOKEN_ACCOUNTS = {}
+JSONRPC_INVALID_REQUEST = -32600
+BATCH_MAX_FAILURES = 3  # consecutive unexpected responses to batch requests before batch requests are no longer used
 
 
 class RpcAPI(object):
     session = requests.Session()
+    # Shared by all threads; each rpc call (including each call in batch request) uses one token
+    rate_limiter = TokenBucket(SOL_REQUESTS_PER_SECOND, capacity=max(1, SOL_FETCH_BATCH_SIZE))
+    batch_supported = True
+    batch_failures = 0
 
     @classmethod
     def _fetch(cls, method, params_list):
@@ -24,15 +35,49 @@ class RpcAPI(object):
             "id": myid
         }
 
+        cls.rate_limiter.acquire()
         result = post_with_retries(cls.session, SOL_NODE, data, {}, retries=5, backoff_factor=5)
 
-        if "api.mainnet-beta.solana.com" in SOL_NODE:
-            time.sleep(0.3)
-        else:
-            time.sleep(0.1)
-
         return result
 
+    @classmethod
+    def _fetch_batch(cls, method, params_lists):
+        """ Returns list of results of JSON-RPC batch request (same order as params_lists).
+
+        Returns None if response is unexpected (i.e. error after retries).  Sets batch_supported=False if node
+        rejects batch requests (or responses are repeatedly unexpected).
+        """
+        data = [
+            {
+                "method": method,
+                "jsonrpc": "2.0",
+                "params": params_list,
+                "id": i
+            } for i, params_list in enumerate(params_lists)
+        ]
+
+        cls.rate_limiter.acquire(len(data))
+        result = post_with_retries(cls.session, SOL_NODE, data, {}, retries=5, backoff_factor=5)
+
+        if _is_invalid_request(result):
+            logging.info("Node rejected batch request.  Not using batch requests.  result=%s", str(result)[:500])
+            cls.batch_supported = False
+            return None
+
+        if not isinstance(result, list) or sorted(elem.get("id") for elem in result) != list(range(len(data))):
+            cls.batch_failures += 1
+            if cls.batch_failures >= BATCH_MAX_FAILURES:
+                logging.info("Unexpected response to batch request.  Not using batch requests.  result=%s",
+                             str(result)[:500])
+                cls.batch_supported = False
+            else:
+                logging.info("Unexpected response to batch request.  Fetching batch individually.  result=%s",
+                             str(result)[:500])
+            return None
+
+        cls.batch_failures = 0
+        return sorted(result, key=lambda elem: elem["id"])
+
     @classmethod
     def _fetch_with_retries(cls, method, params_list, retries=10, backoff_factor=0.2):
         for i in range(retries):
@@ -126,6 +171,33 @@ class RpcAPI(object):
             pass
         return None
 
+    @classmethod
+    def _get_inflation_rewards(cls, staking_addresses, epoch):
+        params_list = [
+            list(staking_addresses),
+            {
+                "epoch": epoch
+            }
+        ]
+        data = cls._fetch("getInflationReward", params_list)
+        return data
+
+    @classmethod
+    def get_inflation_rewards(cls, staking_addresses, epoch):
+        """ Returns dict of <staking_address> -> reward amount (None if no reward) for epoch, in one rpc call.
+            Returns None if query failed. """
+        data = cls._get_inflation_rewards(staking_addresses, epoch)
+
+        result = data.get("result") if data else None
+        if not isinstance(result, list) or len(result) != len(staking_addresses):
+            logging.warning("rpc get_inflation_rewards failed for epoch=%s: %s", epoch, data)
+            return None
+
+        out = {}
+        for staking_address, val in zip(staking_addresses, result):
+            out[staking_address] = val["amount"] / BILLION if val else None
+        return out
+
     @classmethod
     def get_latest_epoch(cls):
         params_list = []
@@ -163,10 +235,65 @@ class RpcAPI(object):
         return cls._fetch("getProgramAccounts", params_list)
 
     @classmethod
-    @debug_cache(REPORTS_DIR)
     def fetch_tx(cls, txid):
-        params_list = [txid, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}]
-        return cls._fetch("getTransaction", params_list)
+        return read_through(TICKER_SOL, txid, cls._fetch_tx, valid=lambda data: data.get("result"))
+
+    @classmethod
+    @debug_cache(REPORTS_DIR)
+    def _fetch_tx(cls, txid):
+        return cls._fetch("getTransaction", cls._fetch_tx_params(txid))
+
+    @classmethod
+    def _fetch_tx_params(cls, txid):
+        return [txid, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}]
+
+    @classmethod
+    def fetch_txs(cls, txids):
+        """ Returns list of transaction data for txids (same order) """
+        return read_through_many(TICKER_SOL, txids, cls._fetch_txs, valid=lambda data: data.get("result"))
+
+    @classmethod
+    def _fetch_txs(cls, txids):
+        if len(txids) == 1 or not cls.batch_supported:
+            return [cls._fetch_tx(txid) for txid in txids]
+
+        results = cls._fetch_batch("getTransaction", [cls._fetch_tx_params(txid) for txid in txids])
+        if results is None:
+            return [cls._fetch_tx(txid) for txid in txids]
+
+        # Refetch individually any that failed inside batch (i.e. rate limited)
+        return [data if "result" in data else cls._fetch_tx(txid) for txid, data in zip(txids, results)]
+
+    @classmethod
+    def fetch_txs_ordered(cls, txids, workers=SOL_FETCH_WORKERS, batch_size=SOL_FETCH_BATCH_SIZE):
+        """ Yields (txid, data) for txids, in order of txids.
+
+        workers: with >1, transactions are prefetched concurrently (at most 2 * workers batches ahead of consumer)
+        batch_size: with >1, transactions are fetched in JSON-RPC batch requests of this size
+        """
+        batch_size = max(1, batch_size)
+        batches = [txids[i:i + batch_size] for i in range(0, len(txids), batch_size)]
+
+        if workers <= 1:
+            for batch in batches:
+                yield from zip(batch, cls.fetch_txs(batch))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batches_iter = iter(batches)
+            pending = deque()
+            for batch in batches_iter:
+                pending.append((batch, executor.submit(cls.fetch_txs, batch)))
+                if len(pending) >= 2 * workers:
+                    break
+
+            while pending:
+                batch, future = pending.popleft()
+                next_batch = next(batches_iter, None)
+                if next_batch:
+                    pending.append((next_batch, executor.submit(cls.fetch_txs, next_batch)))
+
+                yield from zip(batch, future.result())
 
     @classmethod
     def fetch_token_accounts(cls, wallet_address):
@@ -292,3 +419,11 @@ class RpcAPI(object):
         ]
 
         return cls._fetch("getSignaturesForAddress", params_list)
+
+
+def _is_invalid_request(result):
+    """ Returns True if JSON-RPC response is "invalid request" error(s) (i.e. batch request not supported) """
+    errors = result if isinstance(result, list) else [result]
+    return bool(errors) and all(
+        isinstance(elem, dict) and isinstance(elem.get("error"), dict)
+        and elem["error"].get("code") == JSONRPC_INVALID_REQUEST for elem in errors)
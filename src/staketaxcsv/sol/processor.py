@@ -1,4 +1,5 @@
 import logging
+import time
 
 from staketaxcsv.common.ErrorCounter import ErrorCounter
 from staketaxcsv.sol import constants as co
@@ -46,122 +47,169 @@ from staketaxcsv.sol.handle_wormhole import handle_wormhole
 from staketaxcsv.sol.parser import parse_tx
 
 
+class Rule:
+    """ Selects handler for a transaction with program id in program_ids, or for which predicate(txinfo) is true """
+
+    def __init__(self, handler, program_ids=(), predicate=None, with_wallet_info=False):
+        self.handler = handler
+        self.program_ids = program_ids
+        self.predicate = predicate
+        self.with_wallet_info = with_wallet_info
+
+    @property
+    def name(self):
+        return self.handler.__name__
+
+    def handle(self, wallet_info, exporter, txinfo):
+        if self.with_wallet_info:
+            self.handler(wallet_info, exporter, txinfo)
+        else:
+            self.handler(exporter, txinfo)
+
+
+# Priority order: first matching rule handles the transaction
+RULES = [
+    Rule(handle_notimestamp_tx, predicate=is_notimestamp_tx),
+
+    # Bridges
+    Rule(handle_wormhole, [co.PROGRAMID_WORMHOLE, co.PROGRAMID_WORMHOLE2]),
+
+    # Serum programs
+    Rule(handle_program_swap_v2, [co.PROGRAMID_SWAP_V2]),
+    Rule(handle_serumv3, [co.PROGRAMID_SERUM_V3]),
+
+    # Marinade Finance
+    Rule(handle_marinade, [co.PROGRAMID_MARINADE, co.PROGRAMID_MARINADE_V2]),
+    Rule(handle_marinade_native_staking_create_tx, predicate=is_marinade_native_staking_create_tx,
+         with_wallet_info=True),
+
+    # Unknown programs
+    Rule(handle_djv, [co.PROGRAMID_UNKNOWN_DJV]),
+    Rule(handle_2kd, [co.PROGRAMID_UNKNOWN_2KD]),
+
+    # Raydium programs
+    Rule(handle_raydium_lp_v2, [co.PROGRAMID_RAYDIUM_LP_V2]),
+    Rule(handle_raydium_lp_v3, [co.PROGRAMID_RAYDIUM_LP_V3]),
+    Rule(handle_raydium_lp_v4, [co.PROGRAMID_RAYDIUM_LP_V4]),
+    Rule(handle_raydium_stake, [co.PROGRAMID_RAYDIUM_STAKE]),
+    Rule(handle_raydium_stake_v4, [co.PROGRAMID_RAYDIUM_STAKE_V4]),
+    Rule(handle_raydium_stake_v5, [co.PROGRAMID_RAYDIUM_STAKE_V5]),
+
+    # Orca programs
+    Rule(handle_orca_swap_v2, [co.PROGRAMID_ORCA_SWAP_V2, co.PROGRAMID_ORCA_SWAP_WHIRL]),
+
+    # Saber programs
+    Rule(handle_saber, [co.PROGRAMID_SABER]),
+    Rule(handle_saber_stable_swap, [co.PROGRAMID_SABER_STABLE_SWAP]),
+    Rule(handle_saber_farm_ssf, [co.PROGRAMID_SABER_FARM_SSF]),
+
+    # ### Jupiter programs
+
+    # important that these are before jupiter aggregator programs
+    Rule(handle_jupiter_limit, [co.PROGRAMID_JUPITER_LIMIT]),
+    Rule(handle_jupiter_limit_v2, [co.PROGRAMID_JUPITER_LIMIT_V2]),
+    Rule(handle_jupiter_dca, [co.PROGRAMID_JUPITER_DCA_V6]),
+    Rule(handle_jupiter_perp, [co.PROGRAMID_JUPITER_PERPERTUAL]),
+
+    Rule(handle_jupiter_aggregator_v1, [co.PROGRAMID_JUPITER_AGGREGATOR_V1]),
+    Rule(handle_jupiter_aggregator_v2, [co.PROGRAMID_JUPITER_AGGREGATOR_V2]),
+    Rule(handle_jupiter_aggregator_v3, [co.PROGRAMID_JUPITER_AGGREGATOR_V3]),
+    Rule(handle_jupiter_aggregator_v4, [co.PROGRAMID_JUPITER_AGGREGATOR_V4]),
+    Rule(handle_jupiter_aggregator_v6, [co.PROGRAMID_JUPITER_AGGREGATOR_V6]),
+    Rule(handle_wen_airdrop, [co.PROGRAMID_JUPITER_WEN_AIRDROP]),
+
+    ###
+
+    # Metaplex NFT Candy Machinine program
+    Rule(handle_metaplex, [co.PROGRAMID_METAPLEX_CANDY]),
+
+    # NFT marketplace transactions
+    Rule(handle_nft_exchange, predicate=get_nft_program),
+
+    # NFT transactions
+    Rule(handle_nft_mint, predicate=is_nft_mint),
+
+    # staking account claim transaction
+    Rule(handle_claim_staking_tip, [co.PROGRAMID_CLAIM_STAKING_TIP, co.PROGRAMID_CLAIM_STAKING_TIP_2]),
+
+    # Other
+    Rule(handle_vote, [co.PROGRAMID_VOTE]),
+    Rule(handle_simple_tx, predicate=is_simple_tx),
+    Rule(handle_init_account_tx, predicate=is_init_account_tx),
+    Rule(handle_transfer, predicate=is_transfer),
+    Rule(handle_close_account_tx, predicate=is_close_account_tx),
+]
+
+
+class RuleIndex:
+    """ Selects the first matching rule for a transaction.  Program id rules are found by set intersection with
+    txinfo.program_ids; only predicate rules of higher priority than the best program id match are evaluated.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.by_program_id = {}
+        self.predicate_priorities = []
+
+        for priority, rule in enumerate(rules):
+            for program_id in rule.program_ids:
+                self.by_program_id.setdefault(program_id, priority)
+            if rule.predicate is not None:
+                self.predicate_priorities.append(priority)
+
+    def select(self, txinfo):
+        matched = self.by_program_id.keys() & set(txinfo.program_ids)
+        best = min((self.by_program_id[program_id] for program_id in matched), default=len(self.rules))
+
+        for priority in self.predicate_priorities:
+            if priority > best:
+                break
+            if self.rules[priority].predicate(txinfo):
+                return self.rules[priority]
+
+        return self.rules[best] if best < len(self.rules) else None
+
+
+RULE_INDEX = RuleIndex(RULES)
+
+
+class HandlerStats:
+    """ Time spent per handler (selecting and handling transactions) """
+
+    # handler name -> [seconds, txs handled]
+    stats = {}
+
+    @classmethod
+    def reset(cls):
+        cls.stats = {}
+
+    @classmethod
+    def add(cls, name, seconds):
+        stat = cls.stats.setdefault(name, [0.0, 0])
+        stat[0] += seconds
+        stat[1] += 1
+
+    @classmethod
+    def log(cls):
+        for name, (seconds, count) in sorted(cls.stats.items(), key=lambda kv: -kv[1][0]):
+            logging.info("handler=%s seconds=%.3f txs=%s", name, seconds, count)
+
+
 def process_tx(wallet_info, exporter, txid, data):
     txinfo = parse_tx(txid, data, wallet_info)
 
     try:
         if not txinfo:
             return
-        program_ids = txinfo.program_ids
-
-        if is_notimestamp_tx(txinfo):
-            handle_notimestamp_tx(exporter, txinfo)
-
-        # Bridges
-        elif co.PROGRAMID_WORMHOLE in program_ids or co.PROGRAMID_WORMHOLE2 in program_ids:
-            handle_wormhole(exporter, txinfo)
-
-        # Serum programs
-        elif co.PROGRAMID_SWAP_V2 in program_ids:
-            handle_program_swap_v2(exporter, txinfo)
-        elif co.PROGRAMID_SERUM_V3 in program_ids:
-            handle_serumv3(exporter, txinfo)
-
-        # Marinade Finance
-        elif co.PROGRAMID_MARINADE in program_ids or co.PROGRAMID_MARINADE_V2 in program_ids:
-            handle_marinade(exporter, txinfo)
-        elif is_marinade_native_staking_create_tx(txinfo):
-            handle_marinade_native_staking_create_tx(wallet_info, exporter, txinfo)
-
-        # Unknown programs
-        elif co.PROGRAMID_UNKNOWN_DJV in program_ids:
-            handle_djv(exporter, txinfo)
-        elif co.PROGRAMID_UNKNOWN_2KD in program_ids:
-            handle_2kd(exporter, txinfo)
-
-        # Raydium programs
-        elif co.PROGRAMID_RAYDIUM_LP_V2 in program_ids:
-            handle_raydium_lp_v2(exporter, txinfo)
-        elif co.PROGRAMID_RAYDIUM_LP_V3 in program_ids:
-            handle_raydium_lp_v3(exporter, txinfo)
-        elif co.PROGRAMID_RAYDIUM_LP_V4 in program_ids:
-            handle_raydium_lp_v4(exporter, txinfo)
-        elif co.PROGRAMID_RAYDIUM_STAKE in program_ids:
-            handle_raydium_stake(exporter, txinfo)
-        elif co.PROGRAMID_RAYDIUM_STAKE_V4 in program_ids:
-            handle_raydium_stake_v4(exporter, txinfo)
-        elif co.PROGRAMID_RAYDIUM_STAKE_V5 in program_ids:
-            handle_raydium_stake_v5(exporter, txinfo)
-
-        # Orca programs
-        elif co.PROGRAMID_ORCA_SWAP_V2 in program_ids or co.PROGRAMID_ORCA_SWAP_WHIRL in program_ids:
-            handle_orca_swap_v2(exporter, txinfo)
-
-        # Saber programs
-        elif co.PROGRAMID_SABER in program_ids:
-            handle_saber(exporter, txinfo)
-        elif co.PROGRAMID_SABER_STABLE_SWAP in program_ids:
-            handle_saber_stable_swap(exporter, txinfo)
-        elif co.PROGRAMID_SABER_FARM_SSF in program_ids:
-            handle_saber_farm_ssf(exporter, txinfo)
-
-        # ### Jupiter programs
-
-        # important that these are before jupiter aggregator programs
-        elif co.PROGRAMID_JUPITER_LIMIT in program_ids:
-            handle_jupiter_limit(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_LIMIT_V2 in program_ids:
-            handle_jupiter_limit_v2(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_DCA_V6 in program_ids:
-            handle_jupiter_dca(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_PERPERTUAL in program_ids:
-            handle_jupiter_perp(exporter, txinfo)
-
-        elif co.PROGRAMID_JUPITER_AGGREGATOR_V1 in program_ids:
-            handle_jupiter_aggregator_v1(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_AGGREGATOR_V2 in program_ids:
-            handle_jupiter_aggregator_v2(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_AGGREGATOR_V3 in program_ids:
-            handle_jupiter_aggregator_v3(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_AGGREGATOR_V4 in program_ids:
-            handle_jupiter_aggregator_v4(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_AGGREGATOR_V6 in program_ids:
-            handle_jupiter_aggregator_v6(exporter, txinfo)
-        elif co.PROGRAMID_JUPITER_WEN_AIRDROP in program_ids:
-            handle_wen_airdrop(exporter, txinfo)
-
-        ###
-
-        # Metaplex NFT Candy Machinine program
-        elif co.PROGRAMID_METAPLEX_CANDY in program_ids:
-            handle_metaplex(exporter, txinfo)
-
-        # NFT marketplace transactions
-        elif get_nft_program(txinfo):
-            handle_nft_exchange(exporter, txinfo)
-
-        # NFT transactions
-        elif is_nft_mint(txinfo):
-            handle_nft_mint(exporter, txinfo)
-
-        # staking account claim transaction
-        elif (co.PROGRAMID_CLAIM_STAKING_TIP in program_ids or co.PROGRAMID_CLAIM_STAKING_TIP_2 in program_ids):
-            handle_claim_staking_tip(exporter, txinfo)
-
-        # Other
-        elif co.PROGRAMID_VOTE in program_ids:
-            handle_vote(exporter, txinfo)
-        elif is_simple_tx(txinfo):
-            handle_simple_tx(exporter, txinfo)
-        elif is_init_account_tx(txinfo):
-            handle_init_account_tx(exporter, txinfo)
-        elif is_transfer(txinfo):
-            handle_transfer(exporter, txinfo)
-        elif is_close_account_tx(txinfo):
-            handle_close_account_tx(exporter, txinfo)
 
+        start = time.perf_counter()
+        rule = RULE_INDEX.select(txinfo)
+        if rule is not None:
+            rule.handle(wallet_info, exporter, txinfo)
+            HandlerStats.add(rule.name, time.perf_counter() - start)
         else:
             handle_unknown_detect_transfers(exporter, txinfo)
+            HandlerStats.add(handle_unknown_detect_transfers.__name__, time.perf_counter() - start)
             ErrorCounter.increment("unknown_sol_tx", txid)
 
     except Exception as e:
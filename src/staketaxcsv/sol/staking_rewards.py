@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
 
+from staketaxcsv.common.tx_store import get_tx_store
 from staketaxcsv.sol.api_rpc import RpcAPI
 from staketaxcsv.sol.make_tx import make_sol_reward_tx
 from staketaxcsv.settings_csv import (
@@ -11,6 +12,8 @@ from staketaxcsv.sol.api_marinade import MarinadeAPI
 from staketaxcsv.sol.constants import BILLION
 from staketaxcsv.sol.staking_rewards_flipside import fetch_rewards_flipside
 from staketaxcsv.sol.staking_rewards_solscan import fetch_rewards_solscan
+INFLATION_REWARD_BATCH_SIZE = 100  # staking addresses per getInflationReward call
+NAMESPACE_INFLATION_REWARD = "rpc:SOL:inflation_reward"
 
 
 def reward_txs(wallet_info, exporter, progress, start_date=None, end_date=None):
@@ -18,11 +21,17 @@ def reward_txs(wallet_info, exporter, progress, start_date=None, end_date=None):
     staking_addresses = wallet_info.get_staking_addresses()
     wallet_address = wallet_info.wallet_address
 
-    for i, staking_address in enumerate(staking_addresses):
-        progress.report(i, f"Fetching rewards for {staking_address}...", "staking")
-        result = _rewards(staking_address, start_date, end_date)
+    progress.report(0, f"Fetching rewards for {len(staking_addresses)} staking addresses...", "staking")
 
-        for epoch, timestamp, reward in result:
+    def _report(num_done, total):
+        # Stage is counted in staking addresses
+        num = len(staking_addresses) * num_done // total
+        progress.report(num, f"Fetched rewards ({num_done} of {total}) ...", "staking")
+
+    rewards = _rewards_many(staking_addresses, start_date, end_date, progress=_report)
+
+    for staking_address in staking_addresses:
+        for epoch, timestamp, reward in rewards[staking_address]:
             txid = f"{staking_address}.{epoch}"
             row = make_sol_reward_tx(timestamp, reward, wallet_address, txid)
             exporter.ingest_row(row)
@@ -32,8 +41,33 @@ def reward_txs(wallet_info, exporter, progress, start_date=None, end_date=None):
 
 
 def _rewards(staking_address, start_date=None, end_date=None):
-    list_rewards = _rewards_all_time(staking_address)
-    return _filter_date(list_rewards, start_date, end_date)
+    return _rewards_many([staking_address], start_date, end_date)[staking_address]
+
+
+def _rewards_many(staking_addresses, start_date=None, end_date=None, progress=None):
+    """ Returns dict of <staking_address> -> list of (epoch, timestamp, amount)
+
+    progress: (optional) function called with (num_done, total) as rewards are fetched
+    """
+    if not staking_addresses:
+        return {}
+    rewards = _rewards_all_time_many(staking_addresses, progress)
+    return {addr: _filter_date(rewards[addr], start_date, end_date) for addr in staking_addresses}
+
+
+def _rewards_all_time_many(staking_addresses, progress=None):
+    """ Get reward transactions for these staking_addresses for all time"""
+    if SOL_REWARDS_SOLSCAN_API_TOKEN or SOL_REWARDS_FLIPSIDE_API_KEY or SOL_REWARDS_USE_DB:
+        out = {}
+        for i, addr in enumerate(staking_addresses):
+            out[addr] = _rewards_all_time(addr)
+            if progress:
+                progress(i + 1, len(staking_addresses))
+        return out
+    else:
+        # No DB available.  Query RPC for all rewards info.
+        logging.info("No db available.  Using Solana RPC only to get rewards.  This will take a while ...")
+        return _rewards_via_rpc(staking_addresses, progress)
 
 
 def _rewards_all_time(staking_address):
@@ -45,9 +79,7 @@ def _rewards_all_time(staking_address):
     if SOL_REWARDS_USE_DB:
         return _rewards_via_db(staking_address)
     else:
-        # No DB available.  Query RPC for all rewards info.
-        logging.info("No db available.  Using Solana RPC only to get rewards.  This will take a while ...")
-        return _rewards_via_rpc(staking_address)
+        return _rewards_via_rpc([staking_address])[staking_address]
 
 
 def _date_to_dt(ymd):
@@ -78,19 +110,54 @@ def _rewards_via_db(staking_address):
     return out
 
 
-def _rewards_via_rpc(staking_address):
-    epochs_all = get_epochs_all()
+def _rewards_via_rpc(staking_addresses, progress=None):
+    """ Returns dict of <staking_address> -> list of (epoch, timestamp, amount) for all epochs.
 
-    if SOL_REWARDS_USE_DB is False:
-        # No DB available.  Query RPC for all rewards info.
-        logging.info("No db available.  Using Solana RPC only to get rewards.  This will take a while ...")
+    Queries all staking addresses per epoch in one getInflationReward call.  Results of past epochs do not change,
+    so they (including known-empty results) are kept in tx store (if enabled) and not queried again.
 
-        out = []
-        for epoch in epochs_all:
-            ts, amount = _lookup_reward_via_rpc(staking_address, epoch)
-            if ts and amount:
-                out.append((epoch, ts, amount))
-        return out
+    progress: (optional) function called with (num_epochs_done, num_epochs) after each epoch
+    """
+    epochs_all = get_epochs_all()
+    store = get_tx_store()
+
+    # "<staking_address>.<epoch>" -> amount (0 if no reward)
+    known = {}
+    if store:
+        known = store.get_many(
+            NAMESPACE_INFLATION_REWARD, [f"{addr}.{epoch}" for epoch in epochs_all for addr in staking_addresses])
+        logging.info("Found %s known inflation rewards in tx store", len(known))
+
+    out = {addr: [] for addr in staking_addresses}
+    for j, epoch in enumerate(epochs_all):
+        missing = [addr for addr in staking_addresses if f"{addr}.{epoch}" not in known]
+        for i in range(0, len(missing), INFLATION_REWARD_BATCH_SIZE):
+            batch = missing[i:i + INFLATION_REWARD_BATCH_SIZE]
+            logging.info("Querying RPC for rewards epoch=%s for %s staking addresses ...", epoch, len(batch))
+
+            amounts = RpcAPI.get_inflation_rewards(batch, epoch)
+            if amounts is None:
+                # Query failed: leave unknown, so that it is retried next time
+                continue
+
+            items = [(f"{addr}.{epoch}", amounts[addr] or 0) for addr in batch]
+            known.update(items)
+            if store:
+                store.put_many(NAMESPACE_INFLATION_REWARD, items)
+
+        for addr in staking_addresses:
+            amount = known.get(f"{addr}.{epoch}")
+            if not amount:
+                continue
+
+            _, ts = epoch_slot_and_time(epoch)
+            if ts:
+                out[addr].append((epoch, ts, amount))
+
+        if progress:
+            progress(j + 1, len(epochs_all))
+
+    return out
 
 
 def _filter_date(rewards, start_date=None, end_date=None):
@@ -1,13 +1,37 @@
 import logging
+from staketaxcsv.common.tx_store import get_tx_store
 from staketaxcsv.sol.api_rpc import RpcAPI
 START_EPOCH = 132  # epoch of first ever staking reward
 EPOCHS_ALL = []
 REFERENCE_ADDRESS_WITH_ALL_EPOCH_REWARDS = "8Vv2xVWSQtHji1Xf7Vj1vHKTa4em7zv7cAET96Vm2qt8"
+NAMESPACE_EPOCH_SLOT_AND_TIME = "rpc:SOL:epoch_slot_and_time"
+
+
+class EpochTimes:
+
+    # epoch -> (reward slot, timestamp)
+    times = {}
 
 
 def epoch_slot_and_time(epoch):
-    """ Returns reward slot and timestamp for specified epoch """
+    """ Returns reward slot and timestamp for specified epoch (kept in memory and tx store, since fixed) """
+    if epoch in EpochTimes.times:
+        return EpochTimes.times[epoch]
+
+    store = get_tx_store()
+    data = store.get(NAMESPACE_EPOCH_SLOT_AND_TIME, str(epoch)) if store else None
+    if data:
+        slot, timestamp = data
+    else:
+        slot, timestamp = _epoch_slot_and_time(epoch)
+        if store:
+            store.put(NAMESPACE_EPOCH_SLOT_AND_TIME, str(epoch), [slot, timestamp])
+
+    EpochTimes.times[epoch] = (slot, timestamp)
+    return slot, timestamp
+
 
+def _epoch_slot_and_time(epoch):
     # (reward slot of first epoch with rewards) + num_epochs * slots_per_epoch
     slot = 57456000 + (epoch - START_EPOCH) * 432000
 
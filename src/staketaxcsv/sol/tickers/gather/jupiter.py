@@ -3,6 +3,7 @@ usage: python3 staketaxcsv/sol/tickers/gather/jupiter.py
 
 * Writes tickers json file to staketaxcsv/sol/tickers/token_lists/jupiter.YYYYMMDD.json,
   which effectively updates the recognized token symbols for the solana report.
+* Rebuilds staketaxcsv/sol/tickers/tickers.index from the token lists.
 
 """
 import logging
@@ -12,7 +13,7 @@ import json
 import os
 from datetime import datetime
 
-from staketaxcsv.sol.tickers.tickers import TOKEN_LISTS_DIR
+from staketaxcsv.sol.tickers.tickers import TOKEN_LISTS_DIR, build_index
 JUPITER_TOKENS_LIST_API = "https://token.jup.ag/strict"
 
 
@@ -43,6 +44,7 @@ def main():
     tokens = fetch_jupiter_tokens()
     if tokens:
         save_tokens_to_file(tokens)
+        build_index()
 
 
 if __name__ == "__main__":
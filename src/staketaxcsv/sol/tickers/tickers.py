@@ -1,40 +1,42 @@
+"""
+usage: python3 staketaxcsv/sol/tickers/tickers.py
+
+* Rebuilds staketaxcsv/sol/tickers/tickers.index from token_lists/*.json.  Run after adding/updating a
+  token list (done automatically by gather/jupiter.py).
+
+* tickers.index is the merged token lists (earliest dated list wins for an address), as lines of
+  "<address>\t<symbol>" sorted by address, so that lookups are a binary search on the mmap'ed file
+  (no parsing at startup, and pages shared between worker processes).  Its header records the source
+  token lists; if they no longer match token_lists/, lookups fall back to merging the json files.
+
+"""
 import glob
 import json
 import logging
+import mmap
 import os
 
+from staketaxcsv.common import json_cache
+
 TOKEN_LISTS_DIR = os.path.dirname(os.path.realpath(__file__)) + "/token_lists"
+INDEX_PATH = os.path.dirname(os.path.realpath(__file__)) + "/tickers.index"
+INDEX_HEADER_PREFIX = b"# sources:"
 
 
 class Tickers:
     loaded = False
     tickers = {}
+    index = None
 
     @classmethod
     def _load(cls):
         if cls.loaded is False:
-            json_files = glob.glob(os.path.join(TOKEN_LISTS_DIR, '*.json'))
-
-            # Extract dates from filenames and sort files by date
-            file_date_pairs = []
-            for file in json_files:
-                # Extract date part from filename
-                date_part = file.split('.')[-2]
-                if date_part.isdigit() and len(date_part) == 8:
-                    file_date_pairs.append((file, date_part))
-
-            file_date_pairs.sort(key=lambda x: x[1])
-
-            # Load the JSON files in sorted order
-            for file, _ in file_date_pairs:
-                try:
-                    with open(file, 'r') as json_file:
-                        data = json.load(json_file)
-                        for address, symbol in data.items():
-                            cls.tickers.setdefault(address, symbol)
-                    logging.info("Loaded tickers json file = %s", json_file)
-                except Exception as e:
-                    logging.error(f"Error loading file {file}: {str(e)}")
+            files = _token_list_files()
+
+            cls.index = _open_index(INDEX_PATH, _sources_header(files))
+            if cls.index is None:
+                logging.warning("Ticker index %s missing or stale.  Loading token lists json files ...", INDEX_PATH)
+                cls.tickers = _merge_token_lists(files)
 
             cls.loaded = True
 
@@ -42,8 +44,114 @@ class Tickers:
     def get(cls, address):
         cls._load()
 
-        ticker = cls.tickers.get(address, None)
+        if cls.index is not None:
+            ticker = cls.index.get(address)
+        else:
+            ticker = cls.tickers.get(address, None)
+
         if ticker:
             return ticker
         else:
             return address
+
+
+class TickerIndex:
+    """ Read-only lookups on mmap'ed tickers.index """
+
+    def __init__(self, mm, data_start):
+        self.mm = mm
+        self.data_start = data_start
+
+    def get(self, address):
+        key = address.encode("utf-8")
+        mm = self.mm
+
+        # lo, hi are always at start of a line
+        lo, hi = self.data_start, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b"\n", lo, mid) + 1 or lo
+            end = mm.find(b"\n", start)
+            if end < 0:
+                end = len(mm)
+
+            line_address, _, symbol = mm[start:end].partition(b"\t")
+            if line_address == key:
+                return symbol.decode("utf-8")
+            elif line_address < key:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+
+def _token_list_files():
+    """ Returns token list json files, sorted by date in filename (i.e. jupiter.20240101.json) """
+    json_files = glob.glob(os.path.join(TOKEN_LISTS_DIR, '*.json'))
+
+    # Extract dates from filenames and sort files by date
+    file_date_pairs = []
+    for file in json_files:
+        # Extract date part from filename
+        date_part = file.split('.')[-2]
+        if date_part.isdigit() and len(date_part) == 8:
+            file_date_pairs.append((file, date_part))
+
+    file_date_pairs.sort(key=lambda x: x[1])
+    return [file for file, _ in file_date_pairs]
+
+
+def _merge_token_lists(files):
+    """ Returns dict of <address> -> <symbol>, where earlier files take precedence """
+    tickers = {}
+    for file in files:
+        try:
+            with open(file, 'r') as json_file:
+                data = json.load(json_file)
+                for address, symbol in data.items():
+                    tickers.setdefault(address, symbol)
+            logging.info("Loaded tickers json file = %s", file)
+        except Exception as e:
+            logging.error(f"Error loading file {file}: {str(e)}")
+    return tickers
+
+
+def _sources_header(files):
+    sources = sorted("{}:{}".format(os.path.basename(file), os.path.getsize(file)) for file in files)
+    return INDEX_HEADER_PREFIX + " ".join(sources).encode("utf-8") + b"\n"
+
+
+def _open_index(path, header):
+    """ Returns TickerIndex for index file at path, or None if missing or not built from current sources """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        if f.readline() != header:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TickerIndex(mm, len(header))
+
+
+def build_index(path=INDEX_PATH):
+    files = _token_list_files()
+    tickers = _merge_token_lists(files)
+
+    lines = []
+    for address, symbol in tickers.items():
+        if not symbol or any(c in s for s in (address, symbol) for c in "\t\n"):
+            # Not representable in index; falsy symbols are looked up as missing anyway
+            continue
+        lines.append((address.encode("utf-8"), symbol.encode("utf-8")))
+    lines.sort()
+
+    with json_cache.atomic_open(path, "wb") as f:
+        f.write(_sources_header(files))
+        for address, symbol in lines:
+            f.write(address + b"\t" + symbol + b"\n")
+    logging.info("Wrote %s tickers to %s", len(lines), path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    build_index()
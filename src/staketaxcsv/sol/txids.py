@@ -1,10 +1,14 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from staketaxcsv.common.tx_store import get_tx_store
+from staketaxcsv.settings_csv import SOL_TXIDS_WORKERS
 from staketaxcsv.sol.api_rpc import RpcAPI
 from staketaxcsv.sol.config_sol import localconfig
 ABSOLUTE_MAX_QUERIES = 200
 LIMIT_PER_QUERY = 1000
+NAMESPACE_SIGNATURES = "rpc:SOL:signatures"
 
 
 def get_txids(wallet_address, progress, start_date=None, end_date=None):
@@ -26,57 +30,153 @@ def get_txids(wallet_address, progress, start_date=None, end_date=None):
     return out
 
 
-def get_txids_for_accounts(addresses, progress, start_date=None, end_date=None):
-    """ Returns transactions txids for all addresses in one list """
+def get_txids_for_accounts(addresses, progress, start_date=None, end_date=None, workers=SOL_TXIDS_WORKERS):
+    """ Returns transactions txids for all addresses in one list.
+
+    Signatures of addresses are paged concurrently (rate limited by RpcAPI), then filtered and deduped in order of
+    addresses, so result is same as paging one address after another.
+    """
     wallet_address = addresses[0]
+    start_ts = _unix_timestamp(start_date + " 00:00:00") if start_date else None
+    end_ts = _unix_timestamp(end_date + " 23:59:59") if end_date else None
+
+    def _max_txs(address):
+        if address == wallet_address:
+            return localconfig.limit
+        else:
+            return int(localconfig.limit / 5)
+
+    def _fetch(address):
+        signatures = AccountSignatures(address)
+        signatures.fetch(start_ts, end_ts, _max_txs(address))
+        return signatures
 
     out = []
     txids_seen = set()
 
-    for i, address in enumerate(addresses):
-        if progress and i % 10 == 0:
-            message = f"Fetched txids for {i} of {len(addresses)} addresses..."
-            progress.report_message(message)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for i, signatures in enumerate(executor.map(_fetch, addresses)):
+            if progress and i % 10 == 0:
+                message = f"Fetched txids for {i} of {len(addresses)} addresses..."
+                progress.report_message(message)
 
-        if address == wallet_address:
-            max_txs = localconfig.limit
-        else:
-            max_txs = int(localconfig.limit / 5)
-
-        # Get transaction txids for this token account
-        result = _txids_one_account(address, start_date, end_date, max_txs, txids_seen)
-        out.extend(result)
+            # Get transaction txids for this token account
+            result = _txids_one_account(signatures, start_ts, end_ts, _max_txs(signatures.address), txids_seen)
+            out.extend(result)
+            signatures.save()
 
     # Process oldest first
     out.reverse()
     return out
 
 
-def _txids_one_account(address, start_date, end_date, max_txs, txids_seen):
-    """ Returns txids for this token account as a list """
-    start_ts = _unix_timestamp(start_date + " 00:00:00") if start_date else None
-    end_ts = _unix_timestamp(end_date + " 23:59:59") if end_date else None
+class AccountSignatures:
+    """ (txid, block_time) signatures of one account, newest first, paged from getSignaturesForAddress.
+
+    Incremental mode (if tx store enabled): signatures of account from previous completed fetch are kept in tx store,
+    and paging stops at first already known signature (older signatures are taken from tx store).
+    """
+
+    def __init__(self, address):
+        self.address = address
+        self.namespace = NAMESPACE_SIGNATURES + (":exclude_failed" if localconfig.exclude_failed else "")
+        self.items = []
+        self.fetched = []
+        self.before_txid = None
+        self.num_queries = 0
+        self.is_exhausted = False  # no more signatures to page
+        self.is_complete = False   # items include all signatures of account
+        self.stored = _stored_signatures(self.namespace, address)
+
+    def fetch(self, start_ts, end_ts, max_txs):
+        """ Pages until start_ts or max_txs reached (without dedupe across accounts), or no more signatures """
+        count = 0
+        while not self.is_exhausted:
+            for txid, block_time in self.fetch_page():
+                block_time = _block_time(block_time)
+                if (start_ts is None or block_time >= start_ts) and (end_ts is None or block_time <= end_ts):
+                    count += 1
+                if start_ts is not None and block_time < start_ts:
+                    return
+                if count >= max_txs:
+                    return
+
+    def fetch_page(self):
+        """ Appends next page to items, and returns it """
+        if self.num_queries >= ABSOLUTE_MAX_QUERIES:
+            self.is_exhausted = True
+            return []
+
+        logging.info("query %s for address=%s, before_txid=%s", self.num_queries, self.address, self.before_txid)
+        txids, self.before_txid = RpcAPI.get_txids(self.address, limit=LIMIT_PER_QUERY, before_txid=self.before_txid)
+        self.num_queries += 1
+
+        # No more transactions for address case
+        if self.before_txid is None:
+            self.is_exhausted = self.is_complete = True
+
+        if self.stored:
+            for k, (txid, _) in enumerate(txids):
+                if txid in self.stored:
+                    logging.info("Reached known signature for address=%s.  Using %s signatures from tx store ...",
+                                 self.address, len(self.stored))
+                    txids = txids[:k] + sorted(self.stored.items(), key=lambda kv: -(kv[1] or 0))
+                    self.fetched.extend(txids[:k])
+                    self.is_exhausted = self.is_complete = True
+                    self.items.extend(txids)
+                    return txids
+
+        self.fetched.extend(txids)
+        self.items.extend(txids)
+        return txids
+
+    def save(self):
+        """ Saves fetched signatures to tx store.  Only records them for address if all signatures were fetched. """
+        store = get_tx_store()
+        if store is None:
+            return
+
+        store.put_many(self.namespace, self.fetched)
+        if self.is_complete:
+            store.add_account_txids(self.namespace, self.address, [txid for txid, _ in self.items])
+
+
+def _stored_signatures(namespace, address):
+    """ Returns dict of txid -> block_time from previous completed fetch for address (or None if not available) """
+    store = get_tx_store()
+    if store is None:
+        return None
+
+    txids = store.account_txids(namespace, address)
+    if not txids:
+        return None
+    out = store.get_many(namespace, txids)
+    if len(out) < len(txids):
+        return None
+    return out
 
+
+def _txids_one_account(signatures, start_ts, end_ts, max_txs, txids_seen):
+    """ Returns txids for this token account as a list """
     out = []
-    before_txid = None
-    for j in range(ABSOLUTE_MAX_QUERIES):
-        logging.info("query %s for address=%s, before_txid=%s", j, address, before_txid)
-        txids, before_txid = RpcAPI.get_txids(address, limit=LIMIT_PER_QUERY, before_txid=before_txid)
+    i = 0
+    while True:
+        while i < len(signatures.items):
+            txid, block_time = signatures.items[i]
+            i += 1
 
-        for txid, block_time in txids:
             # Handle case of block_time=None for old old tx without timestamp
-            if block_time is None:
-                block_time = _unix_timestamp("2020-01-01 00:00:00")
+            block_time = _block_time(block_time)
 
             # Check if txid is within the time range
-            if ((start_date is None or block_time >= start_ts)
-                 and (end_date is None or block_time <= end_ts)):
+            if ((start_ts is None or block_time >= start_ts)
+                 and (end_ts is None or block_time <= end_ts)):
                 if txid not in txids_seen:
                     out.append(txid)
                     txids_seen.add(txid)
 
             # Reached start_date case
-            if start_date is not None and block_time < start_ts:
+            if start_ts is not None and block_time < start_ts:
                 return out
 
             # Reached max transaction limit case
@@ -84,10 +184,17 @@ def _txids_one_account(address, start_date, end_date, max_txs, txids_seen):
                 return out
 
         # No more transactions for address case
-        if before_txid is None:
+        if signatures.is_exhausted:
             return out
 
-    return out
+        # More needed than prefetched, because of txids already seen for previous accounts
+        signatures.fetch_page()
+
+
+def _block_time(block_time):
+    if block_time is None:
+        return _unix_timestamp("2020-01-01 00:00:00")
+    return block_time
 
 
 def _unix_timestamp(dt_str):
@@ -1,3 +1,4 @@
+from staketaxcsv.algo.api import indexer as indexer_module
 from staketaxcsv.algo.api.indexer import Indexer
 from tests.mock_query import mock_query_two_args, mock_query_five_args
 from staketaxcsv.settings_csv import TICKER_ALGO
@@ -21,3 +22,34 @@ class MockIndexer(Indexer):
 
     def get_asset(self, id):
         return mock_query_two_args(Indexer.get_asset, self, id, DIRNAME + "/get_asset")
+
+
+class MockPagedIndexer(Indexer):
+    """ Serves in-memory account transactions (newest first), INDEXER_LIMIT per page like the indexer api """
+
+    def __init__(self, transactions, created_round, current_round):
+        self.transactions = transactions
+        self.created_round = created_round
+        self.current_round = current_round
+
+    def get_round_range(self, address):
+        return self.created_round, self.current_round
+
+    def get_transactions(self, address, after_date=None, before_date=None, min_round=None, next=None,
+                         max_round=None):
+        matches = [tx for tx in self.transactions
+                   if (not min_round or tx["confirmed-round"] >= min_round)
+                   and (not max_round or tx["confirmed-round"] <= max_round)]
+        start = int(next) if next else 0
+        end = start + indexer_module.INDEXER_LIMIT
+        return matches[start:end], (str(end) if end < len(matches) else None)
+
+
+def paged_transactions(rounds):
+    """ Returns transactions (2 per round) for MockPagedIndexer, newest first """
+    out = []
+    for round in rounds:
+        for offset in range(2):
+            out.append({"id": f"{round}-{offset}", "confirmed-round": round, "intra-round-offset": offset})
+    out.sort(key=lambda tx: (tx["confirmed-round"], tx["intra-round-offset"]), reverse=True)
+    return out
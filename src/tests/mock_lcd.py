@@ -1,4 +1,7 @@
 
+import threading
+from collections import Counter
+
 from staketaxcsv.common.ibc.api_lcd_v1 import LcdAPI_v1
 from staketaxcsv.common.ibc.api_lcd_v2 import LcdAPI_v2
 from staketaxcsv.common.ibc.api_lcd_cosmwasm import CosmWasmLcdAPI
@@ -49,3 +52,26 @@ class MockCosmWasmLcdAPI(CosmWasmLcdAPI):
 
     def contract(self, contract):
         return mock_query_two_args(CosmWasmLcdAPI.contract, self, contract, COSMWASM + "/contract")
+
+
+class MockPagedLcd:
+    """ Serves in-memory txs per events type (newest first) as LcdAPI_v2._get_txs() responses, and counts
+    requests per (events_type, page) """
+
+    def __init__(self, txs):
+        self.txs = {events_type: sorted(elems, key=lambda elem: elem["timestamp"], reverse=True)
+                    for events_type, elems in txs.items()}
+        self.requests = Counter()
+        self.lock = threading.Lock()
+
+    def _get_txs(self, wallet_address, events_type, page, limit, sleep_seconds):
+        with self.lock:
+            self.requests[(events_type, page)] += 1
+        elems = self.txs[events_type]
+        if not elems:
+            return {"code": 3}
+        return {"tx_responses": elems[(page - 1) * limit:page * limit], "total": str(len(elems))}
+
+
+def lcd_tx(i):
+    return {"txhash": f"TX{i}", "timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z"}
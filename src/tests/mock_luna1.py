@@ -0,0 +1,19 @@
+class MockPagedFcdAPI:
+    """ Serves in-memory account txs (newest first), per_page per page like FcdAPI.get_txs() """
+
+    def __init__(self, heights, per_page=2):
+        self.txs = [fcd_tx(height) for height in sorted(heights, reverse=True)]
+        self.per_page = per_page
+        self.pages = 0
+
+    def get_txs(self, address, offset=None):
+        self.pages += 1
+        start = offset or 0
+        data = {"txs": self.txs[start:start + self.per_page]}
+        if start + self.per_page < len(self.txs):
+            data["next"] = start + self.per_page
+        return data
+
+
+def fcd_tx(height):
+    return {"txhash": f"TX{height}", "height": str(height), "timestamp": f"2022-01-01T00:00:{height:02d}Z"}
@@ -0,0 +1,85 @@
+"""
+Builds synthetic tendermint rpc /tx_search elements (base64 protobuf tx, base64 event attributes, json log),
+for tests/benchmarks of staketaxcsv.common.ibc.api_rpc.normalize_rpc_txns().
+"""
+import base64
+import json
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field_bytes(field_number, payload):
+    return _varint((field_number << 3) | 2) + _varint(len(payload)) + payload
+
+
+def _field_varint(field_number, value):
+    return _varint(field_number << 3) + _varint(value)
+
+
+def make_tx_bytes(fee_denom, fee_amount, num_msgs=1):
+    msg = _field_bytes(1, b"/cosmos.bank.v1beta1.MsgSend") + _field_bytes(2, b"\x0a\x2d" + b"c" * 45 + b"\x12" * 60)
+    body = b"".join(_field_bytes(1, msg) for _ in range(num_msgs)) + _field_bytes(2, b"memo")
+    coin = _field_bytes(1, fee_denom.encode()) + _field_bytes(2, fee_amount.encode())
+    fee = _field_bytes(1, coin) + _field_varint(2, 200000)
+    signer_info = _field_bytes(1, b"\x0a\x21" + b"k" * 33) + _field_varint(3, 12345)
+    auth_info = _field_bytes(1, signer_info) + _field_bytes(2, fee)
+    return _field_bytes(1, body) + _field_bytes(2, auth_info) + _field_bytes(3, b"s" * 64)
+
+
+def _b64(s):
+    return base64.b64encode(s.encode()).decode()
+
+
+def make_rpc_elem(i, fee_denom="uatom", fee_amount="5000", num_msgs=1, failed=False):
+    wallet = "cosmos1" + "w" * 38
+    events = []
+    log_events = [
+        {"type": "message", "attributes": [
+            {"key": "action", "value": "/cosmos.bank.v1beta1.MsgSend"},
+            {"key": "sender", "value": wallet},
+            {"key": "module", "value": "bank"},
+        ]},
+        {"type": "transfer", "attributes": [
+            {"key": "recipient", "value": "cosmos1" + "r" * 38},
+            {"key": "sender", "value": wallet},
+            {"key": "amount", "value": "{}uatom".format(1000 + i)},
+        ]},
+    ]
+    for event in log_events * 4:
+        events.append({
+            "type": event["type"],
+            "attributes": [
+                {"key": _b64(kv["key"]), "value": _b64(kv["value"]), "index": True} for kv in event["attributes"]],
+        })
+
+    if failed:
+        log = "failed to execute message; message index: 0: insufficient funds"
+    else:
+        log = json.dumps([{"msg_index": j, "log": "", "events": log_events} for j in range(num_msgs)])
+
+    return {
+        "hash": "{:064X}".format(i),
+        "height": str(1000000 + i),
+        "index": 0,
+        "tx_result": {
+            "code": 5 if failed else 0,
+            "data": "",
+            "log": log,
+            "info": "",
+            "gas_wanted": "200000",
+            "gas_used": "80000",
+            "events": events,
+            "codespace": "",
+        },
+        "tx": base64.b64encode(make_tx_bytes(fee_denom, fee_amount, num_msgs)).decode(),
+    }
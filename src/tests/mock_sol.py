@@ -13,14 +13,25 @@ class MockRpcAPI(RpcAPI):
             RpcAPI._fetch_staking_addresses, wallet_address, TICKER_SOL + "/_fetch_staking_address")
 
     @classmethod
-    def fetch_tx(cls, txid):
-        return mock_query_one_arg(RpcAPI.fetch_tx, txid, TICKER_SOL + "/fetch_tx")
+    def _fetch_tx(cls, txid):
+        return mock_query_one_arg(RpcAPI._fetch_tx, txid, TICKER_SOL + "/fetch_tx")
 
     @classmethod
     def _get_inflation_reward(cls, staking_address, epoch):
         return mock_query_two_args(
             RpcAPI._get_inflation_reward, staking_address, epoch, TICKER_SOL + "/_get_inflation_reward")
 
+    @classmethod
+    def _get_inflation_rewards(cls, staking_addresses, epoch):
+        # Composed from recorded single address queries
+        result = []
+        for staking_address in staking_addresses:
+            data = cls._get_inflation_reward(staking_address, epoch)
+            if not data or "result" not in data:
+                return data
+            result.append(data["result"][0])
+        return {"result": result}
+
     @classmethod
     def _get_txids(cls, wallet_address, limit=None, before=None):
         return mock_query_three_args(
@@ -39,3 +50,24 @@ class MockRpcAPI(RpcAPI):
     @classmethod
     def get_block_time(cls, block):
         return mock_query_one_arg(RpcAPI.get_block_time, block, TICKER_SOL + "/get_block_time")
+
+
+class MockPagedRpcAPI:
+    """ Serves in-memory signatures per address (newest first), limit per page like RpcAPI.get_txids(), and
+    records (address, before_txid) of queries """
+
+    def __init__(self, signatures):
+        self.signatures = signatures
+        self.queries = []
+
+    def get_txids(self, address, limit=None, before_txid=None):
+        self.queries.append((address, before_txid))
+        sigs = self.signatures[address]
+        start = 0 if before_txid is None else [txid for txid, _ in sigs].index(before_txid) + 1
+        page = sigs[start:start + limit]
+        return list(page), page[-1][0] if page else None
+
+
+def paged_signatures(numbers):
+    """ Returns (txid, block_time) list for MockPagedRpcAPI, newest first """
+    return [(f"TX{n}", 1700000000 + n) for n in sorted(numbers, reverse=True)]
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 import staketaxcsv.settings_csv
@@ -35,3 +36,17 @@ def mintscan_api(func):
     if not staketaxcsv.settings_csv.MINTSCAN_KEY:
         return unittest.skip("Skipping test requiring MINTSCAN_KEY")(func)
     return func
+
+
+def start_patches(testcase, patches):
+    """ Starts patches for duration of test (stopped at cleanup) """
+    for p in patches:
+        p.start()
+        testcase.addCleanup(p.stop)
+
+
+def temp_dir(testcase):
+    """ Returns path of temporary directory for duration of test (removed at cleanup) """
+    tmpdir = tempfile.TemporaryDirectory()
+    testcase.addCleanup(tmpdir.cleanup)
+    return tmpdir.name
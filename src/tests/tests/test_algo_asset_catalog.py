@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.algo.asset import Asset
+
+
+class FakeIndexer:
+
+    def __init__(self):
+        self.queried = []
+
+    def get_asset(self, id):
+        self.queried.append(id)
+        if id == 3:
+            return None
+        return {"deleted": id == 2, "params": {"name": f"Asset {id}", "unit-name": f"A{id}", "decimals": 6}}
+
+    def get_deleted_asset(self, id):
+        return {"params": {"name": f"Deleted {id}", "unit-name": f"D{id}", "decimals": 0}}
+
+
+def _axfer(asset_id, inner=()):
+    return {"tx-type": "axfer", "asset-transfer-transaction": {"asset-id": asset_id}, "inner-txns": list(inner)}
+
+
+class TestAlgoAssetCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "algo_assets.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @patch.object(Asset, "catalog_loaded", False)
+    @patch.dict(Asset.asset_list)
+    def test_prefetch(self):
+        transactions = [
+            _axfer(1),
+            {"tx-type": "appl", "application-transaction": {"foreign-assets": [2]}, "inner-txns": [_axfer(3)]},
+            _axfer(0),
+        ]
+        indexer = FakeIndexer()
+        with patch.object(Asset, "indexer", indexer), \
+             patch("staketaxcsv.settings_csv.ALGO_ASSET_CATALOG_PATH", self.path):
+            Asset.prefetch(transactions)
+            self.assertEqual(sorted(indexer.queried), [1, 2, 3])
+            self.assertEqual(Asset(2, 5).ticker, "D2")
+
+            # catalog file is loaded (lazily) by a new process
+            Asset.asset_list.pop(1)
+            Asset.catalog_loaded = False
+            self.assertEqual(Asset(1, 1000000).amount, 1.0)
+            self.assertEqual(sorted(indexer.queried), [1, 2, 3])
+
+            # failed lookup not saved, so retried
+            with self.assertRaises(ValueError):
+                Asset(3)
+            self.assertEqual(sorted(indexer.queried), [1, 2, 3, 3])
@@ -0,0 +1,41 @@
+import unittest
+from types import SimpleNamespace
+
+from staketaxcsv.algo.dapp import DappIndex
+
+USER = "USER"
+POOL = "POOL"
+
+
+def _app_call(app_id, foreign_apps=()):
+    return {"tx-type": "appl", "sender": USER,
+            "application-transaction": {"application-id": app_id, "foreign-apps": list(foreign_apps)}}
+
+
+def _payment(sender, receiver):
+    return {"tx-type": "pay", "sender": sender, "payment-transaction": {"receiver": receiver}}
+
+
+def _dapp(name, application_ids=None, addresses=(), transfer_groups=False):
+    return SimpleNamespace(
+        name=name, application_ids=application_ids, addresses=addresses, transfer_groups=transfer_groups)
+
+
+class TestDappIndex(unittest.TestCase):
+
+    def test_candidates(self):
+        dapps = [
+            _dapp("any"),
+            _dapp("lending", application_ids={100, 101}, addresses={POOL}),
+            _dapp("amm", application_ids={200}, transfer_groups=True),
+        ]
+        index = DappIndex(dapps)
+
+        def names(group):
+            return [app.name for app in index.candidates(group)]
+
+        self.assertEqual(names([_app_call(100)]), ["any", "lending"])
+        self.assertEqual(names([_app_call(5, foreign_apps=[200, 101])]), ["any", "lending", "amm"])
+        self.assertEqual(names([_app_call(5)]), ["any"])
+        self.assertEqual(names([_payment(USER, "OTHER")]), ["any", "amm"])
+        self.assertEqual(names([_payment(POOL, USER), _app_call(5)]), ["any", "lending"])
@@ -0,0 +1,21 @@
+import unittest
+
+from staketaxcsv.algo.handle_group import get_group_ends, get_group_transactions
+
+
+class TestAlgoGrouping(unittest.TestCase):
+
+    def test_group_ends(self):
+        transactions = [
+            {"id": "A", "intra-round-offset": 0},
+            {"id": "B2", "group": "G1", "intra-round-offset": 2},
+            {"id": "B1", "group": "G1", "intra-round-offset": 1},
+            {"id": "C", "group": "G2", "intra-round-offset": 0},
+            {"id": "D", "intra-round-offset": 0},
+            {"id": "E", "intra-round-offset": 0},
+            {"id": "F1", "group": "G3", "intra-round-offset": 1},
+        ]
+        group_ends = get_group_ends(transactions)
+        self.assertEqual(group_ends, [1, 3, 3, 4, 5, 6, 7])
+        self.assertEqual([tx["id"] for tx in get_group_transactions(transactions, 1, group_ends[1])], ["B1", "B2"])
+        self.assertEqual(get_group_ends([]), [])
@@ -0,0 +1,69 @@
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from staketaxcsv import report_algo
+from staketaxcsv.algo.api import indexer as indexer_module
+from staketaxcsv.algo.api.indexer import Indexer
+from staketaxcsv.algo.config_algo import localconfig
+from tests.mock_algo import MockPagedIndexer, paged_transactions
+
+PAGE_SIZE = 3
+
+
+@patch.object(indexer_module, "INDEXER_LIMIT", PAGE_SIZE)
+@patch.object(localconfig, "start_date", None)
+@patch.object(localconfig, "end_date", None)
+class TestAlgoIndexerShards(unittest.TestCase):
+
+    def _get_all(self, indexer, shards):
+        with patch.object(indexer_module, "ALGO_FETCH_SHARDS", shards):
+            return Indexer.get_all_transactions(indexer, "ADDR")
+
+    @patch.object(localconfig, "limit", 1000)
+    @patch.object(localconfig, "min_round", None)
+    def test_sharded_matches_sequential(self):
+        indexer = MockPagedIndexer(paged_transactions([5, 6, 7, 20, 21, 50, 90, 91, 92, 99]), 5, 100)
+
+        expected = self._get_all(indexer, 1)
+        for shards in (2, 3, 4, 100, 1000):
+            self.assertEqual(self._get_all(indexer, shards), expected)
+        self.assertEqual(len(expected), 20)
+
+    @patch.object(localconfig, "limit", 4)
+    @patch.object(localconfig, "min_round", 21)
+    def test_sharded_limit_and_min_round(self):
+        indexer = MockPagedIndexer(paged_transactions([5, 6, 7, 20, 21, 50, 90, 91, 92, 99]), 5, 100)
+
+        expected = self._get_all(indexer, 1)
+        self.assertEqual(self._get_all(indexer, 4), expected)
+        self.assertEqual(len(expected), 6)
+        self.assertEqual(expected[0]["id"], "99-1")
+
+    def test_round_shards(self):
+        indexer = MockPagedIndexer([], 10, 19)
+
+        self.assertEqual(indexer._get_round_shards("ADDR", None, 1), [])
+        self.assertEqual(indexer._get_round_shards("ADDR", None, 3), [(18, None), (14, 17), (10, 13)])
+        self.assertEqual(indexer._get_round_shards("ADDR", 16, 2), [(18, None), (16, 17)])
+        self.assertEqual(indexer._get_round_shards("ADDR", 25, 2), [])
+
+    @patch.object(localconfig, "limit", 1000)
+    @patch.object(localconfig, "min_round", None)
+    @patch.object(localconfig, "track_block", False)
+    def test_extra_transactions_deduped(self):
+        indexer = MockPagedIndexer(paged_transactions([5, 6, 7]), 5, 10)
+        # storage address history overlapping wallet history (6-1), plus tx returned by two dapps (8-0)
+        extra = [{"id": "6-1", "confirmed-round": 6, "intra-round-offset": 1},
+                 {"id": "8-0", "confirmed-round": 8, "intra-round-offset": 0}]
+        dapps = [types.SimpleNamespace(get_extra_transactions=lambda: list(extra)) for _ in range(2)]
+
+        with patch.object(report_algo, "indexer", indexer), \
+                patch.object(indexer_module, "ALGO_FETCH_SHARDS", 1):
+            txs = report_algo._get_txs("ADDR", dapps, MagicMock())
+
+        self.assertEqual([tx["id"] for tx in txs], ["5-0", "5-1", "6-0", "6-1", "7-0", "7-1", "8-0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import functools
+import multiprocessing
+import os
+import tempfile
+import types
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+from staketaxcsv import api
+from staketaxcsv.common.config import config
+from staketaxcsv.common.ErrorCounter import ErrorCounter
+from staketaxcsv.common.Exporter import Exporter, Row
+
+TICKER_FAKE = "FAKE"
+
+# Workers must inherit the patched REPORT_MODULES, so fork them even where spawn is the default (macOS)
+FORK_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+class fakeconfig(config):
+    ticker = TICKER_FAKE
+
+
+def _read_options(options):
+    if "extra" in options:
+        fakeconfig.extra = options["extra"]
+
+
+def _txhistory(wallet_address):
+    if wallet_address == "bad":
+        raise Exception("fetch failed")
+
+    ErrorCounter.increment("unknown", "TX1")
+    exporter = Exporter(wallet_address, fakeconfig, TICKER_FAKE)
+    exporter.ingest_row(Row("2023-01-01 00:00:00", "TRANSFER", "1", TICKER_FAKE, "", "", "", "", "",
+                            wallet_address, "TX1", comment=str(getattr(fakeconfig, "extra", ""))))
+    return exporter
+
+
+FAKE_MODULE = types.SimpleNamespace(localconfig=fakeconfig, read_options=_read_options, txhistory=_txhistory)
+
+
+@unittest.skipUnless(FORK_CONTEXT, "requires fork start method")
+@patch.object(api, "ProcessPoolExecutor", functools.partial(ProcessPoolExecutor, mp_context=FORK_CONTEXT))
+@patch.dict(api.REPORT_MODULES, {TICKER_FAKE: FAKE_MODULE})
+class TestCsvBatch(unittest.TestCase):
+
+    def test_csv_batch(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            summary = api.csv_batch([
+                (TICKER_FAKE, "addr1", "cointracking", {"extra": "x"}),
+                (TICKER_FAKE, "bad", "cointracking"),
+                (TICKER_FAKE, "addr2", "default"),
+            ], workers=1, dirpath=dirpath)
+
+            self.assertEqual(summary["succeeded"], 2)
+            self.assertEqual(summary["failed"], 1)
+            self.assertEqual(summary["error_count"], {"unknown": 2})
+
+            job1, job2, job3 = summary["jobs"]
+            self.assertEqual(job1["num_rows"], 1)
+            self.assertTrue(os.path.exists(job1["paths"][0]))
+            self.assertIn("fetch failed", job2["error"])
+            self.assertEqual(job3["error_count"], {"unknown": 1})
+
+            # options of job1 not seen by job3 on same worker
+            with open(job3["paths"][0]) as f:
+                self.assertNotIn(",x,TX1,", f.read())
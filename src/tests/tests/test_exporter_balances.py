@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from staketaxcsv.common import ExporterTypes as et
+from staketaxcsv.common.config import config
+from staketaxcsv.common.Exporter import Exporter, Row
+
+
+def _exporter():
+    exporter = Exporter("wallet1", config, "SOL")
+    exporter.ingest_row(Row("2023-01-01 00:00:00", et.TX_TYPE_TRANSFER, "1.5", "SOL", "", "", "", "",
+                            "", "wallet1", "TX1"))
+    exporter.ingest_row(Row("2023-01-02 00:00:00", et.TX_TYPE_TRADE, "20", "USDC", "0.5", "SOL", "0.1", "SOL",
+                            "", "wallet1", "TX2"))
+    exporter.ingest_row(Row("2023-01-03 00:00:00", et.TX_TYPE_TRADE, "0", "BONK", "5", "USDC", "", "",
+                            "", "wallet1", "TX3"))
+    return exporter
+
+
+class TestExporterBalances(unittest.TestCase):
+
+    def _export(self, csv_format):
+        with tempfile.TemporaryDirectory() as dirpath:
+            path = _exporter().export_format(csv_format, os.path.join(dirpath, "balances.csv"))
+            with open(path, encoding="utf-8") as f:
+                return f.read().splitlines()
+
+    def test_balances_calculated(self):
+        self.assertEqual(self._export(et.FORMAT_BALANCES_CALCULATED), [
+            "timestamp,txid,BONK,SOL,USDC",
+            "2023-01-03 00:00:00,TX3,0,0.9,15.0",
+            "2023-01-02 00:00:00,TX2,0,0.9,20.0",
+            "2023-01-01 00:00:00,TX1,0,1.5,0",
+        ])
+
+    def test_balances_calculated_long(self):
+        self.assertEqual(self._export(et.FORMAT_BALANCES_CALCULATED_LONG), [
+            "timestamp,txid,currency,balance",
+            "2023-01-03 00:00:00,TX3,USDC,15.0",
+            "2023-01-02 00:00:00,TX2,SOL,0.9",
+            "2023-01-02 00:00:00,TX2,USDC,20.0",
+            "2023-01-01 00:00:00,TX1,SOL,1.5",
+        ])
+        # Only exported when requested explicitly
+        self.assertNotIn(et.FORMAT_BALANCES_CALCULATED_LONG, et.FORMATS)
+
+
+if __name__ == "__main__":
+    unittest.main()
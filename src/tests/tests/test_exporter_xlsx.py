@@ -0,0 +1,50 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from openpyxl import load_workbook
+
+from staketaxcsv.common import ExporterTypes as et
+from staketaxcsv.common.config import config
+from staketaxcsv.common.Exporter import Exporter, Row
+
+
+def _exporter():
+    exporter = Exporter("wallet1", config, "SOL")
+    exporter.ingest_row(Row("2023-01-01 00:00:00", et.TX_TYPE_TRADE, "1.5", "SOL", "20", "USDC", "0.000005", "SOL",
+                            "", "wallet1", "TX1", comment="swap"))
+    exporter.ingest_row(Row("2023-01-02 00:00:00", et.TX_TYPE_STAKING, "0.01", "SOL", "", "", "", "",
+                            "", "wallet1", "TX2"))
+    return exporter
+
+
+class TestExporterXlsx(unittest.TestCase):
+
+    def test_xlsx_formats(self):
+        for csv_format in (et.FORMAT_ACCOINTING, et.FORMAT_BLOCKPIT, et.FORMAT_KRYPTOS):
+            with tempfile.TemporaryDirectory() as dirpath:
+                csvpath = os.path.join(dirpath, "{}.csv".format(csv_format))
+                xlsxpath = _exporter().export_format(csv_format, csvpath)
+                self.assertEqual(xlsxpath, csvpath.replace(".csv", ".xlsx"))
+
+                with open(csvpath, newline="", encoding="utf-8") as f:
+                    csv_lines = list(csv.reader(f))
+                sheet = load_workbook(xlsxpath).active
+                xlsx_lines = [list(line) for line in sheet.iter_rows(values_only=True)]
+
+            # Same table as CSV, with numbers as numbers and empty fields as empty cells
+            self.assertEqual(len(xlsx_lines), 3)
+            self.assertIn(1.5, xlsx_lines[1] + xlsx_lines[2])
+            for csv_line, xlsx_line in zip(csv_lines, xlsx_lines):
+                expected = [None if value == "" else value for value in csv_line]
+                actual = [value if value is None or isinstance(value, str) else float(value) for value in xlsx_line]
+                for value_expected, value_actual in zip(expected, actual):
+                    if isinstance(value_actual, float):
+                        self.assertEqual(float(value_expected), value_actual)
+                    else:
+                        self.assertEqual(value_expected, value_actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
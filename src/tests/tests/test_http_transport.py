@@ -0,0 +1,76 @@
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from staketaxcsv.common import http_transport, query
+from staketaxcsv.common.http_transport import HostLimits, HttpMetrics, TransportSession
+
+
+class FakeAdapter(BaseAdapter):
+    """ Returns queued (status_code, headers, data) responses """
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+
+    def send(self, request, **kwargs):
+        status_code, headers, data = self.responses.pop(0)
+        response = Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response._content = json.dumps(data).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestHttpTransport(unittest.TestCase):
+
+    def setUp(self):
+        HttpMetrics.reset()
+
+    def _session(self, responses):
+        session = TransportSession()
+        session.mount("https://fake.node", FakeAdapter(responses))
+        return session
+
+    def test_metrics(self):
+        session = self._session([(200, {}, {"a": 1}), (500, {}, {})])
+
+        self.assertEqual(session.get("https://fake.node/a").json(), {"a": 1})
+        session.get("https://fake.node/b")
+
+        metrics = HttpMetrics.summary()["fake.node"]
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["errors"], 1)
+        self.assertEqual(metrics["bytes"], len(b'{"a": 1}') + len(b"{}"))
+
+    @patch.object(query.time, "sleep")
+    def test_retry_on_429(self, mock_sleep):
+        session = self._session([(429, {"Retry-After": "3"}, {}), (429, {}, {}), (200, {}, {"ok": True})])
+
+        data = query.get_with_retries(session, "https://fake.node/c", {}, {}, backoff_factor=2)
+
+        self.assertEqual(data, {"ok": True})
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [3.0, 4])
+
+    @patch.dict(HostLimits.intervals)
+    def test_throttle(self):
+        start = time.monotonic()
+        for _ in range(3):
+            http_transport.throttle("https://throttle.node/path", 0.05)
+        http_transport.throttle("https://other.node/path", 0.05)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.ibc import denoms
+from staketaxcsv.common.ibc.denoms import IBCAddrs
+
+HASH_A = "A" * 64
+HASH_B = "B" * 64
+
+
+class TestIbcDenomsPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.addrs = dict(IBCAddrs.addrs)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ibc_denoms.json")
+        IBCAddrs.loaded_local = False
+
+    def tearDown(self):
+        IBCAddrs.addrs = self.addrs
+        IBCAddrs.loaded_local = False
+        self.tmpdir.cleanup()
+
+    def test_prefetch_and_local_cache(self):
+        elems = [
+            {"tx": {"body": {"messages": [{"amount": [{"denom": f"ibc/{HASH_A}", "amount": "1"}]}]}}},
+            {"logs": [{"events": [{"attributes": [{"key": "amount", "value": f"5ibc/{HASH_B},7uatom"}]}]}]},
+        ]
+        lookups = []
+
+        def lookup(node, ibc_address):
+            lookups.append(ibc_address)
+            return "uosmo" if ibc_address.endswith(HASH_A) else None
+
+        with patch("staketaxcsv.settings_csv.IBC_DENOM_CACHE_PATH", self.path), \
+             patch.object(denoms, "_lookup_denom", lookup):
+            IBCAddrs.prefetch("https://fake-node", elems)
+            self.assertEqual(sorted(lookups), [f"ibc/{HASH_A}", f"ibc/{HASH_B}"])
+            self.assertEqual(IBCAddrs.addrs[f"ibc/{HASH_A}"], "uosmo")
+            self.assertNotIn(f"ibc/{HASH_B}", IBCAddrs.addrs)
+
+            IBCAddrs.set_cache()
+            with open(self.path) as f:
+                self.assertEqual(json.load(f)[f"ibc/{HASH_A}"], "uosmo")
+
+            # new process: loaded from local cache, without lookup
+            IBCAddrs.addrs = dict(self.addrs)
+            IBCAddrs.loaded_local = False
+            lookups.clear()
+            IBCAddrs.prefetch("https://fake-node", elems[:1])
+            self.assertEqual(lookups, [])
+            self.assertEqual(IBCAddrs.ibc_address_to_denom("https://fake-node", f"ibc/{HASH_A}"), "uosmo")
+
+    def test_prefetch_skips_resolved(self):
+        elems = [{"logs": [{"events": [{"attributes": [{"key": "amount", "value": f"5ibc/{HASH_A},7ibc/{HASH_B}"}]}]}]}]
+        lookups = []
+
+        def lookup(node, ibc_address):
+            lookups.append(ibc_address)
+            return None
+
+        with patch("staketaxcsv.settings_csv.IBC_DENOM_CACHE_PATH", ""), \
+             patch.object(denoms, "_lookup_denom", lookup):
+            IBCAddrs.prefetch("https://fake-node", elems, resolved={f"ibc/{HASH_A}"})
+        self.assertEqual(lookups, [f"ibc/{HASH_B}"])
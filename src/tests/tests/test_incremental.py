@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.Exporter import Exporter, Row
+from staketaxcsv.common.ibc import tx_data
+from staketaxcsv.common.incremental import incremental_report
+
+ADDRESS = "addr1"
+
+
+class FakeConfig:
+    incremental = True
+    start_date = None
+    end_date = None
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.patcher = patch("staketaxcsv.common.incremental.INCREMENTAL_DIR", self.tmpdir.name)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmpdir.cleanup()
+
+    def _txhistory(self, localconfig, txs, start_dates):
+        @incremental_report("ATOM", localconfig)
+        def txhistory(wallet_address):
+            start_dates.append(localconfig.start_date)
+            exporter = Exporter(wallet_address, localconfig, "ATOM")
+            for timestamp, txid in txs:
+                if localconfig.start_date and timestamp[:10] < localconfig.start_date:
+                    continue
+                exporter.ingest_row(_row(timestamp, txid))
+            return exporter
+
+        return txhistory
+
+    def test_merge(self):
+        localconfig = FakeConfig()
+        txs = [("2023-01-01 00:00:00", "A"), ("2023-01-05 10:00:00", "B")]
+        start_dates = []
+
+        exporter = self._txhistory(localconfig, txs, start_dates)(ADDRESS)
+        self.assertEqual(len(exporter.rows), 2)
+
+        txs += [("2023-01-05 12:00:00", "C"), ("2023-02-01 00:00:00", "D")]
+        exporter = self._txhistory(localconfig, txs, start_dates)(ADDRESS)
+
+        self.assertEqual(start_dates, [None, "2023-01-05"])
+        self.assertIsNone(localconfig.start_date)
+        self.assertEqual(sorted(row.txid for row in exporter.rows), ["A", "B", "C", "D"])
+
+    def test_date_options_changed(self):
+        localconfig = FakeConfig()
+        txs = [("2023-01-01 00:00:00", "A"), ("2023-01-05 10:00:00", "B")]
+        start_dates = []
+
+        self._txhistory(localconfig, txs, start_dates)(ADDRESS)
+        localconfig.start_date = "2023-01-02"
+        exporter = self._txhistory(localconfig, txs, start_dates)(ADDRESS)
+
+        self.assertEqual(start_dates, [None, "2023-01-02"])
+        self.assertEqual([row.txid for row in exporter.rows], ["B"])
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, f"incremental.ATOM.{ADDRESS}.json")))
+
+    def test_lcd_known_txids_without_tx_store(self):
+        localconfig = FakeConfig()
+        txs = [("2023-01-01 00:00:00", "A"), ("2023-01-05 10:00:00", "B")]
+        known_txids = []
+
+        def get_txs_all(lcd_node, address, max_txs, progress=None, **kwargs):
+            known_txids.append(kwargs.get("known_txids"))
+            return []
+
+        @incremental_report("ATOM", localconfig)
+        def txhistory(wallet_address):
+            tx_data.TxDataLcd("https://lcd", 1000).get_txs_all(wallet_address, None)
+            tx_data.TxDataLcd("https://lcd", 1000).get_txs_all("other_address", None)
+            exporter = Exporter(wallet_address, localconfig, "ATOM")
+            for timestamp, txid in txs:
+                exporter.ingest_row(_row(timestamp, txid))
+            return exporter
+
+        with patch.object(tx_data, "get_tx_store", return_value=None), \
+                patch.object(tx_data.api_lcd, "make_lcd_api"), \
+                patch.object(tx_data.api_lcd, "get_txs_all", get_txs_all):
+            txhistory(ADDRESS)
+            txhistory(ADDRESS)
+
+        # Second run stops paging wallet txs at saved rows (only for the wallet address)
+        self.assertEqual(known_txids, [None, None, {"A", "B"}, None])
+
+
+def _row(timestamp, txid):
+    return Row(timestamp, "TRANSFER", "1", "ATOM", "", "", "", "", "", ADDRESS, txid)
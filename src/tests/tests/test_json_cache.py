@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+
+from staketaxcsv.common import json_cache
+
+
+class TestJsonCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache", "data.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_merge_write(self):
+        self.assertEqual(json_cache.read(self.path), {})
+
+        json_cache.merge_write(self.path, {"a": 1, "b": 2})
+        # i.e. other process wrote "c" since loaded; "b" expired
+        json_cache.merge_write(self.path, {"c": 3})
+        json_cache.merge_write(self.path, {"a": 4}, keep=lambda k, v: k != "b")
+
+        self.assertEqual(json_cache.read(self.path), {"a": 4, "c": 3})
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["data.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from staketaxcsv.common.ibc import api_lcd_v2, lcd_fetch
+from staketaxcsv.common.ibc.api_lcd_v2 import LcdAPI_v2
+from staketaxcsv.common.ibc.constants import EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SENDER, EVENTS_TYPE_SIGNER
+from tests.mock_lcd import MockPagedLcd, lcd_tx
+from tests.settings_test import start_patches
+
+NODE = "https://fake.lcd"
+WALLET = "cosmos1wallet"
+
+
+class TestLcdFetch(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = MockPagedLcd({
+            EVENTS_TYPE_SENDER: [lcd_tx(i) for i in range(0, 25)],
+            EVENTS_TYPE_RECIPIENT: [lcd_tx(i) for i in range(20, 32)],
+            EVENTS_TYPE_SIGNER: [],
+        })
+        self.events_types = [EVENTS_TYPE_SENDER, EVENTS_TYPE_RECIPIENT, EVENTS_TYPE_SIGNER]
+        start_patches(self, [
+            patch.object(LcdAPI_v2, "_get_txs", lambda api, *args: self.fake._get_txs(*args)),
+            patch.object(LcdAPI_v2, "cosmos_sdk_version", lambda api: "0.47.0"),
+            patch.object(lcd_fetch.ProbePages, "pages", {}),
+        ])
+
+    def test_probe_pages_reused(self):
+        pages = api_lcd_v2.get_txs_pages_count(
+            NODE, WALLET, 1000, limit=10, sleep_seconds=0, events_types=self.events_types)
+        elems = api_lcd_v2.get_txs_all(NODE, WALLET, 1000, limit=10, sleep_seconds=0, events_types=self.events_types)
+
+        self.assertEqual(pages, 3 + 2 + 1)
+        self.assertEqual([elem["txhash"] for elem in elems], [f"TX{i}" for i in range(32)])
+        # Every page requested once, including first pages fetched by get_txs_pages_count()
+        self.assertEqual(set(self.fake.requests.values()), {1})
+        self.assertEqual(len(self.fake.requests), pages)
+
+    def test_known_txids(self):
+        elems = api_lcd_v2.get_txs_all(NODE, WALLET, 1000, limit=10, sleep_seconds=0, known_txids={"TX17", "TX31"})
+
+        # sender paging stops at page 1 (TX15-TX24), recipient at page 1 (TX22-TX31)
+        self.assertEqual([elem["txhash"] for elem in elems], [f"TX{i}" for i in range(15, 32)])
+        # Only first page of each events type requested
+        self.assertEqual(self.fake.requests, Counter({(EVENTS_TYPE_SENDER, 1): 1, (EVENTS_TYPE_RECIPIENT, 1): 1}))
+
+    def test_max_txs(self):
+        elems = api_lcd_v2.get_txs_all(NODE, WALLET, 20, limit=10, sleep_seconds=0)
+
+        self.assertEqual([elem["txhash"] for elem in elems], [f"TX{i}" for i in range(5, 32)])
+        self.assertNotIn((EVENTS_TYPE_SENDER, 3), self.fake.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import staketaxcsv.report_luna1 as report_luna1
+from staketaxcsv.luna1 import snapshot, util_terra
+from staketaxcsv.luna1.config_luna1 import localconfig
+from tests.mock_luna1 import MockPagedFcdAPI
+from tests.settings_test import start_patches, temp_dir
+
+WALLET = "terra1wallet"
+
+
+class TestLuna1Snapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(temp_dir(self), "luna1.sqlite")
+        start_patches(self, [
+            patch("staketaxcsv.settings_csv.LUNA1_SNAPSHOT_PATH", self.path),
+            patch.object(snapshot.Snapshots, "stores", {}),
+            patch.object(localconfig, "limit", 1000),
+        ])
+
+    def _get_txs(self, fcd):
+        with patch.object(report_luna1, "FcdAPI", fcd):
+            elems = report_luna1._get_txs(WALLET, MagicMock())
+        return sorted(elem["txhash"] for elem in elems)
+
+    def test_txs_served_from_snapshot(self):
+        fcd = MockPagedFcdAPI([1, 2, 3, 4, 5])
+        self.assertEqual(self._get_txs(fcd), ["TX1", "TX2", "TX3", "TX4", "TX5"])
+        self.assertEqual(fcd.pages, 3)
+
+        # New txs after snapshot: fetch stops at first page overlapping snapshot
+        fcd = MockPagedFcdAPI([1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(self._get_txs(fcd), ["TX1", "TX2", "TX3", "TX4", "TX5", "TX6", "TX7", "TX8"])
+        self.assertEqual(fcd.pages, 2)
+
+        fcd = MockPagedFcdAPI([1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(len(self._get_txs(fcd)), 8)
+        self.assertEqual(fcd.pages, 1)
+
+    def test_incomplete_fetch_not_recorded(self):
+        with patch.object(localconfig, "limit", 200):
+            # max_txs limit reached before end of history
+            fcd = MockPagedFcdAPI(range(1, 400))
+            self._get_txs(fcd)
+        self.assertIsNone(snapshot.stored_txs(WALLET))
+
+    def test_snapshot_txs_limited_to_max_txs(self):
+        fcd = MockPagedFcdAPI([1, 2, 3, 4, 5])
+        self._get_txs(fcd)
+
+        # max_txs=4 (2 queries of 2 txs): newest 4 txs, as when fetching entire history from fcd
+        fcd = MockPagedFcdAPI([1, 2, 3, 4, 5, 6])
+        with patch.object(localconfig, "limit", 4), patch.object(report_luna1, "LIMIT_FCD", 2):
+            self.assertEqual(self._get_txs(fcd), ["TX3", "TX4", "TX5", "TX6"])
+
+    def test_contract_history(self):
+        fetch = MagicMock(return_value={"entries": [{"msg": {"symbol": "ANC", "decimals": 6}}]})
+
+        with patch.object(util_terra.LcdAPI, "contract_history", fetch):
+            self.assertEqual(util_terra._query_wasm("terra1contract"), {"symbol": "ANC", "decimals": 6})
+            self.assertEqual(util_terra._query_wasm("terra1contract"), {"symbol": "ANC", "decimals": 6})
+        fetch.assert_called_once_with("terra1contract")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import datetime
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.ibc import api_mintscan_v1
+from staketaxcsv.common.ibc.api_mintscan_v1 import MintscanAPI, TXS_LIMIT_PER_QUERY, _date_windows
+
+ADDRESS = "cosmos1fakeaddress"
+
+
+def _make_txs(num_txs):
+    """ Returns fake transactions (newest first), spread a few hours apart starting 2021-01-01 """
+    start = datetime.datetime(2021, 1, 1)
+    txs = []
+    for i in range(num_txs):
+        ts = start + datetime.timedelta(hours=7 * i)
+        txs.append({"txhash": f"TX{i:05d}", "timestamp": ts.strftime("%Y-%m-%dT%H:%M:%SZ"), "tx": {}})
+    txs.reverse()
+    return txs
+
+
+class FakeMintscanAPI(MintscanAPI):
+    """ Emulates searchAfter/fromDateTime/toDateTime paging of /accounts/{address}/transactions """
+    txs = []
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def _get_txs(self, address, search_after=None, limit=TXS_LIMIT_PER_QUERY, from_date_time=None, to_date_time=None):
+        matches = []
+        for tx in self.txs:
+            ts = tx["timestamp"].replace("T", " ").replace("Z", "")
+            if from_date_time and ts < from_date_time:
+                continue
+            if to_date_time and ts > to_date_time:
+                continue
+            matches.append(dict(tx))
+
+        offset = int(search_after) if search_after else 0
+        page = matches[offset:offset + limit]
+        return {
+            "transactions": page,
+            "pagination": {
+                "searchAfter": str(offset + len(page)) if page else None,
+                "totalCount": len(matches),
+            }
+        }
+
+
+@patch("staketaxcsv.common.ibc.api_mintscan_v1.MintscanAPI", new=FakeMintscanAPI)
+class TestMintscanWindows(unittest.TestCase):
+
+    def _assert_same_as_serial(self, num_txs, max_txs, start_date=None, end_date=None):
+        FakeMintscanAPI.txs = _make_txs(num_txs)
+
+        serial = api_mintscan_v1.get_txs_all(
+            "ATOM", ADDRESS, max_txs, start_date=start_date, end_date=end_date, num_windows=1)
+        for num_windows in [2, 5, 16]:
+            windowed = api_mintscan_v1.get_txs_all(
+                "ATOM", ADDRESS, max_txs, start_date=start_date, end_date=end_date, num_windows=num_windows)
+            self.assertEqual([e["txhash"] for e in windowed], [e["txhash"] for e in serial])
+        return serial
+
+    def test_all_txs(self):
+        result = self._assert_same_as_serial(537, 20000)
+        self.assertEqual(len(result), 537)
+
+    def test_max_txs_keeps_newest(self):
+        result = self._assert_same_as_serial(537, 110)
+        self.assertEqual(len(result), 120)
+        self.assertEqual(result[-1]["txhash"], "TX00536")
+
+    def test_dates(self):
+        result = self._assert_same_as_serial(537, 20000, start_date="2021-02-01", end_date="2021-03-15")
+        self.assertEqual(result[0]["timestamp"], "2021-02-01T05:00:00Z")
+        self.assertEqual(result[-1]["timestamp"], "2021-03-15T19:00:00Z")
+
+    def test_date_windows(self):
+        windows = _date_windows("2021-01-01", "2021-01-10", 3)
+        self.assertEqual(windows, [
+            ("2021-01-09", "2021-01-10"),
+            ("2021-01-05", "2021-01-08"),
+            ("2021-01-01", "2021-01-04"),
+        ])
+
+        windows = _date_windows("2021-01-01", None, 4)
+        self.assertEqual(windows[0][1], None)
+        self.assertEqual(windows[-1][0], "2021-01-01")
+
+        self.assertEqual(_date_windows("2021-01-01", "2021-01-01", 4), [("2021-01-01", "2021-01-01")])
@@ -0,0 +1,95 @@
+import copy
+import glob
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.ibc import denoms
+from staketaxcsv.common.ibc.MsgInfoIBC import MsgInfoIBC
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "data")
+EXPECTED_PATH = os.path.join(DATA_DIR, "msginfo_ibc_views.json")
+ADDRESS_KEYS = ("sender", "spender", "receiver", "recipient")
+
+
+def _elems(obj):
+    """ Yields lcd tx elements found in (nested) fixture data """
+    if isinstance(obj, dict):
+        if isinstance(obj.get("logs"), list) and "tx" in obj:
+            yield obj
+        else:
+            for value in obj.values():
+                yield from _elems(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _elems(value)
+
+
+def cases():
+    """ Yields (key, wallet_address, msg_index, message, log) for messages of txs in tests/data, for up to
+        3 addresses found in each tx's events """
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "**", "*.json"), recursive=True)):
+        if path == EXPECTED_PATH:
+            continue
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except ValueError:
+            continue
+
+        for elem in _elems(data):
+            if not elem["logs"] or "body" not in elem["tx"]:
+                continue
+            messages = elem["tx"]["body"]["messages"]
+
+            addresses = set()
+            for log in elem["logs"]:
+                for event in log.get("events", []):
+                    for attribute in event["attributes"]:
+                        if attribute.get("key") in ADDRESS_KEYS and attribute.get("value"):
+                            addresses.add(attribute["value"])
+
+            for wallet_address in sorted(addresses)[:3]:
+                for i, log in enumerate(elem["logs"][:len(messages)]):
+                    key = "{}|{}|{}".format(os.path.relpath(path, DATA_DIR), elem.get("txhash"), i)
+                    yield key, wallet_address, i, messages[i], log
+
+
+def views(cls):
+    """ Returns json compatible {"transfers": {tx key|wallet: transfer views}, "events_by_type": {tx key: ...}}
+        of cls over all cases.  Constructor failures are recorded as exception type name. """
+    out = {"transfers": {}, "events_by_type": {}}
+    with patch.object(denoms, "amount_currency_from_raw", lambda amount, currency, lcd_node: (
+            float(amount), currency)):
+        for key, wallet_address, i, message, log in cases():
+            try:
+                msginfo = cls(wallet_address, i, copy.deepcopy(message), copy.deepcopy(log), "node")
+            except Exception as e:
+                out["transfers"]["{}|{}".format(key, wallet_address)] = {"exception": type(e).__name__}
+                continue
+            out["transfers"]["{}|{}".format(key, wallet_address)] = {
+                "transfers": msginfo.transfers,
+                "transfers_net": msginfo.transfers_net,
+                "transfers_event": msginfo.transfers_event,
+                "wasm": msginfo.wasm,
+            }
+            out["events_by_type"][key] = msginfo.events_by_type
+    return json.loads(json.dumps(out))
+
+
+class TestMsgInfoIBC(unittest.TestCase):
+
+    def test_views_match_expected(self):
+        with open(EXPECTED_PATH) as f:
+            expected = json.load(f)
+        actual = views(MsgInfoIBC)
+
+        for view in ("transfers", "events_by_type"):
+            self.assertEqual(sorted(actual[view]), sorted(expected[view]))
+            for key in expected[view]:
+                self.assertEqual(actual[view][key], expected[view][key], key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv import api
+from staketaxcsv.osmo import api_osmosis, denoms
+from staketaxcsv.osmo.config_osmo import localconfig
+from staketaxcsv.osmo.denoms import TokenMetadata
+
+HASH_A = "A" * 64
+HASH_B = "B" * 64
+METADATA = {
+    f"ibc/{HASH_A}": {"symbol": "USDC.eth.axl", "decimals": 6},
+    "uosmo": {"symbol": "OSMO", "decimals": 6},
+}
+
+
+class TestOsmoTokenMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "osmo_tokens.json")
+        self.queries = []
+        localconfig.token_metadata = {}
+        TokenMetadata.fetched_at = {}
+        TokenMetadata.loaded_local = False
+
+    def tearDown(self):
+        localconfig.token_metadata = {}
+        TokenMetadata.fetched_at = {}
+        TokenMetadata.loaded_local = False
+        self.tmpdir.cleanup()
+
+    def _get_tokens_metadata(self, denom_list):
+        # Mimics api failing as a whole if any denom is unknown
+        self.queries.append(list(denom_list))
+        if any(denom not in METADATA for denom in denom_list):
+            return {}
+        return {denom: METADATA[denom] for denom in denom_list}
+
+    def test_prefetch_batches_and_cache(self):
+        elems = [
+            {"tx": {"body": {"messages": [{"token": {"denom": f"ibc/{HASH_A}", "amount": "1"}}]}}},
+            {"logs": [{"events": [{"type": "transfer", "attributes": [
+                {"key": "amount", "value": f"5ibc/{HASH_B},7uosmo"},
+                {"key": "sender", "value": "osmo1abc"},
+            ]}]}]},
+        ]
+
+        with patch("staketaxcsv.settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH", self.path), \
+             patch.object(api_osmosis, "get_tokens_metadata", self._get_tokens_metadata), \
+             patch.object(api_osmosis, "get_token_metadata") as mock_get_token_metadata:
+            TokenMetadata.prefetch(elems)
+
+            self.assertEqual(self.queries[0], [f"ibc/{HASH_A}", f"ibc/{HASH_B}", "uosmo"])
+            self.assertEqual(localconfig.token_metadata, {
+                f"ibc/{HASH_A}": ("USDC", 6), f"ibc/{HASH_B}": (None, None), "uosmo": ("OSMO", 6)})
+            self.assertEqual(denoms._amount_currency_from_api_osmosis("2000000", "uosmo"), (2.0, "OSMO"))
+            mock_get_token_metadata.assert_not_called()
+
+            TokenMetadata.set_cache()
+
+            # new process: loaded from local cache, without query
+            localconfig.token_metadata = {}
+            TokenMetadata.loaded_local = False
+            self.queries = []
+            TokenMetadata.prefetch(elems[:1])
+            self.assertEqual(self.queries, [])
+            self.assertEqual(localconfig.token_metadata[f"ibc/{HASH_A}"], ("USDC", 6))
+
+    def test_cache_ttl(self):
+        with open(self.path, "w") as f:
+            json.dump({
+                "uosmo": ["OSMO", 6, time.time()],
+                "uatom": ["ATOM", 6, time.time() - 30 * 86400],
+            }, f)
+
+        with patch("staketaxcsv.settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH", self.path), \
+             patch("staketaxcsv.settings_csv.OSMO_TOKEN_METADATA_TTL_DAYS", 7):
+            TokenMetadata._load_local_cache()
+
+        self.assertEqual(localconfig.token_metadata, {"uosmo": ("OSMO", 6)})
+
+    def test_unknown_denom_recorded(self):
+        elems = [{"logs": [{"events": [{"type": "coin_received", "attributes": [
+            {"key": "amount", "value": f"5ibc/{HASH_B},7uosmo"}]}]}]}]
+
+        with patch("staketaxcsv.settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH", ""), \
+             patch.object(api_osmosis, "get_tokens_metadata", self._get_tokens_metadata), \
+             patch.object(api_osmosis, "get_token_metadata") as mock_get_token_metadata:
+            TokenMetadata.prefetch(elems)
+            self.assertEqual(self.queries, [[f"ibc/{HASH_B}", "uosmo"], [f"ibc/{HASH_B}"], ["uosmo"]])
+            self.assertEqual(localconfig.token_metadata[f"ibc/{HASH_B}"], (None, None))
+
+            # processing falls back to lcd without querying osmosis api again
+            self.assertEqual(denoms._amount_currency_from_api_osmosis("5", f"ibc/{HASH_B}"), (None, None))
+            mock_get_token_metadata.assert_not_called()
+            self.assertNotIn(f"ibc/{HASH_B}", TokenMetadata.resolved())
+
+    def test_denoms_only_from_coins(self):
+        elems = [{
+            "tx": {"body": {"messages": [{"duration": "1209600s", "coins": [{"denom": "gamm/pool/1", "amount": "5"}]}]}},
+            "logs": [{"events": [
+                {"type": "lock_tokens", "attributes": [
+                    {"key": "duration", "value": "336h0m0s"},
+                    {"key": "amount", "value": "5gamm/pool/1"},
+                ]},
+                {"type": "wasm", "attributes": [{"key": "sender", "value": "0x5c7f8a570d578ed84e63fdfa7b1ee72deae1ae23"}]},
+                {"type": "coin_spent", "attributes": [
+                    {"key": "spender", "value": "osmo1abc"},
+                    {"key": "amount", "value": "7uosmo"},
+                ]},
+            ]}],
+        }]
+
+        self.assertEqual(denoms._denoms(elems), {"gamm/pool/1", "uosmo"})
+
+    def test_split_depth_capped(self):
+        denom_list = [f"ibc/{i:064X}" for i in range(40)]
+
+        with patch.object(api_osmosis, "get_tokens_metadata", self._get_tokens_metadata):
+            TokenMetadata._prefetch_batch(denom_list)
+
+        # 1 + 2 + 4 + 8 + 16 queries, and remaining batches (of 2-3 denoms) left to per-denom lookup
+        self.assertEqual(len(self.queries), 31)
+        self.assertEqual(localconfig.token_metadata, {})
+
+    def test_reset_between_batch_jobs(self):
+        with open(self.path, "w") as f:
+            json.dump({"uosmo": ["OSMO", 6, time.time()]}, f)
+
+        with patch("staketaxcsv.settings_csv.OSMO_TOKEN_METADATA_CACHE_PATH", self.path):
+            TokenMetadata._load_local_cache()
+            api._reset_batch_state()
+            localconfig.token_metadata = {}
+
+            # next job in same worker reloads local cache
+            TokenMetadata._load_local_cache()
+        self.assertEqual(localconfig.token_metadata, {"uosmo": ("OSMO", 6)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.ibc import api_rpc
+from staketaxcsv.common.ibc.protobuf_decoder import CosmosTransactionFeeExtractor, ProtobufParser, decode_varint
+from tests.mock_rpc import make_rpc_elem, make_tx_bytes
+
+NODE = "https://rpc.fake.node"
+
+
+def _block_time(height):
+    return "2021-08-26T21:{:02d}:{:02d}.86954814Z".format(height // 60 % 60, height % 60)
+
+
+class FakeRpcAPI(api_rpc.RpcAPI):
+    """ Emulates /blockchain and /block queries, recording queried heights """
+    queries = []
+    blockchain_supported = True
+
+    def _blockchain(self, min_height, max_height):
+        self.queries.append(("blockchain", min_height, max_height))
+        if not self.blockchain_supported:
+            return {"error": {"code": -32601, "message": "Method not found"}}
+        metas = [{"header": {"height": str(h), "time": _block_time(h)}}
+                 for h in range(max_height, max(min_height, max_height - api_rpc.BLOCKCHAIN_MAX_HEIGHTS + 1) - 1, -1)]
+        return {"result": {"last_height": "99999999", "block_metas": metas}}
+
+    def _block(self, height):
+        self.queries.append(("block", height))
+        return {"result": {"block": {"header": {"height": str(height), "time": _block_time(int(height))}}}}
+
+
+@patch("staketaxcsv.common.ibc.api_rpc.RpcAPI", new=FakeRpcAPI)
+class TestRpcNormalize(unittest.TestCase):
+
+    def setUp(self):
+        FakeRpcAPI.queries = []
+        FakeRpcAPI.blockchain_supported = True
+        api_rpc.RpcAPI.block_time_cache.clear()
+
+    def test_normalize(self):
+        elems = [make_rpc_elem(0, fee_denom="ujuno", fee_amount="1234", num_msgs=2),
+                 make_rpc_elem(1, failed=True)]
+        api_rpc.normalize_rpc_txns(NODE, elems)
+
+        elem = elems[0]
+        self.assertEqual(elem["txhash"], elem["hash"])
+        self.assertEqual(elem["code"], 0)
+        self.assertEqual(elem["timestamp"], "2021-08-26T21:46:40Z")
+        self.assertEqual(elem["tx"]["auth_info"]["fee"]["amount"], [{"denom": "ujuno", "amount": "1234"}])
+        messages = elem["tx"]["body"]["messages"]
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0]["@type"], "/cosmos.bank.v1beta1.MsgSend")
+        self.assertEqual(len(elem["logs"]), 2)
+
+        failed = elems[1]
+        self.assertEqual(failed["code"], 5)
+        self.assertEqual(failed["logs"], [])
+        self.assertTrue(failed["tx_result"]["log_original"].startswith("failed to execute message"))
+        self.assertEqual(failed["tx"]["body"]["messages"], [])
+
+    def test_normalize_progress(self):
+        class FakeProgress:
+            def __init__(self):
+                self.reports = []
+
+            def report(self, num, message, stage_name="default"):
+                self.reports.append((num, message.split()[0]))
+
+        progress = FakeProgress()
+        elems = [make_rpc_elem(i) for i in range(450)]
+        api_rpc.normalize_rpc_txns(NODE, elems, progress, "normalize")
+
+        # decode reports per chunk, then block time reports per range query, then final report
+        nums = [num for num, _ in progress.reports]
+        self.assertEqual(nums, sorted(nums))
+        self.assertEqual(progress.reports[:2], [(100, "Decoded"), (200, "Decoded")])
+        self.assertEqual(sum(1 for _, kind in progress.reports if kind == "Fetched"),
+                         len([q for q in FakeRpcAPI.queries if q[0] == "blockchain"]))
+        self.assertEqual(progress.reports[-1], (450, "Normalized"))
+
+    def test_parse_log_python_literal(self):
+        self.assertEqual(api_rpc._parse_log("[{'msg_index': 0, 'events': []}]"), [{"msg_index": 0, "events": []}])
+        self.assertIsNone(api_rpc._parse_log("out of gas in location: WriteFlat"))
+
+    def test_decode_varint(self):
+        self.assertEqual(decode_varint(b"\x96\x01\x05", 0), (150, 2))
+        self.assertEqual(decode_varint(memoryview(b"\x00\x96\x01"), 1), (150, 3))
+
+    def test_fee_extractor(self):
+        callback = CosmosTransactionFeeExtractor()
+        ProtobufParser(make_tx_bytes("uosmo", "2500", num_msgs=3), callback).parse()
+        self.assertEqual((callback.fee_denom, callback.fee_amount), ("uosmo", "2500"))
+
+    def test_block_times(self):
+        heights = [100, 105, 119, 120, 5000, 105, 5001]
+        block_times = api_rpc.get_block_times(NODE, heights)
+
+        self.assertEqual(block_times, {h: _block_time(h) for h in heights})
+        self.assertEqual(FakeRpcAPI.queries, [
+            ("blockchain", 100, 119), ("blockchain", 120, 120), ("blockchain", 5000, 5001)])
+
+        # cached in memory
+        api_rpc.get_block_times(NODE, [105, 5000])
+        self.assertEqual(len(FakeRpcAPI.queries), 3)
+
+    def test_block_times_fallback(self):
+        FakeRpcAPI.blockchain_supported = False
+        self.assertEqual(api_rpc.get_block_times(NODE, [7, 8]), {7: _block_time(7), 8: _block_time(8)})
+        self.assertEqual(sorted(q for q in FakeRpcAPI.queries if q[0] == "block"), [("block", 7), ("block", 8)])
+
+    def test_block_times_persisted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("staketaxcsv.settings_csv.TX_STORE_PATH", os.path.join(tmpdir, "txs.sqlite")):
+                api_rpc.get_block_times(NODE, [10, 11])
+                api_rpc.RpcAPI.block_time_cache.clear()
+                FakeRpcAPI.queries = []
+
+                self.assertEqual(api_rpc.get_block_times(NODE, [10, 11]), {10: _block_time(10), 11: _block_time(11)})
+                self.assertEqual(FakeRpcAPI.queries, [])
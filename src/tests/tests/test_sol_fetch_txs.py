@@ -0,0 +1,101 @@
+import random
+import time
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.rate_limiter import TokenBucket
+from staketaxcsv.sol import api_rpc
+from staketaxcsv.sol.api_rpc import RpcAPI
+
+
+class FakeRpcAPI(RpcAPI):
+    batch_supported = True
+    batch_calls = []
+
+    @classmethod
+    def _fetch_tx(cls, txid):
+        time.sleep(random.random() * 0.01)
+        return {"result": {"txid": txid}}
+
+    @classmethod
+    def _fetch_batch(cls, method, params_lists):
+        cls.batch_calls.append(len(params_lists))
+        return [{"id": i, "result": {"txid": params[0]}} for i, params in enumerate(params_lists)]
+
+
+def _fake_post(batch_responses):
+    """ Returns fake post_with_retries(), responding to batch requests with batch_responses (then successes) """
+    batch_responses = list(batch_responses)
+    batch_requests = []
+
+    def post_with_retries(session, url, data, headers, retries, backoff_factor):
+        if isinstance(data, dict):
+            return {"id": data["id"], "result": {"txid": data["params"][0]}}
+        batch_requests.append(len(data))
+        if batch_responses:
+            return batch_responses.pop(0)
+        return [{"id": elem["id"], "result": {"txid": elem["params"][0]}} for elem in data]
+
+    return post_with_retries, batch_requests
+
+
+class TestSolFetchTxs(unittest.TestCase):
+
+    def _assert_ordered(self, api, txids, workers, batch_size):
+        result = list(api.fetch_txs_ordered(txids, workers=workers, batch_size=batch_size))
+        self.assertEqual([txid for txid, _ in result], txids)
+        self.assertEqual([data["result"]["txid"] for _, data in result], txids)
+
+    def test_ordered(self):
+        txids = [f"TX{i}" for i in range(53)]
+        for workers in [1, 4]:
+            for batch_size in [1, 10]:
+                self._assert_ordered(FakeRpcAPI, txids, workers, batch_size)
+        self.assertEqual(FakeRpcAPI.batch_calls, [10] * 5 + [3] + [10] * 5 + [3])
+
+    def _fetch_with_batch_responses(self, batch_responses):
+        class FakeRpcAPIBatch(RpcAPI):
+            batch_supported = True
+            batch_failures = 0
+            rate_limiter = TokenBucket(1000, capacity=10)
+
+        post_with_retries, batch_requests = _fake_post(batch_responses)
+        with patch.object(api_rpc, "post_with_retries", post_with_retries):
+            self._assert_ordered(FakeRpcAPIBatch, [f"TX{i}" for i in range(45)], 1, 10)
+        return FakeRpcAPIBatch, batch_requests
+
+    def test_batch_unsupported(self):
+        api, batch_requests = self._fetch_with_batch_responses([
+            {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid request"}, "id": None}])
+        self.assertEqual(batch_requests, [10])
+        self.assertFalse(api.batch_supported)
+
+    def test_batch_transient_error(self):
+        # i.e. still rate limited after retries: only that batch is fetched individually
+        api, batch_requests = self._fetch_with_batch_responses([
+            {"jsonrpc": "2.0", "error": {"code": 429, "message": "Too many requests"}, "id": None}])
+        self.assertEqual(batch_requests, [10, 10, 10, 10, 5])
+        self.assertTrue(api.batch_supported)
+
+    def test_batch_repeated_unexpected_responses(self):
+        api, batch_requests = self._fetch_with_batch_responses([{"unexpected": True}] * 3)
+        self.assertEqual(batch_requests, [10, 10, 10])
+        self.assertFalse(api.batch_supported)
+
+    def test_batch_larger_than_rate_limiter_capacity(self):
+        def post_with_retries(session, url, data, headers, retries, backoff_factor):
+            return [{"id": elem["id"], "result": {"txid": elem["params"][0]}} for elem in data]
+
+        class FakeRpcAPISmallBucket(RpcAPI):
+            batch_supported = True
+            rate_limiter = TokenBucket(1000, capacity=2)
+
+        txids = [f"TX{i}" for i in range(12)]
+        with patch.object(api_rpc, "post_with_retries", post_with_retries):
+            self._assert_ordered(FakeRpcAPISmallBucket, txids, 2, 5)
+
+    def test_acquire_more_than_capacity(self):
+        bucket = TokenBucket(100, capacity=1)
+        start = time.monotonic()
+        bucket.acquire(5)
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.tx_store import TxStores
+from staketaxcsv.sol import staking_rewards
+from staketaxcsv.sol.api_rpc import RpcAPI
+from staketaxcsv.sol.staking_rewards_common import EpochTimes
+
+ADDRESS_A = "StakeA1111111111111111111111111111111111111"
+ADDRESS_B = "StakeB1111111111111111111111111111111111111"
+
+# epoch -> {staking_address: lamports}
+REWARDS = {
+    600: {ADDRESS_A: 1000000000},
+    601: {ADDRESS_A: 2000000000, ADDRESS_B: 500000000},
+    602: {},
+}
+
+
+class FakeRpc:
+
+    def __init__(self):
+        self.reward_queries = []
+        self.block_time_queries = []
+
+    def _get_inflation_rewards(self, staking_addresses, epoch):
+        self.reward_queries.append((list(staking_addresses), epoch))
+        rewards = REWARDS[epoch]
+        return {"result": [
+            {"amount": rewards[addr], "epoch": epoch} if addr in rewards else None for addr in staking_addresses]}
+
+    def get_block_time(self, slot):
+        self.block_time_queries.append(slot)
+        return f"2024-01-01 00:00:{len(self.block_time_queries):02d}"
+
+
+class TestSolInflationRewards(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch("staketaxcsv.settings_csv.TX_STORE_PATH", os.path.join(self.tmpdir.name, "store.sqlite")),
+            patch.object(TxStores, "stores", {}),
+            patch.object(EpochTimes, "times", {}),
+            patch.object(staking_rewards, "get_epochs_all", return_value=[600, 601, 602]),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmpdir.cleanup()
+
+    def _rewards(self, fake, progress=None):
+        with patch.object(RpcAPI, "_get_inflation_rewards", fake._get_inflation_rewards), \
+             patch.object(RpcAPI, "get_block_time", fake.get_block_time):
+            return staking_rewards._rewards_many([ADDRESS_A, ADDRESS_B], progress=progress)
+
+    def test_batched_and_remembered(self):
+        fake = FakeRpc()
+        rewards = self._rewards(fake)
+
+        self.assertEqual(rewards, {
+            ADDRESS_A: [(600, "2024-01-01 00:00:01", 1.0), (601, "2024-01-01 00:00:02", 2.0)],
+            ADDRESS_B: [(601, "2024-01-01 00:00:02", 0.5)],
+        })
+        # One query per epoch for all staking addresses; block time only for epochs with rewards
+        self.assertEqual(fake.reward_queries, [([ADDRESS_A, ADDRESS_B], epoch) for epoch in [600, 601, 602]])
+        self.assertEqual(len(fake.block_time_queries), 2)
+
+        # Later report: rewards (including known-empty) and epoch times served from tx store
+        EpochTimes.times = {}
+        fake = FakeRpc()
+        self.assertEqual(self._rewards(fake), rewards)
+        self.assertEqual(fake.reward_queries, [])
+        self.assertEqual(fake.block_time_queries, [])
+
+    def test_progress_per_epoch(self):
+        reports = []
+        self._rewards(FakeRpc(), progress=lambda num_done, total: reports.append((num_done, total)))
+
+        self.assertEqual(reports, [(1, 3), (2, 3), (3, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
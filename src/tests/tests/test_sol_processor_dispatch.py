@@ -0,0 +1,73 @@
+import glob
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from staketaxcsv.sol import constants as co
+from staketaxcsv.sol.parser import parse_tx
+from staketaxcsv.sol.processor import RULE_INDEX
+from staketaxcsv.sol.TxInfoSol import WalletInfo
+from tests.mock_sol import MockRpcAPI
+from tests.settings_test import DATADIR
+
+# (wallet, txid, handler) for recorded tests/data/SOL/fetch_tx fixtures, as selected by the
+# original if/elif chain in process_tx
+GOLDEN = [
+    ("7WZcPib1yW3wig8sSLrhx2Qt97huiJMboQNrqSocGSyc", "2GMpqA7duENGaEXJUuP712J3tvX25uU45ZQ8vZdszXVUHyiAwo9byn3vVSVRgxks1PKX7H4wrBcE3FXqH1q6mRa1", "handle_jupiter_dca"),
+    ("mm5G1iYsa87dCR7zwBHmDC57k7mA6HHiRTE8FFNpkju", "2rY9ky2Ypps3KMxcgEoerPPKc1ZYEhxbV7x2bRZf8n31RuBDddvguvdmWMLyDJB8ayvbcUGH2LPpxDhT2rhubTEX", "handle_raydium_lp_v4"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "3HdFhHNyf2uKrW6zb6FeYZpjcRyvprQuQH4oVkmc4uuCAhoEUAEkPHgUzRubf8npmHnziRs4HokFTgAkGPyzso6D", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "3HxfYpPAC7dMAoWSDA8ZmZ1V2173ydk51stHrH45VGg9Ykgrr9p676aJwQE2eRJQJ36Bw3hZY5pbpDWhBimGaHNi", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "42zg3fooJY4TNf1DBJF4iaFXdE4ZmssX27JpMCSVPmUPA9et2neKND3H8NYViRx4yv2xDjcyZLnBewN3bC2mApXN", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "4NAC7cK6cRPFZJaJVehTJ2Pstj63oWjcDnnFoPARtsXb4qZiHhQeQmG9wbZg2yTkNPm37h13hP9vdZQdJReHiLBF", "handle_jupiter_limit"),
+    ("4abvSWugzSRhpAk4rpvdSruFAFoNG1D1JTStmzpGt7xA", "4aBP4353YQuQnSgX5PxH2upWr3HsS3163RV4NgCb1yTcoHz5pcvgnWxuaicwKkopXKrz9EKff7aAy3jWpbixt5Zn", "handle_jupiter_limit_v2"),
+    ("4abvSWugzSRhpAk4rpvdSruFAFoNG1D1JTStmzpGt7xA", "4iZxoW1D2uP3pwfG3vbpUqxYredB1K6kavLdRnUxq5djfDeLpKDcu2VE2CTuAuHTj5eaR7qVcbRs65tZgzgdKhAj", "handle_jupiter_limit_v2"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "4v28RP4AadGTfSRmYyZyag2erNokm6pyE7Fdct14bkEKSDFusPkxkp2DLSovxuGPnRA6qJdmFFQrJHCouq6RaNrw", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "4vug6xbfY6xpk81oA6p2gJzoA8eb9nowdB3mnNiF97QWiW5cPRXWh3cRutKrGCFbonML7JjLo5xJzuXAntRzN3MZ", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "4xqxLBqu1ju8eRKb2YiazZxDCdJbLQ8Eh4nEE1zE2WN7GLoyfCes4Cs4fHAcvpf6yNocNv77DfN6oEC7CyYrKAza", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "5FBWfqrMYoYbqq6yBWJUtqbVmCDAcz79M7NrzB1yxNLibzMWjndHsVRvwDMkUNgwr58KdLP7pCBjkwhnHrbTre5k", "handle_jupiter_limit"),
+    ("Bdky9P44ETXheH3KTTURodpeaV7QdPJyofS4brK1656o", "5dk9JQExmdT635xMYA1RvdMTt7thpFoUXAi1MgtMzpEnADiq7TMMjpTG3wN8RHJ3ZqfuvtjsbDV5SHAWqRwiu51F", "handle_raydium_lp_v4"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "5iPvQ1ThjpbMCYSqTwCYvMBfMrr4ysiEZeAF9goRgqtfAqePymck3sGFZQ4RnseWBVvfrH45WgZKndSB5XEvy7sk", "handle_jupiter_limit"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "DHFysLFq77hbVeDhUF7iJXvyDhBX2M26Ji6MoYTcdFLpq83BewvmevvXtKWYBg34Ze3S719ywzo1qWS2fzaot5M", "handle_jupiter_limit"),
+    ("4abvSWugzSRhpAk4rpvdSruFAFoNG1D1JTStmzpGt7xA", "L6rJy9mocHeddUuiu4ozgXZVjAAFYt5B9t2xHycuJxm3JjvwZSUjaW7JQLsZNLFw6MEHPA2pBKVzW4Sb3Q9jYfT", "handle_jupiter_limit_v2"),
+    ("GAgnD5XviS4wN7GpcTBbgvtFAZnT6Lc1ehkbnP3qo1bz", "QFgRtoQK5B4ZMjozD6GmqLkqjaFqhQ7ynJYxGjr9wzNqCTXhNS9NHETuEpsXVmSJokSfPYxAFHdLrivY8CNrYek", "handle_jupiter_limit"),
+    ("9QC3q9XT3Pq81DuM2Lt7yqkCY8uZZEtiNziJgrYp6SLj", "S3z6oPjogs9VcYYdCugJVNe25VavQQNxp71BaeY65aSox3rrSWQs3UgGVM3Bu1FcRRGN2pcydgwUqpHfWWC4mi7", "handle_jupiter_dca"),
+    ("4abvSWugzSRhpAk4rpvdSruFAFoNG1D1JTStmzpGt7xA", "k2eGRDNqy6mYEXTGp6XT3XvUjh8YEJrn2ozs2bzAXZXJYzpDc9EuVuo2fkQMaHRxyi2DTsKTBTnrYRU9cRh72Mo", "handle_jupiter_limit_v2"),
+]
+
+
+class TestSolProcessorDispatch(unittest.TestCase):
+
+    @patch("staketaxcsv.sol.parser.RpcAPI", new=MockRpcAPI)
+    def test_golden_fixtures(self):
+        fixtures = glob.glob(os.path.join(DATADIR, "SOL", "fetch_tx", "wrapper-*.json"))
+        self.assertEqual(
+            sorted(os.path.basename(path)[len("wrapper-"):-len(".json")] for path in fixtures),
+            sorted(txid for _, txid, _ in GOLDEN))
+
+        for wallet, txid, handler in GOLDEN:
+            txinfo = parse_tx(txid, MockRpcAPI._fetch_tx(txid), WalletInfo(wallet))
+            self.assertEqual(RULE_INDEX.select(txinfo).name, handler, txid)
+
+    def test_precedence(self):
+        evaluated = []
+        patches = [
+            patch.object(rule, "predicate", side_effect=lambda txinfo, name=rule.predicate.__name__: evaluated.append(name))
+            for rule in RULE_INDEX.rules if rule.predicate is not None
+        ]
+        for p in patches:
+            p.start()
+        self.addCleanup(lambda: [p.stop() for p in patches])
+
+        txinfo = SimpleNamespace(program_ids=[co.PROGRAMID_JUPITER_AGGREGATOR_V6, co.PROGRAMID_JUPITER_LIMIT])
+        self.assertEqual(RULE_INDEX.select(txinfo).name, "handle_jupiter_limit")
+        # Only predicate rules of higher priority than the program id match are evaluated
+        self.assertEqual(evaluated, ["is_notimestamp_tx", "is_marinade_native_staking_create_tx"])
+
+        evaluated.clear()
+        self.assertIsNone(RULE_INDEX.select(SimpleNamespace(program_ids=["unknown"])))
+        self.assertEqual(len(evaluated), len(patches))
+
+
+if __name__ == "__main__":
+    unittest.main()
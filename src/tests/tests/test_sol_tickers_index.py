@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.sol.tickers import tickers
+from staketaxcsv.sol.tickers.tickers import Tickers
+
+
+class TestSolTickersIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tickers.index")
+        self.patches = [
+            patch.object(tickers, "INDEX_PATH", self.path),
+            patch.object(Tickers, "loaded", False),
+            patch.object(Tickers, "tickers", {}),
+            patch.object(Tickers, "index", None),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmpdir.cleanup()
+
+    def test_index_matches_token_lists(self):
+        merged = tickers._merge_token_lists(tickers._token_list_files())
+        tickers.build_index(self.path)
+
+        self.assertEqual(Tickers.get("So11111111111111111111111111111111111111112"), "SOL")
+        self.assertIsNotNone(Tickers.index)
+        for address, symbol in merged.items():
+            self.assertEqual(Tickers.get(address), symbol or address)
+        for address in ["", "1", "zzzz", "So1111111111111111111111111111111111111111"]:
+            self.assertEqual(Tickers.get(address), address)
+
+    def test_stale_index_ignored(self):
+        with open(self.path, "wb") as f:
+            f.write(tickers.INDEX_HEADER_PREFIX + b"jupiter.20200101.json:1\n")
+            f.write(b"So11111111111111111111111111111111111111112\tSTALE\n")
+
+        self.assertEqual(Tickers.get("So11111111111111111111111111111111111111112"), "SOL")
+        self.assertIsNone(Tickers.index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.tx_store import TxStores
+from staketaxcsv.sol import txids
+from staketaxcsv.sol.config_sol import localconfig
+from tests.mock_sol import MockPagedRpcAPI, paged_signatures
+from tests.settings_test import start_patches, temp_dir
+
+WALLET = "WalletA111111111111111111111111111111111111"
+TOKEN_ACCOUNT = "TokenB1111111111111111111111111111111111111"
+
+
+class TestSolTxidsIncremental(unittest.TestCase):
+
+    def setUp(self):
+        start_patches(self, [
+            patch("staketaxcsv.settings_csv.TX_STORE_PATH", os.path.join(temp_dir(self), "store.sqlite")),
+            patch.object(TxStores, "stores", {}),
+            patch.object(txids, "LIMIT_PER_QUERY", 3),
+            patch.object(localconfig, "limit", 1000),
+        ])
+
+    def _get_txids(self, rpc):
+        with patch.object(txids.RpcAPI, "get_txids", rpc.get_txids):
+            return txids.get_txids_for_accounts([WALLET, TOKEN_ACCOUNT], None, workers=2)
+
+    def test_incremental(self):
+        signatures = {WALLET: paged_signatures(range(0, 10)), TOKEN_ACCOUNT: paged_signatures([2, 5, 8, 11])}
+        self.assertEqual(self._get_txids(MockPagedRpcAPI(signatures)), [f"TX{n}" for n in [11] + list(range(10))])
+
+        # New signatures since previous run: paging stops at first known signature
+        signatures = {WALLET: paged_signatures(range(0, 12)), TOKEN_ACCOUNT: paged_signatures([2, 5, 8, 11, 12, 13])}
+        rpc = MockPagedRpcAPI(signatures)
+        result = self._get_txids(rpc)
+        self.assertEqual(rpc.queries, [(WALLET, None), (TOKEN_ACCOUNT, None)])
+
+        # Same as full fetch (without tx store)
+        rpc = MockPagedRpcAPI(signatures)
+        with patch("staketaxcsv.settings_csv.TX_STORE_PATH", ""):
+            self.assertEqual(result, self._get_txids(rpc))
+        self.assertEqual(len(rpc.queries), 5 + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
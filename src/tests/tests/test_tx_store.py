@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from staketaxcsv.common.tx_store import TxStore, read_through
+
+
+class TestTxStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "txs.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_put_get(self):
+        store = TxStore(self.path, 10 * 1024 * 1024)
+        store.put_many("ATOM", [("A", {"txhash": "A", "n": 1}), ("B", {"txhash": "B", "n": 2})])
+
+        self.assertEqual(store.get("ATOM", "A"), {"txhash": "A", "n": 1})
+        self.assertEqual(store.get("OSMO", "A"), None)
+        self.assertEqual(sorted(store.get_many("ATOM", ["A", "B", "C"]).keys()), ["A", "B"])
+
+        # reopen from disk
+        store = TxStore(self.path, 10 * 1024 * 1024)
+        self.assertEqual(store.get("ATOM", "B"), {"txhash": "B", "n": 2})
+        self.assertGreater(store.total_bytes, 0)
+
+    def test_evict_least_recently_used(self):
+        store = TxStore(self.path, 10 * 1024 * 1024)
+        store.put_many("SOL", [(f"TX{i}", {"data": os.urandom(200).hex()}) for i in range(10)])
+        store.get("SOL", "TX0")
+
+        # shrink max size so that next put evicts
+        store.max_bytes = store.total_bytes
+        store.put("SOL", "TX10", {"data": os.urandom(200).hex()})
+
+        self.assertLessEqual(store.total_bytes, store.max_bytes)
+        self.assertIsNone(store.get("SOL", "TX1"))
+        self.assertIsNotNone(store.get("SOL", "TX0"))
+        self.assertIsNotNone(store.get("SOL", "TX10"))
+
+    def test_account_elems(self):
+        store = TxStore(self.path, 10 * 1024 * 1024)
+        self.assertIsNone(store.account_elems("ATOM", "addr1"))
+
+        store.put_many("ATOM", [("A", {"txhash": "A"}), ("B", {"txhash": "B"})])
+        store.add_account_txids("ATOM", "addr1", ["A", "B"])
+        self.assertEqual(len(store.account_elems("ATOM", "addr1")), 2)
+
+        # account txs incomplete (i.e. evicted) -> None
+        store.add_account_txids("ATOM", "addr1", ["C"])
+        self.assertIsNone(store.account_elems("ATOM", "addr1"))
+
+    def test_read_through(self):
+        calls = []
+
+        def fetch(txid):
+            calls.append(txid)
+            return {"result": None} if txid == "missing" else {"result": txid}
+
+        def valid(data):
+            return data["result"] is not None
+
+        with patch("staketaxcsv.settings_csv.TX_STORE_PATH", self.path):
+            self.assertEqual(read_through("SOL", "A", fetch, valid), {"result": "A"})
+            self.assertEqual(read_through("SOL", "A", fetch, valid), {"result": "A"})
+            read_through("SOL", "missing", fetch, valid)
+            read_through("SOL", "missing", fetch, valid)
+
+        self.assertEqual(calls, ["A", "missing", "missing"])